@@ -0,0 +1,283 @@
+# Python base imports - Default ones
+import re
+import uuid
+import logging
+from threading import Lock
+from time import monotonic
+from datetime import timedelta
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+# Dependent software imports
+from django.conf import settings
+
+# Custom created imports
+
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------
+# Typed, cached access to every GlobalAppConfig category
+# ------------------------------------------------------------
+# Purpose:
+#   GlobalAppConfig stores every value as a string. Instead of each
+#   caller re-parsing it (int(...) per login, regex compile per
+#   password check), each category registers a schema once and the
+#   parsed values are shared by the whole process.
+#
+# Example:
+#   AppConfigService.register("security", {
+#       "auth_retries" : ConfigField("int", "3", min_value = 1),
+#       "require_special" : ConfigField("bool", "true"),
+#   })
+#   AppConfigService.get("security", "auth_retries")   → 3 (int)
+#
+# Design Goals:
+#   - ONE query loads all categories (the version stamp row excluded)
+#   - Values parsed once per load: int / bool / regex / duration / str
+#   - Invalid DB values → warning + schema default, never a crash;
+#     GlobalAppConfig.clean() rejects them in forms up front
+#   - Lookups are two dict hits, no allocation, no I/O - apart from
+#     one indexed single-row version read every
+#     SECURITY_CONFIG_CHECK_INTERVAL seconds
+#   - GlobalAppConfig.save()/delete() bump the shared version stamp →
+#     every process reloads within that interval
+#   - Categories without a schema are still loaded, as raw strings
+# ------------------------------------------------------------
+
+_TRUE_VALUES = frozenset({"true", "1", "yes", "on"})
+_FALSE_VALUES = frozenset({"false", "0", "no", "off"})
+
+_DURATION_UNITS = {"s" : "seconds", "m" : "minutes", "h" : "hours", "d" : "days", "w" : "weeks"}
+_DURATION_PATTERN = re.compile(r"^\s*(\d+)\s*([smhdw]?)\s*$")
+
+
+class ConfigField:
+    """
+    Schema of one GlobalAppConfig entry.
+
+    kind      : "int" | "bool" | "regex" | "duration" | "str"
+    default   : raw string, parsed like a DB value (so defaults are validated too)
+    min_value / max_value : bounds for "int"
+    unit      : unit of a bare number for "duration" ("90" → 90 days with unit = "d"),
+                "15m" / "2h" / "30s" / "1w" always work
+    """
+
+    __slots__ = ("kind", "default", "min_value", "max_value", "unit")
+
+    KINDS = ("int", "bool", "regex", "duration", "str")
+
+    def __init__(self, kind : str, default : str, min_value : Optional[int] = None, max_value : Optional[int] = None,
+                 unit : str = "s"):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown config kind '{kind}', expected one of {self.KINDS}")
+        if unit not in _DURATION_UNITS:
+            raise ValueError(f"Unknown duration unit '{unit}', expected one of {tuple(_DURATION_UNITS)}")
+        self.kind, self.default = kind, default
+        self.min_value, self.max_value, self.unit = min_value, max_value, unit
+
+    def parse(self, raw : Any) -> Any:
+        """Raw DB string → typed value, ValueError when it does not match the schema"""
+        raw = str(raw).strip()
+        if self.kind == "int":
+            value = int(raw)
+            if self.min_value is not None and value < self.min_value:
+                raise ValueError(f"{value} is below the minimum {self.min_value}")
+            if self.max_value is not None and value > self.max_value:
+                raise ValueError(f"{value} is above the maximum {self.max_value}")
+            return value
+        if self.kind == "bool":
+            lowered = raw.lower()
+            if lowered in _TRUE_VALUES:
+                return True
+            if lowered in _FALSE_VALUES:
+                return False
+            raise ValueError(f"'{raw}' is not a boolean")
+        if self.kind == "regex":
+            try:
+                return re.compile(raw)
+            except re.error as e:
+                raise ValueError(f"'{raw}' is not a valid regular expression ({e})")
+        if self.kind == "duration":
+            match = _DURATION_PATTERN.match(raw)
+            if match is None:
+                raise ValueError(f"'{raw}' is not a duration (e.g. 90, 15m, 2h, 30d)")
+            return timedelta(**{_DURATION_UNITS[match.group(2) or self.unit] : int(match.group(1))})
+        return raw
+
+
+class AppConfigService:
+    """
+    ⚙️ PROCESS-WIDE CACHE OF ALL GlobalAppConfig CATEGORIES (see the module comment above)
+
+    LIFECYCLE:
+    1. Django starts → no DB access
+    2. First get() → one query, every value parsed against its category schema
+    3. Next calls → dict lookups; the shared version stamp (`_meta / config_version` row) is
+       compared at most every SECURITY_CONFIG_CHECK_INTERVAL seconds, reload only when it moved
+
+    ⚠️ QuerySet.update() / raw SQL skip save() → call reload() afterwards.
+    """
+
+    _schemas : Dict[str, Dict[str, ConfigField]] = {}
+
+    # 🗄️ category → name → typed value (+ read-only views of the same dicts)
+    _values : Optional[Dict[str, Dict[str, Any]]] = None
+    _views : Dict[str, Mapping[str, Any]] = {}
+
+    # 🏷️ Version stamp the cache was loaded at + when it was last compared
+    _version : Optional[str] = None
+    _checked_at = 0.0
+    _lock = Lock()
+
+    # GlobalAppConfig row holding the shared stamp (its own category → never read as a setting)
+    VERSION_CATEGORY = "_meta"
+    VERSION_NAME = "config_version"
+
+    # ==================================== SCHEMA ====================================
+
+    @classmethod
+    def register(cls, category : str, schema : Dict[str, ConfigField]) -> None:
+        """📋 Declare the typed entries of a category (at import time of the owning module)"""
+        for name, field in schema.items():
+            # A broken default is a programming error → fail loudly at import
+            field.parse(field.default)
+        with cls._lock:
+            cls._schemas[category] = dict(schema)
+            cls._values = None
+
+    @classmethod
+    def get_field(cls, category : str, name : str) -> Optional[ConfigField]:
+        return cls._schemas.get(category, {}).get(name)
+
+    @classmethod
+    def validate(cls, category : str, name : str, raw : Any) -> Any:
+        """
+        ✅ Typed value for a would-be DB row, ValueError when it breaks the schema
+        (unknown name in a registered category included). Used by GlobalAppConfig.clean().
+        """
+        schema = cls._schemas.get(category)
+        if schema is None:
+            return raw
+        field = schema.get(name)
+        if field is None:
+            raise ValueError(f"Unknown {category} config '{name}'. Available: {list(schema)}")
+        return field.parse(raw)
+
+    # ==================================== LOOKUPS ====================================
+
+    @staticmethod
+    def get_check_interval() -> float:
+        """⏱️ TTL floor between two version stamp reads (seconds)"""
+        return getattr(settings, "SECURITY_CONFIG_CHECK_INTERVAL", 5)
+
+    @classmethod
+    def get(cls, category : str, name : str) -> Any:
+        """Typed value - KeyError for an unknown category / name"""
+        values = cls._values
+        if values is None or monotonic() - cls._checked_at >= cls.get_check_interval():
+            values = cls._refresh()
+        return values[category][name]
+
+    @classmethod
+    def category(cls, category : str) -> Mapping[str, Any]:
+        """
+        Read-only {name : typed value} of one category (empty when unknown).
+        The mapping is a snapshot - fetch it again instead of keeping it across requests.
+        """
+        if cls._values is None or monotonic() - cls._checked_at >= cls.get_check_interval():
+            cls._refresh()
+        return cls._views.get(category, MappingProxyType({}))
+
+    # ==================================== LOADING ====================================
+
+    @classmethod
+    def _refresh(cls) -> Dict[str, Dict[str, Any]]:
+        with cls._lock:
+            # Another thread may have refreshed while this one waited
+            if cls._values is not None and monotonic() - cls._checked_at < cls.get_check_interval():
+                return cls._values
+
+            version = cls._read_version()
+            if cls._values is None or version != cls._version:
+                values = cls._fetch()
+                cls._views = {category : MappingProxyType(entries) for category, entries in values.items()}
+                cls._values, cls._version = values, version
+            cls._checked_at = monotonic()
+            return cls._values # type: ignore
+
+    @classmethod
+    def _read_version(cls) -> Optional[str]:
+        """🏷️ Current shared stamp (None when never bumped / table missing)"""
+        try:
+            from _utils.models import GlobalAppConfig
+            return (GlobalAppConfig.objects.filter(category = cls.VERSION_CATEGORY, name = cls.VERSION_NAME)
+                    .values_list("value", flat = True).first())
+        except Exception:
+            return None
+
+    @classmethod
+    def _fetch(cls) -> Dict[str, Dict[str, Any]]:
+        """
+        🚀 Schema defaults, overridden by every valid DB row - one query for all categories.
+        No table yet / DB unavailable → defaults only.
+        """
+        values = {category : {name : field.parse(field.default) for name, field in schema.items()}
+                  for category, schema in cls._schemas.items()}
+        try:
+            from _utils.models import GlobalAppConfig
+
+            rows = list(GlobalAppConfig.objects.exclude(category = cls.VERSION_CATEGORY).values_list("category", "name", "value"))
+        except Exception as e:
+            # 🛡️ SAFETY NET: Table missing? Migrations pending? No problem!
+            logger.warning(f"⚠️ Database unavailable ({e}). Using built-in config defaults.")
+            return values
+
+        for category, name, raw in rows:
+            try:
+                value = cls.validate(category, name, raw)
+            except ValueError as e:
+                logger.warning(f"⚠️ Ignoring GlobalAppConfig {category}.{name} = {raw!r}: {e}")
+                continue
+            values.setdefault(category, {})[name] = value
+
+        logger.info(f"Loaded {len(rows)} GlobalAppConfig rows over {len(values)} categories")
+        return values
+
+    # ==================================== INVALIDATION ====================================
+
+    @classmethod
+    def bump_version(cls) -> None:
+        """
+        📣 Tell EVERY process to reload (called by GlobalAppConfig.save()/delete())
+
+        This process drops its cache at once, the others within the check interval.
+        """
+        from _utils.models import GlobalAppConfig
+
+        GlobalAppConfig.objects.update_or_create(category = cls.VERSION_CATEGORY, name = cls.VERSION_NAME,
+                                                 defaults = {"value" : uuid.uuid4().hex})
+        with cls._lock:
+            cls._values = None
+
+    @classmethod
+    def reload(cls) -> None:
+        """🔄 Force a reload in all processes - after bulk updates that skip save()"""
+        logger.info("🔄 GlobalAppConfig cache cleared - every process reloads on its next check")
+        cls.bump_version()
+
+    @classmethod
+    def is_version_stamp(cls, category : str, name : str) -> bool:
+        """The stamp row is identified by category AND name - a config entry may be called "config_version" too"""
+        return category == cls.VERSION_CATEGORY and name == cls.VERSION_NAME
+
+    @classmethod
+    def reset(cls) -> None:
+        """🧹 Drop this process's cache only (tests, fresh worker processes) - no version bump"""
+        with cls._lock:
+            cls._values = None
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        return cls._values is not None
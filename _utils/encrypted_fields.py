@@ -0,0 +1,174 @@
+# Python base imports - Default ones
+from functools import lru_cache
+from contextvars import ContextVar
+
+# Dependent software imports
+from django.db import models
+from django.conf import settings
+from cryptography.fernet import Fernet, InvalidToken
+from django.db.models.query import ModelIterable
+from django.db.models.query_utils import DeferredAttribute
+from encrypted_model_fields import fields as encrypted_fields
+
+# Custom created imports
+
+
+
+# ------------------------------------------------------------
+# Lazy decryption for encrypted model fields
+# ------------------------------------------------------------
+# Purpose:
+#   encrypted_model_fields decrypts every encrypted column of every
+#   row in from_db_value, whether the value is ever read or not:
+#   a 1,000-row admin page of AppUser pays ~4,000 Fernet decrypts
+#   (HMAC check + AES-CBC each) even for columns the page hides.
+#
+# Example:
+#   class Snippet(AuditModel):
+#       email = EncryptedEmailField(default = "...")   # from this module
+#       objects = LazyDecryptManager()
+#
+#   snippet = Snippet.objects.first()     → nothing decrypted yet
+#   snippet.email                          → decrypted now, kept on the instance
+#
+# Design Goals:
+#   - Model instances loaded through LazyDecryptQuerySet keep the raw
+#     ciphertext until the attribute is first read (DecryptOnAccess)
+#   - values() / values_list() and other managers decrypt eagerly,
+#     exactly like before - callers never see ciphertext
+#   - Encryption and decryption stay with the library's crypter: a
+#     FIELD_ENCRYPTION_KEY list [primary, older, ...] is its MultiFernet
+#     (writes use the primary, reads try every key); rows still on an
+#     older key are rewritten by `manage.py reencrypt_fields`
+#   - Same column type / stored format as the library fields
+#
+# Note: there is no cache of decrypted values. Fernet encrypts with a
+# random IV, so two rows holding the same plaintext (Snippet.email
+# defaults) never share a ciphertext - a memo keyed on it would not hit.
+# ------------------------------------------------------------
+
+# True while LazyDecryptModelIterable builds model instances
+_lazy_loading : ContextVar[bool] = ContextVar("encrypted_fields_lazy_loading", default = False)
+
+
+@lru_cache(maxsize = 4)
+def _get_fernet(key : str) -> Fernet:
+    return Fernet(key)
+
+
+def is_current(ciphertext : str) -> bool:
+    """Was this stored value encrypted with the primary (first) FIELD_ENCRYPTION_KEY?"""
+    keys = settings.FIELD_ENCRYPTION_KEY
+    primary = keys[0] if isinstance(keys, (list, tuple)) else keys
+    try:
+        _get_fernet(primary).decrypt(ciphertext.encode("utf-8"))
+    except InvalidToken:
+        return False
+    return True
+
+
+def decrypt_value(ciphertext : str) -> str:
+    """Decrypt one stored value with the library's crypter - any configured key (InvalidToken propagates)"""
+    return encrypted_fields.decrypt_str(ciphertext)
+
+
+class Ciphertext:
+    """Stored value of an encrypted field that has not been read yet"""
+
+    __slots__ = ("value", "field")
+
+    def __init__(self, value : str, field):
+        self.value, self.field = value, field
+
+    def decrypt(self):
+        return self.field.to_python(self.value)
+
+    def __repr__(self):
+        return f"<Ciphertext {self.field.attname}>"
+
+
+class DecryptOnAccess(DeferredAttribute):
+    """
+    Field descriptor: deferred loading as usual, plus decryption of a Ciphertext on first read.
+    A data descriptor (defines __set__), so reads always come through here.
+    """
+
+    def __get__(self, instance, cls = None):
+        if instance is None:
+            return self
+        value = super().__get__(instance, cls)
+        if isinstance(value, Ciphertext):
+            value = instance.__dict__[self.field.attname] = value.decrypt()
+        return value
+
+    def __set__(self, instance, value):
+        instance.__dict__[self.field.attname] = value
+
+
+class LazyDecryptMixin:
+    """Replaces EncryptedMixin's read path - the write path (encryption) is the library's"""
+
+    descriptor_class = DecryptOnAccess
+
+    def to_python(self, value):
+        if isinstance(value, Ciphertext):
+            value = value.value
+        if isinstance(value, bytes):
+            value = value.decode("utf-8")
+        if isinstance(value, str):
+            try:
+                value = decrypt_value(value)
+            except InvalidToken:
+                # Not encrypted (form input, legacy plaintext) → used as is
+                pass
+        # Skip EncryptedMixin.to_python → plain CharField / EmailField conversion
+        return super(encrypted_fields.EncryptedMixin, self).to_python(value)
+
+    def get_db_prep_save(self, value, connection):
+        # Django also passes resolved expressions here (bulk_update's Case) - they prepare their own
+        # values through this field; EncryptedMixin would encrypt the expression's repr
+        if hasattr(value, "as_sql"):
+            return value
+        return super().get_db_prep_save(value, connection)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return value
+        if _lazy_loading.get():
+            return Ciphertext(value, self)
+        return self.to_python(value)
+
+
+class EncryptedCharField(LazyDecryptMixin, encrypted_fields.EncryptedCharField):
+    pass
+
+
+class EncryptedEmailField(LazyDecryptMixin, encrypted_fields.EncryptedEmailField):
+    pass
+
+
+class LazyDecryptModelIterable(ModelIterable):
+    """ModelIterable that leaves encrypted values as Ciphertext on the instances it builds"""
+
+    def __iter__(self):
+        iterator = super().__iter__()
+        while True:
+            # Rows are fetched + converted inside next() → flag only set around it
+            token = _lazy_loading.set(True)
+            try:
+                instance = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                _lazy_loading.reset(token)
+            yield instance
+
+
+class LazyDecryptQuerySet(models.QuerySet):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._iterable_class = LazyDecryptModelIterable
+
+
+class LazyDecryptManager(models.Manager.from_queryset(LazyDecryptQuerySet)):
+    pass
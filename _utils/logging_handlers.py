@@ -1,12 +1,124 @@
 # Python base imports - Default ones
+import os
+import copy
+import queue
+import atexit
 import logging
-from os import path
-from logging.handlers import RotatingFileHandler
+from os import getpid, path
+from threading import Lock
+from contextlib import contextmanager
+from collections import Counter
+from logging.handlers import QueueListener, RotatingFileHandler
 
 # Dependent software imports
 
 # Custom created imports
 
+try:
+    import fcntl
+except ImportError: # Windows
+    fcntl = None
+    import msvcrt
+
+
+# ------------------------------------------------------------
+# Multi-process safe Rotating File Handler
+# ------------------------------------------------------------
+# Purpose:
+#   Several server processes (gunicorn / uvicorn workers) append to
+#   the same logs/*.jsonl. RotatingFileHandler decides to rotate per
+#   process from its own view of the file: two workers rename the
+#   same file, one keeps writing into a rotated backup, lines get
+#   lost or cut in half.
+#
+# Strategy (single file, exclusive lock):
+#   - Every write + rollover runs under an OS file lock on
+#     <file>.lock - one process at a time, across the whole host
+#   - Under the lock: file rotated by another process (inode changed
+#     / file gone) → reopen; real size (fstat) + new line over
+#     maxBytes → rotate
+#   - One whole line per locked write + flush → no interleaving
+#   - Lock file reopened after fork (flock is per open file, a
+#     shared descriptor would let parent and child both "hold" it)
+#
+#   POSIX: fcntl.flock. Windows: msvcrt byte lock (note that Windows
+#   refuses to rename files other processes keep open).
+# ------------------------------------------------------------
+class ProcessSafeRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that can be shared by several processes writing the same file"""
+
+    def __init__(self, filename, mode = "a", maxBytes = 0, backupCount = 0, encoding = None, delay = False, errors = None):
+        super().__init__(filename, mode = mode, maxBytes = maxBytes, backupCount = backupCount, encoding = encoding, delay = delay,
+                         errors = errors)
+        self.lock_filename = f"{self.baseFilename}.lock"
+        self._lock_file = None
+        self._lock_pid = None
+
+    @contextmanager
+    def _interprocess_lock(self):
+        if self._lock_pid != getpid():
+            # Fresh descriptor per process - never close the parent's one from here
+            self._lock_file = open(self.lock_filename, "a+b")
+            self._lock_pid = getpid()
+
+        handle = self._lock_file
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        else:
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            else:
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+
+    def _reopen_if_rotated(self):
+        """Caller holds the lock: follow a rotation done by another process"""
+        if self.stream is None:
+            self.stream = self._open()
+            return
+        try:
+            current = os.stat(self.baseFilename)
+        except FileNotFoundError:
+            current = None
+        opened = os.fstat(self.stream.fileno())
+        if current is None or (current.st_dev, current.st_ino) != (opened.st_dev, opened.st_ino):
+            self.stream.close()
+            self.stream = self._open()
+
+    def shouldRollover(self, record):
+        # Decided in emit(), under the lock, from the real file size
+        return False
+
+    def emit(self, record):
+        try:
+            # Formatting needs no lock
+            message = self.format(record) + self.terminator
+            with self._interprocess_lock():
+                self._reopen_if_rotated()
+                if self.maxBytes > 0:
+                    size = os.fstat(self.stream.fileno()).st_size
+                    if size > 0 and size + len(message.encode(self.encoding or "utf-8")) > self.maxBytes:
+                        self.doRollover()
+                self.stream.write(message)
+                self.stream.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        try:
+            if self._lock_file is not None and self._lock_pid == getpid():
+                self._lock_file.close()
+            self._lock_file, self._lock_pid = None, None
+        finally:
+            super().close()
+
 
 
 # ------------------------------------------------------------
@@ -33,6 +145,7 @@ class AppFileRoutingHandler(logging.Handler):
     - Extract top-level namespace from logger name
       (app1.views → app1)
     - Create rotating file handler if not already created
+      (ProcessSafeRotatingFileHandler, creation guarded by a lock)
     - Reuse handler for future logs
     """
 
@@ -52,6 +165,9 @@ class AppFileRoutingHandler(logging.Handler):
         # - File descriptor leaks
         self.handlers = {}
 
+        # Guards handler creation - two threads seeing a new app at once must not open two files
+        self._handlers_lock = Lock()
+
     def emit(self, record):
         """
         Called automatically for each log record.
@@ -74,17 +190,209 @@ class AppFileRoutingHandler(logging.Handler):
         file_path = path.join(self.base_log_dir, f"{logger_name}.jsonl")
 
         # If handler not already created for this app
-        if logger_name not in self.handlers:
-            handler = RotatingFileHandler(file_path, 
-                                          maxBytes = self.max_bytes, 
-                                          backupCount = self.backup_count, 
-                                          encoding = "utf-8")
+        handler = self.handlers.get(logger_name)
+        if handler is None:
+            with self._handlers_lock:
+                # Re-check: another thread may have created it while this one waited
+                handler = self.handlers.get(logger_name)
+                if handler is None:
+                    handler = ProcessSafeRotatingFileHandler(file_path, 
+                                                             maxBytes = self.max_bytes, 
+                                                             backupCount = self.backup_count, 
+                                                             encoding = "utf-8")
 
-            # Reuse same formatter defined in settings
-            handler.setFormatter(self.formatter)
+                    # Reuse same formatter defined in settings
+                    handler.setFormatter(self.formatter)
 
-            # Cache handler for reuse
-            self.handlers[logger_name] = handler
+                    # Cache handler for reuse
+                    self.handlers[logger_name] = handler
         
-        # Emit record to the correct app file
-        self.handlers[logger_name].emit(record)
+        # Emit record to the correct app file (handle() → the file handler's own lock)
+        handler.handle(record)
+
+    def close(self):
+        with self._handlers_lock:
+            for handler in self.handlers.values():
+                handler.close()
+            self.handlers.clear()
+        super().close()
+
+
+
+# ------------------------------------------------------------
+# Queue-based Logging Handler
+# ------------------------------------------------------------
+# Purpose:
+#   Take disk / console latency off the request thread. The request
+#   thread only enqueues the record; one listener thread per process
+#   hands it to the real handlers (central_file, app_router, console).
+#
+# Example (settings.LOGGING):
+#   "queue": {
+#       "()": BoundedQueueHandler,
+#       "targets": ["central_file", "app_router", "console"],
+#       "queue_size": 10000,
+#       "policy": "drop",
+#   }
+#   root logger → handlers: ["queue"]
+#
+# Design Goals:
+#   - Bounded memory: queue holds at most queue_size records
+#   - Full queue → policy "drop" (never wait) or "block" (wait up to
+#     block_timeout, then drop)
+#   - Dropped records are counted (total + per level) and reported
+#     by the listener as one WARNING once the queue has room again
+#   - Targets resolved by name on first use → no ordering issues
+#     in dictConfig
+#   - Listener started per process (safe with preforking servers),
+#     drained on close() / interpreter exit
+# ------------------------------------------------------------
+class _DrainingQueueListener(QueueListener):
+    """QueueListener that reports drops and never loses its stop sentinel to a full queue"""
+
+    def __init__(self, owner, *handlers):
+        super().__init__(owner.queue, *handlers, respect_handler_level = True)
+        self.owner = owner
+
+    def handle(self, record):
+        super().handle(record)
+        self.owner.report_drops(self)
+
+    def enqueue_sentinel(self):
+        self.queue.put(self._sentinel)
+
+
+# Renders tracebacks of queued records when the handler has no formatter of its own
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+
+class BoundedQueueHandler(logging.Handler):
+    """
+    Enqueues records for a background listener thread that writes them to `targets`.
+
+    Parameters:
+    - targets       : names of handlers configured in the same LOGGING dict. dictConfig builds
+                      handlers in name order, so they must sort before this handler's name
+                      (a missing target fails the logging configuration)
+    - queue_size    : max records waiting (memory bound)
+    - policy        : "drop" → full queue drops the record at once
+                      "block" → waits up to block_timeout seconds, then drops it
+    - block_timeout : seconds (None = wait for room, never drop)
+    """
+
+    POLICIES = ("drop", "block")
+
+    def __init__(self, targets, queue_size = 10000, policy = "drop", block_timeout = 0.05):
+        super().__init__()
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown queue logging policy '{policy}', expected one of {self.POLICIES}")
+
+        self.targets = list(targets)
+        # Strong references: logging only keeps weak ones, and targets no logger uses directly
+        # would be garbage-collected once dictConfig returns
+        self.target_handlers = self._resolve_targets()
+        self.queue_size = queue_size
+        self.policy = policy
+        self.block_timeout = block_timeout
+
+        self.queue = queue.Queue(maxsize = queue_size)
+        self.listener = None
+        self._pid = None
+        self._start_lock = Lock()
+
+        # Drop counters (read with stats())
+        self.dropped = 0
+        self.dropped_by_level = Counter()
+        self._reported = 0
+
+    # -------------------- request thread side --------------------
+
+    def emit(self, record):
+        # A listener that cannot start (e.g. missing target) is a logging error, not the caller's
+        try:
+            if self._pid != getpid():
+                self._start()
+            record = self.prepare(record)
+        except Exception:
+            self.handleError(record)
+            return
+
+        try:
+            if self.policy == "block":
+                self.queue.put(record, timeout = self.block_timeout)
+            else:
+                self.queue.put_nowait(record)
+        except queue.Full:
+            # Counter updates are not locked: an off-by-a-few count under contention is
+            # acceptable, a lock on every dropped record is not
+            self.dropped += 1
+            self.dropped_by_level[record.levelname] += 1
+
+    def prepare(self, record):
+        """
+        Copy of `record` that is safe to hand to the listener thread (like QueueHandler.prepare):
+        message resolved now (args may be mutated after the call returns), traceback rendered
+        into exc_text (no frames kept alive in the queue). The caller's record - which the
+        logger's other handlers also receive - is left untouched.
+        """
+        message = record.getMessage()
+        exc_text = record.exc_text
+        if record.exc_info and not exc_text:
+            exc_text = (self.formatter or _EXCEPTION_FORMATTER).formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.msg, record.args = message, None
+        record.exc_info, record.exc_text = None, exc_text
+        return record
+
+    def stats(self) -> dict:
+        return {"queued" : self.queue.qsize(), "capacity" : self.queue_size, "policy" : self.policy,
+                "dropped" : self.dropped, "dropped_by_level" : dict(self.dropped_by_level)}
+
+    # -------------------- listener side --------------------
+
+    def _start(self):
+        with self._start_lock:
+            if self._pid == getpid():
+                return
+            # Forked child: the parent's listener thread does not exist here → fresh queue + listener
+            if self._pid is not None:
+                self.queue = queue.Queue(maxsize = self.queue_size)
+                self.dropped, self._reported = 0, 0
+                self.dropped_by_level = Counter()
+
+            self.listener = _DrainingQueueListener(self, *self.target_handlers)
+            self.listener.start()
+            self._pid = getpid()
+            atexit.register(self._stop)
+
+    def _resolve_targets(self):
+        get_handler = getattr(logging, "getHandlerByName", None) or logging._handlers.get # Python < 3.12
+        handlers = []
+        for name in self.targets:
+            handler = get_handler(name)
+            if handler is None:
+                raise ValueError(f"Queue logging target handler '{name}' is not configured")
+            handlers.append(handler)
+        return handlers
+
+    def report_drops(self, listener):
+        """Runs on the listener thread: one WARNING per batch of newly dropped records"""
+        dropped = self.dropped
+        if dropped > self._reported and self.queue.qsize() < self.queue_size // 2:
+            record = logging.LogRecord("_utils.logging_handlers", logging.WARNING, __file__, 0,
+                                       "%d log record(s) dropped - logging queue full (%s)",
+                                       (dropped - self._reported, dict(self.dropped_by_level)), None)
+            self._reported = dropped
+            QueueListener.handle(listener, record)
+
+    def _stop(self):
+        listener, self.listener = self.listener, None
+        if listener is not None and self._pid == getpid():
+            listener.stop()
+        self._pid = None
+
+    def close(self):
+        # Drain everything still queued before the targets get closed
+        self._stop()
+        super().close()
@@ -2,9 +2,11 @@
 
 # Dependent software imports
 from django.db import models
+from django.core.exceptions import ValidationError
 
 # Custom created imports
 from app2.models import AuditModel
+from _utils.app_config import AppConfigService
 
 class GlobalAppConfig(AuditModel):
     category = models.CharField(max_length = 32, null = False)
@@ -15,6 +17,33 @@ class GlobalAppConfig(AuditModel):
 
     def __str__(self):
         return f"{self.__class__.__name__} - {str(self.name)}"
+
+    def clean(self):
+        """Reject values that do not match the category schema (AppConfigService.register)"""
+        super().clean()
+        if AppConfigService.is_version_stamp(self.category, self.name):
+            return
+        # "name" is unique across categories → the stamp's name is reserved everywhere else
+        if self.name == AppConfigService.VERSION_NAME:
+            raise ValidationError({"name" : f"'{self.name}' is reserved for the config version stamp"})
+        try:
+            AppConfigService.validate(self.category, self.name, self.value)
+        except ValueError as e:
+            raise ValidationError({"value" : str(e)})
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self._bump_config_version()
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        self._bump_config_version()
+        return result
+
+    def _bump_config_version(self):
+        """Every worker's AppConfigService reloads on its next version check (not for the stamp row itself)"""
+        if not AppConfigService.is_version_stamp(self.category, self.name):
+            AppConfigService.bump_version()
     
     class Meta(AuditModel.Meta):
         db_table = "global_app_config"
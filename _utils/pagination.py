@@ -0,0 +1,347 @@
+# Python base imports - Default ones
+import json
+import logging
+from datetime import date, time
+from base64 import b64decode, b64encode
+from typing import List, Optional, Sequence, Tuple
+
+# Dependent software imports
+from django.db.models import Q
+from django.conf import settings
+from django.db import connections
+from django.utils.functional import cached_property
+from django.core.paginator import EmptyPage, Page, PageNotAnInteger, Paginator
+from rest_framework.response import Response
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+# Custom created imports
+
+
+logger = logging.getLogger(__name__)
+
+
+# ------------------------------------------------------------
+# Approximate counts for page-number pagination
+# ------------------------------------------------------------
+# Purpose:
+#   Every page-number response carries "count", which is an exact
+#   SELECT COUNT(*) - a full scan on large PostgreSQL tables.
+#
+# Mechanism (PostgreSQL only, other databases always count exactly):
+#   - Unfiltered queryset → pg_class.reltuples (kept by ANALYZE/autovacuum)
+#   - Filtered queryset   → row estimate of EXPLAIN for the same query
+#   - Estimate below settings.APPROXIMATE_COUNT_THRESHOLD → exact COUNT(*)
+#     (small results are cheap to count and worth being precise about)
+#
+# Responses gain "count_is_approximate" so clients know when "count"
+# is only an estimate. "next" is driven by fetching one extra row, so
+# an estimate that is too low never hides real pages.
+# ------------------------------------------------------------
+
+class ApproximateCountPaginator(Paginator):
+    """Django Paginator whose count may come from the PostgreSQL planner"""
+
+    count_is_approximate = False
+
+    @staticmethod
+    def get_threshold() -> int:
+        return getattr(settings, "APPROXIMATE_COUNT_THRESHOLD", 10000)
+
+    @cached_property
+    def count(self) -> int:
+        estimate = self._estimate()
+        if estimate is not None and estimate >= self.get_threshold():
+            self.count_is_approximate = True
+            return estimate
+        return super().count
+
+    def _estimate(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor != "postgresql":
+            return None
+
+        try:
+            with connection.cursor() as cursor:
+                if not queryset.query.where:
+                    cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass", 
+                                   [queryset.model._meta.db_table])
+                    row = cursor.fetchone()
+
+                    # -1 = table never analyzed yet
+                    return row[0] if row and row[0] >= 0 else None
+
+                sql, params = queryset.query.sql_with_params()
+                cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+                plan = cursor.fetchone()[0]
+                if isinstance(plan, str):
+                    plan = json.loads(plan)
+                return int(plan[0]["Plan"]["Plan Rows"])
+        except Exception as e:
+            logger.warning(f"Row estimate unavailable for {queryset.model.__name__} ({e}), counting exactly")
+            return None
+
+    def validate_number(self, number):
+        if not self.count_is_approximate:
+            return super().validate_number(number)
+
+        # The estimate may be too low - let clients ask for pages past it
+        try:
+            number = int(number)
+        except (TypeError, ValueError):
+            raise PageNotAnInteger("That page number is not an integer")
+        if number < 1:
+            raise EmptyPage("That page number is less than 1")
+        return number
+
+    def page(self, number):
+        # Evaluating count first decides which mode applies
+        self.count
+        if not self.count_is_approximate:
+            return super().page(number)
+
+        number = self.validate_number(number)
+        bottom = (number - 1) * self.per_page
+        rows = list(self.object_list[bottom : bottom + self.per_page + 1])
+        if not rows and number > 1:
+            raise EmptyPage("That page contains no results")
+
+        page = self._get_page(rows[ : self.per_page], number, self)
+        page.has_more = len(rows) > self.per_page
+        return page
+
+    def _get_page(self, *args, **kwargs):
+        return ApproximatePage(*args, **kwargs)
+
+
+class ApproximatePage(Page):
+    has_more = None
+
+    def has_next(self):
+        # Exact-count pages keep Django's arithmetic, approximate ones use the extra row
+        if self.has_more is None:
+            return super().has_next()
+        return self.has_more
+
+
+class ApproximateCountPagination(PageNumberPagination):
+    """PageNumberPagination with planner-estimated counts for large results (see above)"""
+
+    django_paginator_class = ApproximateCountPaginator
+
+    def get_paginated_response(self, data):
+        return Response({
+            "count" : self.page.paginator.count,
+            "count_is_approximate" : self.page.paginator.count_is_approximate,
+            "next" : self.get_next_link(),
+            "previous" : self.get_previous_link(),
+            "results" : data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        paginated_schema = super().get_paginated_response_schema(schema)
+        paginated_schema["properties"]["count_is_approximate"] = {
+            "type" : "boolean",
+            "example" : False,
+            "description" : "True when count is a PostgreSQL planner estimate rather than an exact COUNT(*)",
+        }
+        return paginated_schema
+
+
+# ------------------------------------------------------------
+# Keyset (cursor) pagination with page-number fallback
+# ------------------------------------------------------------
+# Purpose:
+#   PageNumberPagination runs SELECT COUNT(*) plus OFFSET n on every
+#   page, so page 10,000 makes the database walk 100,000 rows first.
+#   Keyset pagination remembers the last row's sort key instead:
+#       WHERE (created_date, id) < (<last created_date>, <last id>)
+#   which an index on (created_date DESC, id DESC) answers directly,
+#   at the same cost for every page.
+#
+# Opt-in per viewset:
+#   pagination_class = KeysetPagination
+#
+# Per request:
+#   ?page=3                → classic page-number response (unchanged)
+#   ?pagination=keyset     → first keyset page
+#   ?cursor=<opaque>       → following pages (use the next/previous links)
+#   ?page_size=50          → both modes, capped by settings.API_MAX_PAGE_SIZE
+#
+# Ordering comes from the viewset queryset (or model Meta.ordering) and
+# always ends with the primary key so rows sharing a sort value are
+# never skipped or repeated between pages.
+# ------------------------------------------------------------
+
+class KeysetPagination(PageNumberPagination):
+    page_size_query_param = "page_size"
+
+    cursor_query_param = "cursor"
+    mode_query_param = "pagination"
+    keyset_mode = "keyset"
+
+    invalid_cursor_message = "Invalid cursor"
+
+    @property
+    def max_page_size(self) -> int:
+        # Read per request, not at import, so settings overrides apply
+        return getattr(settings, "API_MAX_PAGE_SIZE", 100)
+
+    def paginate_queryset(self, queryset, request, view = None):
+        self.use_keyset = (self.cursor_query_param in request.query_params
+                           or request.query_params.get(self.mode_query_param) == self.keyset_mode)
+        if not self.use_keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        page_size = self.get_page_size(request) or 10
+        ordering = self.get_keyset_ordering(queryset)
+        values, reverse = self.decode_cursor(request, queryset.model, ordering)
+
+        # Walking backwards = flipped comparisons + flipped ORDER BY, then restore the order
+        query_ordering = [self._flip(field) for field in ordering] if reverse else ordering
+        queryset = queryset.order_by(*query_ordering)
+        if values is not None:
+            queryset = queryset.filter(self.build_keyset_filter(query_ordering, values))
+
+        # One extra row tells whether another page exists, no COUNT(*) needed
+        rows = list(queryset[ : page_size + 1])
+        has_more = len(rows) > page_size
+        rows = rows[ : page_size]
+        if reverse:
+            rows.reverse()
+
+        self.ordering = ordering
+        self.has_next = has_more if not reverse else True
+        self.has_previous = (values is not None) if not reverse else has_more
+        self.rows = rows
+        return rows
+
+    def get_paginated_response(self, data):
+        if not self.use_keyset:
+            return super().get_paginated_response(data)
+
+        return Response({
+            "next" : self.get_next_link(),
+            "previous" : self.get_previous_link(),
+            "results" : data,
+        })
+
+    def get_next_link(self):
+        if not self.use_keyset:
+            return super().get_next_link()
+        if not self.has_next or not self.rows:
+            return None
+        return self._cursor_link(self.rows[-1], reverse = False)
+
+    def get_previous_link(self):
+        if not self.use_keyset:
+            return super().get_previous_link()
+        if not self.has_previous or not self.rows:
+            return None
+        return self._cursor_link(self.rows[0], reverse = True)
+
+    # ==================================== KEYSET HELPERS ====================================
+
+    @staticmethod
+    def _flip(field : str) -> str:
+        return field[1 : ] if field.startswith("-") else f"-{field}"
+
+    @staticmethod
+    def get_keyset_ordering(queryset) -> List[str]:
+        """Queryset ordering (or Meta.ordering) with the primary key appended as tie-breaker"""
+        pk_name = queryset.model._meta.pk.name
+        ordering = [str(field).replace("pk", pk_name) if str(field).lstrip("-") == "pk" else str(field)
+                    for field in (queryset.query.order_by or queryset.model._meta.ordering or [])]
+        if not any(field.lstrip("-") == pk_name for field in ordering):
+            descending = bool(ordering) and ordering[-1].startswith("-")
+            ordering.append(f"-{pk_name}" if descending else pk_name)
+        return ordering
+
+    @staticmethod
+    def build_keyset_filter(ordering : Sequence[str], values : Sequence) -> Q:
+        """
+        Rows strictly after `values` in `ordering`:
+            (a > x) OR (a = x AND b > y) OR (a = x AND b = y AND c > z) ...
+        ANDed with the leading column bound (a >= x) so the planner can range-scan the index.
+        """
+        condition = Q()
+        equal_so_far = Q()
+        for field, value in zip(ordering, values):
+            name = field.lstrip("-")
+            lookup = "lt" if field.startswith("-") else "gt"
+            condition |= equal_so_far & Q(**{f"{name}__{lookup}" : value})
+            equal_so_far &= Q(**{name : value})
+
+        leading = ordering[0]
+        leading_bound = Q(**{f"{leading.lstrip('-')}__{'lte' if leading.startswith('-') else 'gte'}" : values[0]})
+        return leading_bound & condition
+
+    def encode_cursor(self, row, reverse : bool) -> str:
+        """Opaque cursor for the page after `row` (before it when reverse) in self.ordering"""
+        model = type(row)
+        values = [getattr(row, model._meta.get_field(field.lstrip("-")).attname) for field in self.ordering]
+        return b64encode(json.dumps({"v" : values, "r" : reverse}, default = self._encode_value).encode("utf-8")).decode("ascii")
+
+    def _cursor_link(self, row, reverse : bool) -> str:
+        token = self.encode_cursor(row, reverse)
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, self.page_query_param)
+        url = remove_query_param(url, self.mode_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    @staticmethod
+    def _encode_value(value):
+        """
+        Full precision isoformat for dates/times (DjangoJSONEncoder cuts microseconds, which
+        would make rows created within the same millisecond get skipped or repeated).
+        """
+        if isinstance(value, (date, time)):
+            return value.isoformat()
+        return str(value)
+
+    def decode_cursor(self, request, model, ordering : Sequence[str]) -> Tuple[Optional[list], bool]:
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+
+        try:
+            payload = json.loads(b64decode(token.encode("ascii")).decode("utf-8"))
+            raw_values, reverse = payload["v"], bool(payload["r"])
+            if len(raw_values) != len(ordering):
+                raise ValueError("cursor does not match ordering")
+
+            # Back to python types (datetime, Decimal...) through the model fields themselves
+            values = [model._meta.get_field(field.lstrip("-")).to_python(value) for field, value in zip(ordering, raw_values)]
+        except Exception:
+            # Tampered / truncated / foreign cursor → client error, not "page not found"
+            raise ValidationError({self.cursor_query_param : [self.invalid_cursor_message]})
+        return values, reverse
+
+    # ==================================== OPENAPI ====================================
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters.extend([
+            {
+                "name" : self.cursor_query_param,
+                "required" : False,
+                "in" : "query",
+                "description" : "Keyset cursor taken from a previous response's next/previous link.",
+                "schema" : {"type" : "string"},
+            },
+            {
+                "name" : self.mode_query_param,
+                "required" : False,
+                "in" : "query",
+                "description" : f"Set to '{self.keyset_mode}' to start keyset pagination (no count, constant cost per page).",
+                "schema" : {"type" : "string", "enum" : [self.keyset_mode]},
+            },
+        ])
+        return parameters
+
+
+class ApproximateKeysetPagination(KeysetPagination, ApproximateCountPagination):
+    """Keyset pages on request, otherwise page-number pages with approximate counts"""
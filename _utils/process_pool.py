@@ -0,0 +1,52 @@
+# Python base imports - Default ones
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+# Dependent software imports
+import django
+from django.apps import apps
+from django.conf import settings
+
+# Custom created imports
+
+
+
+# ------------------------------------------------------------
+# Process pools that never fork the running web worker
+# ------------------------------------------------------------
+# Purpose:
+#   A bare ProcessPoolExecutor forks (Linux default) the process that
+#   first submits work - inside gunicorn / uvicorn that is a copy of a
+#   live server: event loop, threads holding locks, open DB sockets.
+#
+# Example:
+#   executor = create_process_pool(max_workers = 2)
+#   executor.map(render_highlight, codes, languages, ...)
+#
+# Design Goals:
+#   - Workers start from a clean interpreter: "forkserver" (POSIX) or
+#     "spawn", settings.PROCESS_POOL_START_METHOD (default forkserver,
+#     spawn where forkserver is unavailable)
+#   - Each worker configures Django once (init_django_worker), so task
+#     functions may use settings, the ORM and the hashers
+#   - Task functions must be module level (picklable by reference)
+# ------------------------------------------------------------
+
+def get_start_method() -> str:
+    method = getattr(settings, "PROCESS_POOL_START_METHOD", "forkserver")
+    if method not in multiprocessing.get_all_start_methods():
+        return "spawn"
+    return method
+
+
+def init_django_worker() -> None:
+    """Pool initializer: workers start without Django configured"""
+    if not apps.ready:
+        os.environ.setdefault("DJANGO_SETTINGS_MODULE", "demo_app.settings")
+        django.setup()
+
+
+def create_process_pool(max_workers : int) -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers = max_workers, mp_context = multiprocessing.get_context(get_start_method()),
+                               initializer = init_django_worker)
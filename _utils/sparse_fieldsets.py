@@ -0,0 +1,123 @@
+# Python base imports - Default ones
+from typing import FrozenSet, Optional
+
+# Dependent software imports
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework.exceptions import ValidationError
+
+# Custom created imports
+
+
+
+# ------------------------------------------------------------
+# Sparse fieldsets (?fields= / ?exclude=)
+# ------------------------------------------------------------
+# Purpose:
+#   List pages always serialized every column - e.g. the full
+#   highlighted HTML and decrypted email/results of every snippet -
+#   even when the client only needs titles.
+#
+# Example:
+#   GET /snippets/?fields=id,title,language
+#   GET /uploads/?exclude=extracted_files_info,file_metadata
+#
+# Mechanism:
+#   - SparseFieldsetViewMixin parses the params (read actions only),
+#     passes the kept names to the serializer through its context and
+#     defer()s the model columns behind every dropped field, so they
+#     are neither fetched nor decrypted
+#   - SparseFieldsetSerializerMixin drops the other fields on init
+#   - No params → unchanged full representation
+# ------------------------------------------------------------
+
+class SparseFieldsetSerializerMixin:
+    """Keeps only the fields listed in context["sparse_fields"] (when present)"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        sparse_fields = self.context.get("sparse_fields") # type: ignore
+        if sparse_fields is not None:
+            for name in list(self.fields): # type: ignore
+                if name not in sparse_fields:
+                    self.fields.pop(name) # type: ignore
+
+
+class SparseFieldsetViewMixin:
+    """Viewset side: validates ?fields= / ?exclude= and defers the columns nobody asked for"""
+
+    fields_query_param = "fields"
+    exclude_query_param = "exclude"
+    sparse_fieldset_actions = ("list", "retrieve")
+
+    # Computed fields → model columns they read, e.g. {"download_url" : ("file_object",)}
+    # Those columns are never deferred while the computed field is kept (no per-row reload)
+    sparse_field_dependencies = {}
+
+    def get_sparse_fields(self) -> Optional[FrozenSet[str]]:
+        if getattr(self, "_sparse_fields_resolved", False):
+            return self._sparse_fields
+
+        self._sparse_fields_resolved = True
+        self._sparse_fields = None
+
+        request = getattr(self, "request", None)
+        if request is None or getattr(self, "action", None) not in self.sparse_fieldset_actions:
+            return None
+
+        requested = self._split(request.query_params.get(self.fields_query_param))
+        excluded = self._split(request.query_params.get(self.exclude_query_param))
+        if not requested and not excluded:
+            return None
+
+        available = set(self._get_full_serializer().fields)
+        unknown = (requested | excluded) - available
+        if unknown:
+            raise ValidationError({"fields" : [f"Unknown field(s): {', '.join(sorted(unknown))}. "
+                                               f"Available: {', '.join(sorted(available))}"]})
+
+        kept = (requested or available) - excluded
+
+        # The primary key always stays - clients need it to follow up on a row
+        if "id" in available:
+            kept.add("id")
+        self._sparse_fields = frozenset(kept)
+        return self._sparse_fields
+
+    def _get_full_serializer(self):
+        # Built once per request - ModelSerializer field construction is not free
+        if getattr(self, "_full_serializer", None) is None:
+            self._full_serializer = self.get_serializer_class()(context = super().get_serializer_context()) # type: ignore
+        return self._full_serializer
+
+    @staticmethod
+    def _split(value : Optional[str]) -> set:
+        return {name.strip() for name in (value or "").split(",") if name.strip()}
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context() # type: ignore
+        sparse_fields = self.get_sparse_fields()
+        if sparse_fields is not None:
+            context["sparse_fields"] = sparse_fields
+        return context
+
+    def get_queryset(self):
+        queryset = super().get_queryset() # type: ignore
+        sparse_fields = self.get_sparse_fields()
+        if sparse_fields is None:
+            return queryset
+
+        needed = {column for name in sparse_fields for column in self.sparse_field_dependencies.get(name, ())}
+
+        # Defer the model column behind every dropped field ("*" / method fields have no single column)
+        model = queryset.model
+        deferred = []
+        for name, field in self._get_full_serializer().fields.items():
+            if name in sparse_fields or not field.source or field.source == "*":
+                continue
+            try:
+                model_field = model._meta.get_field(field.source.split(".")[0])
+            except FieldDoesNotExist:
+                continue
+            if model_field.concrete and not model_field.primary_key and model_field.name not in needed:
+                deferred.append(model_field.name)
+        return queryset.defer(*deferred) if deferred else queryset
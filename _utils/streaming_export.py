@@ -0,0 +1,90 @@
+# Python base imports - Default ones
+import csv
+import json
+from typing import Iterator, List, Sequence
+
+# Dependent software imports
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+from django.http import StreamingHttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+
+# Custom created imports
+
+
+
+# ------------------------------------------------------------
+# Streaming Export Mixin for ModelViewSets
+# ------------------------------------------------------------
+# Purpose:
+#   Full-table exports without paging through the list endpoint
+#   (PAGE_SIZE = 10 → one COUNT(*) + serializer pass per 10 rows).
+#
+# Example:
+#   GET /snippets/export/                → NDJSON (one object per line)
+#   GET /snippets/export/?output=csv     → CSV with header row
+#   GET /snippets/export/?language=python → filters still apply
+#
+# Design Goals:
+#   - Constant memory: rows come from QuerySet.iterator(chunk_size)
+#     (server-side cursor on PostgreSQL) and are written as they arrive
+#   - No serializer per row: values_list() tuples → json/csv encoder
+#   - Same queryset, filters and permissions as the list action
+# ------------------------------------------------------------
+
+class _EchoBuffer:
+    """csv.writer target that hands each encoded row back instead of buffering it"""
+
+    def write(self, value):
+        return value
+
+
+class StreamingExportMixin:
+    """
+    Adds `GET <prefix>/export/` to a ModelViewSet.
+
+    Subclasses list the exported columns in `export_fields` (model field names or
+    `values_list` lookups such as "owner__employee_id").
+    """
+
+    export_fields : Sequence[str] = ()
+
+    # Rows fetched per round trip from the server-side cursor
+    export_chunk_size = 2000
+
+    export_formats = ("ndjson", "csv")
+
+    @action(detail = False, methods = ["get"], pagination_class = None)
+    def export(self, request, *args, **kwargs):
+        output = request.query_params.get("output", "ndjson").lower()
+        if output not in self.export_formats:
+            return Response({"detail" : f"Unsupported output '{output}'. Choose from: {', '.join(self.export_formats)}"},
+                            status = status.HTTP_400_BAD_REQUEST)
+
+        # Same ownership scoping and filters (e.g. SnippetFilter) as the list endpoint
+        queryset = self.filter_queryset(self.get_queryset()) # type: ignore
+        rows = queryset.values_list(*self.export_fields).iterator(chunk_size = self.export_chunk_size)
+
+        basename = getattr(self, "basename", None) or queryset.model._meta.model_name
+        if output == "csv":
+            response = StreamingHttpResponse(self._stream_csv(rows), content_type = "text/csv; charset=utf-8")
+        else:
+            response = StreamingHttpResponse(self._stream_ndjson(rows), content_type = "application/x-ndjson")
+
+        response["Content-Disposition"] = f'attachment; filename="{basename}-export.{output}"'
+        return response
+
+    def _stream_ndjson(self, rows : Iterator[tuple]) -> Iterator[str]:
+        fields : List[str] = list(self.export_fields)
+        encoder = DjangoJSONEncoder(separators = (",", ":"))
+        for row in rows:
+            yield encoder.encode(dict(zip(fields, row))) + "\n"
+
+    def _stream_csv(self, rows : Iterator[tuple]) -> Iterator[str]:
+        writer = csv.writer(_EchoBuffer())
+        yield writer.writerow(self.export_fields)
+        for row in rows:
+            # Nested JSON columns (dict/list) are written as JSON text
+            yield writer.writerow([json.dumps(value, cls = DjangoJSONEncoder) if isinstance(value, (dict, list)) else value
+                                   for value in row])
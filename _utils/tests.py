@@ -1,3 +1,594 @@
-from django.test import TestCase
+# Python base imports - Default ones
+import os
+import gc
+import re
+import json
+import logging
+import weakref
+import threading
+import multiprocessing
+import tempfile
+from io import StringIO
+from contextlib import contextmanager
+from datetime import timedelta
+from unittest.mock import patch
+from base64 import b64encode
+from time import perf_counter, sleep
 
-# Create your tests here.
+# Dependent software imports
+from django.urls import reverse
+from django.utils import timezone
+from django.db import connection
+from rest_framework.test import APITestCase
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from cryptography.fernet import Fernet
+from encrypted_model_fields import fields as library_fields
+from django.test.utils import CaptureQueriesContext
+
+# Custom created imports
+from app2.models import AppUser
+from app2.config import SecurityConfigManager
+from _utils.models import GlobalAppConfig
+from _utils.app_config import AppConfigService, ConfigField
+from _utils.logging_handlers import AppFileRoutingHandler, BoundedQueueHandler, ProcessSafeRotatingFileHandler
+from _utils.pagination import ApproximateCountPaginator
+from _utils.encrypted_fields import Ciphertext, is_current
+from file_mgr.models import UploadFile
+from app1.models import Answers, Choice, Question, Snippet
+
+
+class ListEndpointQueryBudgetTests(APITestCase):
+    """
+    Query-count guard for every list endpoint.
+
+    Each endpoint gets a fixed query budget that must hold whatever the number of rows on the
+    page - one extra query per row (N+1) fails here before it reaches production.
+    Budgets count: pagination (row estimate + COUNT where applicable) + page rows + prefetches.
+    """
+
+    BUDGETS = {
+        "appuser-list" : 3,     # COUNT + users + snippets prefetch
+        "snippet-list" : 3,     # row estimate + COUNT + snippets
+        "question-list" : 2,    # COUNT + questions
+        "choice-list" : 2,      # COUNT + choices
+        "answers-list" : 3,     # row estimate + COUNT + answers
+        "uploads-list" : 3,     # row estimate + COUNT + uploads
+    }
+
+    def _create_rows(self, count : int, start : int = 0) -> None:
+        for index in range(start, start + count):
+            user = AppUser.objects.create_user(employee_id = f"EMP{index:04d}", password = "Unused#Pass123",
+                                               email = f"emp{index}@example.com", first_name = "Test",
+                                               last_name = f"User{index}", secret_hint = "hint", secret_answer = "answer")
+            Snippet.objects.create(owner = user, code = f"print({index})")
+            question = Question.objects.create(question_text = f"Question {index}", pub_date = timezone.now())
+            choice = Choice.objects.create(question = question, choice_text = f"Choice {index}")
+            Answers.objects.create(choice = choice, answer = f"Answer {index}")
+            UploadFile.objects.create(file_name = f"file_{index}.txt")
+
+    def _query_counts(self) -> dict:
+        counts = {}
+        for url_name in self.BUDGETS:
+            with CaptureQueriesContext(connection) as context:
+                response = self.client.get(reverse(url_name))
+            self.assertEqual(response.status_code, 200, f"{url_name}: {response.content[ : 200]!r}")
+            counts[url_name] = len(context.captured_queries)
+        return counts
+
+    def test_list_endpoints_stay_within_query_budget(self):
+        self._create_rows(1)
+        self.client.force_authenticate(user = AppUser.objects.first())
+        single_row = self._query_counts()
+
+        # More rows than PAGE_SIZE → every endpoint renders a full page
+        self._create_rows(14, start = 1)
+        full_page = self._query_counts()
+
+        for url_name, budget in self.BUDGETS.items():
+            with self.subTest(endpoint = url_name):
+                self.assertLessEqual(full_page[url_name], budget)
+                self.assertEqual(single_row[url_name], full_page[url_name], "query count grows with page size")
+
+
+class KeysetPaginationTests(APITestCase):
+    """?pagination=keyset / ?cursor= pages: complete in both directions, stable under ties, bad cursors → 400"""
+
+    PAGE_SIZE = 4
+
+    def setUp(self):
+        user = AppUser.objects.create_user(employee_id = "EMP0200", password = "Unused#Pass123", email = "emp200@example.com",
+                                           first_name = "Test", last_name = "User", secret_hint = "hint", secret_answer = "answer")
+        self.client.force_authenticate(user = user)
+        question = Question.objects.create(question_text = "Question", pub_date = timezone.now())
+
+        # 3 distinct texts over 25 rows → long runs of equal choice_text, only the id tie-breaker orders them
+        Choice.objects.bulk_create([Choice(question = question, choice_text = f"Choice {index % 3}") for index in range(25)])
+        self.expected = list(Choice.objects.order_by("-choice_text", "-id").values_list("id", flat = True))
+        self.url = reverse("choice-list")
+
+    def _pages(self, response, link : str):
+        """Result ids page by page, following `link` (next / previous) until it runs out"""
+        pages = []
+        while True:
+            self.assertEqual(response.status_code, 200)
+            pages.append([row["id"] for row in response.data["results"]])
+            if not response.data[link]:
+                return pages
+            response = self.client.get(response.data[link])
+
+    def test_cursor_round_trip(self):
+        forward = self._pages(self.client.get(self.url, {"pagination" : "keyset", "page_size" : self.PAGE_SIZE}), "next")
+        self.assertEqual([row for page in forward for row in page], self.expected)
+        self.assertTrue(all(len(page) == self.PAGE_SIZE for page in forward[ : -1]))
+
+        # From the last page back to the first through the previous links
+        last_page = self.client.get(self.url, {"pagination" : "keyset", "page_size" : self.PAGE_SIZE})
+        while last_page.data["next"]:
+            last_page = self.client.get(last_page.data["next"])
+        backward = self._pages(last_page, "previous")
+        self.assertEqual([row for page in reversed(backward) for row in page], self.expected)
+
+    def test_ties_match_page_number_pages(self):
+        keyset = self._pages(self.client.get(self.url, {"pagination" : "keyset", "page_size" : self.PAGE_SIZE}), "next")
+        for number, page in enumerate(keyset, start = 1):
+            response = self.client.get(self.url, {"page" : number, "page_size" : self.PAGE_SIZE})
+            self.assertEqual([row["id"] for row in response.data["results"]], page)
+
+    def test_tampered_cursor_is_rejected(self):
+        def encode(payload) -> str:
+            return b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+        for cursor in ("not-a-cursor!", encode(["not", "an", "object"]), encode({"v" : ["Choice 1"], "r" : False}),
+                       encode({"v" : ["Choice 1", "not-an-id"], "r" : False})):
+            with self.subTest(cursor = cursor):
+                response = self.client.get(self.url, {"cursor" : cursor})
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("cursor", response.data)
+
+    @override_settings(API_MAX_PAGE_SIZE = 3)
+    def test_page_size_is_capped_by_current_setting(self):
+        for params in ({"pagination" : "keyset", "page_size" : 50}, {"page" : 1, "page_size" : 50}):
+            with self.subTest(params = params):
+                response = self.client.get(self.url, params)
+                self.assertEqual([row["id"] for row in response.data["results"]], self.expected[ : 3])
+
+
+class ApproximateCountPaginationTests(APITestCase):
+    """Page-number pages: exact COUNT below the threshold, planner estimate above it, next link from the extra row"""
+
+    ROWS = 12
+
+    def setUp(self):
+        user = AppUser.objects.create_user(employee_id = "EMP0201", password = "Unused#Pass123", email = "emp201@example.com",
+                                           first_name = "Test", last_name = "User", secret_hint = "hint", secret_answer = "answer")
+        self.client.force_authenticate(user = user)
+        Snippet.objects.bulk_create([Snippet(owner = user, code = f"print({index})") for index in range(self.ROWS)])
+        self.url = reverse("snippet-list")
+
+    def _estimate(self, rows):
+        return patch.object(ApproximateCountPaginator, "_estimate", return_value = rows)
+
+    def test_non_postgresql_counts_exactly(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual((response.data["count"], response.data["count_is_approximate"]), (self.ROWS, False))
+        self.assertIsNone(ApproximateCountPaginator(Snippet.objects.all(), 10)._estimate())
+
+    @override_settings(APPROXIMATE_COUNT_THRESHOLD = 100)
+    def test_estimate_below_threshold_counts_exactly(self):
+        with self._estimate(50):
+            response = self.client.get(self.url)
+
+        self.assertEqual((response.data["count"], response.data["count_is_approximate"]), (self.ROWS, False))
+        self.assertIsNotNone(response.data["next"])
+
+    @override_settings(APPROXIMATE_COUNT_THRESHOLD = 100)
+    def test_estimate_above_threshold_is_reported(self):
+        with self._estimate(5000):
+            first = self.client.get(self.url)
+            last = self.client.get(self.url, {"page" : 2})
+
+        self.assertEqual((first.data["count"], first.data["count_is_approximate"]), (5000, True))
+        self.assertEqual(len(first.data["results"]), 10)
+        self.assertIsNotNone(first.data["next"])
+
+        # The estimate promises more pages, the missing extra row says this is the last one
+        self.assertEqual(len(last.data["results"]), self.ROWS - 10)
+        self.assertIsNone(last.data["next"])
+        self.assertIsNotNone(last.data["previous"])
+
+    @override_settings(APPROXIMATE_COUNT_THRESHOLD = 1)
+    def test_low_estimate_does_not_hide_pages(self):
+        with self._estimate(5):
+            first = self.client.get(self.url)
+            second = self.client.get(self.url, {"page" : 2})
+            past_end = self.client.get(self.url, {"page" : 3})
+
+        self.assertEqual((first.data["count"], first.data["count_is_approximate"]), (5, True))
+        self.assertIsNotNone(first.data["next"])
+        self.assertEqual(len(second.data["results"]), self.ROWS - 10)
+        self.assertEqual(past_end.status_code, 404)
+
+
+class SparseFieldsetTests(APITestCase):
+    """?fields= / ?exclude= trim the payload and the SELECT, unknown names are a 400"""
+
+    def setUp(self):
+        user = AppUser.objects.create_user(employee_id = "EMP0300", password = "Unused#Pass123", email = "emp300@example.com",
+                                           first_name = "Test", last_name = "User", secret_hint = "hint", secret_answer = "answer")
+        self.client.force_authenticate(user = user)
+        Snippet.objects.create(owner = user, title = "Sparse", code = "print(1)")
+        UploadFile.objects.create(file_name = "archive.zip", file_object = "uploaded/archive.zip",
+                                  extracted_files_info = [{"name" : "a.txt"}], file_metadata = {"size" : 1})
+
+    def _get(self, url_name : str, params : dict):
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(reverse(url_name), params)
+        self.assertEqual(response.status_code, 200, response.content[ : 200])
+        select = next(query["sql"] for query in context.captured_queries
+                      if query["sql"].startswith("SELECT") and "COUNT(" not in query["sql"])
+        return response.data["results"][0], select
+
+    def test_fields_keeps_listed_fields_and_id(self):
+        row, select = self._get("snippet-list", {"fields" : "title,language"})
+        self.assertEqual(set(row), {"id", "title", "language"})
+        for column in ("highlighted", "code", "email", "results"):
+            self.assertNotIn(f'"{column}"', select)
+
+    def test_exclude_drops_fields_and_their_columns(self):
+        row, select = self._get("uploads-list", {"exclude" : "extracted_files_info,file_metadata"})
+        self.assertNotIn("extracted_files_info", row)
+        self.assertNotIn("file_metadata", row)
+        self.assertIn("file_name", row)
+        self.assertNotIn('"extracted_files_info"', select)
+        self.assertNotIn('"file_metadata"', select)
+
+    def test_dependencies_keep_the_columns_computed_fields_read(self):
+        row, select = self._get("uploads-list", {"fields" : "download_url"})
+        self.assertEqual(set(row), {"id", "download_url"})
+        self.assertTrue(row["download_url"].endswith("uploaded/archive.zip"))
+        self.assertIn('"file_object"', select)
+
+        row, select = self._get("uploads-list", {"fields" : "file_name"})
+        self.assertNotIn('"file_object"', select)
+
+    def test_unknown_field_is_rejected(self):
+        for params in ({"fields" : "title,nope"}, {"exclude" : "nope"}):
+            with self.subTest(params = params):
+                response = self.client.get(reverse("snippet-list"), params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("nope", str(response.data["fields"]))
+
+    def test_no_params_returns_every_field(self):
+        row, _ = self._get("snippet-list", {})
+        self.assertTrue({"highlighted", "code", "email", "results"} <= set(row))
+
+
+@override_settings(SECURITY_CONFIG_CHECK_INTERVAL = 3600)
+class AppConfigServiceTests(TestCase):
+    """Typed GlobalAppConfig cache: one query for all categories, values parsed once"""
+
+    def setUp(self):
+        AppConfigService.reset()
+
+    def tearDown(self):
+        AppConfigService.reset()
+
+    def test_values_are_typed(self):
+        self.assertEqual(SecurityConfigManager.get("auth_retries"), 3)
+        self.assertIs(SecurityConfigManager.get("require_special"), True)
+        self.assertEqual(SecurityConfigManager.get("password_age"), timedelta(days = 90))
+        self.assertIsInstance(SecurityConfigManager.get("special_characters"), re.Pattern)
+
+        GlobalAppConfig.objects.create(category = "security", name = "password_age", value = "12h")
+        GlobalAppConfig.objects.create(category = "security", name = "require_special", value = "false")
+        self.assertEqual(SecurityConfigManager.get("password_age"), timedelta(hours = 12))
+        self.assertIs(SecurityConfigManager.get("require_special"), False)
+
+    def test_all_categories_load_in_one_query(self):
+        GlobalAppConfig.objects.create(category = "security", name = "auth_retries", value = "4")
+        GlobalAppConfig.objects.create(category = "reports", name = "page_limit", value = "250")
+        AppConfigService.reset()
+
+        # Version stamp + all rows
+        with CaptureQueriesContext(connection) as context:
+            self.assertEqual(SecurityConfigManager.get("auth_retries"), 4)
+            # No schema for "reports" → raw string
+            self.assertEqual(AppConfigService.get("reports", "page_limit"), "250")
+            self.assertEqual(AppConfigService.category("security")["password_limit"], 5)
+        self.assertEqual(len(context.captured_queries), 2)
+
+    def test_invalid_values_fall_back_to_defaults(self):
+        GlobalAppConfig.objects.bulk_create([
+            GlobalAppConfig(category = "security", name = "auth_retries", value = "three"),
+            GlobalAppConfig(category = "security", name = "special_characters", value = "[unclosed"),
+        ])
+        with self.assertLogs("_utils.app_config", level = "WARNING"):
+            self.assertEqual(SecurityConfigManager.get("auth_retries"), 3)
+        self.assertEqual(SecurityConfigManager.get("special_characters").pattern, SecurityConfigManager.DEFAULTS["special_characters"])
+
+    def test_clean_rejects_values_outside_the_schema(self):
+        with self.assertRaises(ValidationError):
+            GlobalAppConfig(category = "security", name = "auth_retries", value = "0").clean()
+        with self.assertRaises(ValidationError):
+            GlobalAppConfig(category = "security", name = "unknown_setting", value = "1").clean()
+        GlobalAppConfig(category = "security", name = "require_numeric", value = "no").clean()
+
+    def test_only_the_meta_row_is_the_version_stamp(self):
+        # Schema-less category → any value would pass, the reserved name must not
+        with self.assertRaises(ValidationError):
+            GlobalAppConfig(category = "reports", name = AppConfigService.VERSION_NAME, value = "42").clean()
+
+        # A row written around clean() is still config, not the stamp
+        GlobalAppConfig.objects.bulk_create([GlobalAppConfig(category = "reports", name = AppConfigService.VERSION_NAME, value = "42")])
+        self.assertIsNone(AppConfigService._read_version())
+        self.assertEqual(AppConfigService.get("reports", AppConfigService.VERSION_NAME), "42")
+
+    def test_unknown_security_name_raises(self):
+        with self.assertRaises(ValueError):
+            SecurityConfigManager.get("not_a_setting")
+
+    def test_field_parsing(self):
+        self.assertEqual(ConfigField("duration", "15m").parse("15m"), timedelta(minutes = 15))
+        self.assertEqual(ConfigField("duration", "30").parse("30"), timedelta(seconds = 30))
+        with self.assertRaises(ValueError):
+            ConfigField("int", "1", max_value = 10).parse("11")
+        with self.assertRaises(ValueError):
+            ConfigField("bool", "true").parse("maybe")
+
+
+class LazyDecryptionTests(TestCase):
+    """Encrypted fields decrypted on first read, plaintext everywhere callers look"""
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0100", password = "Valid#Pass123", email = "lazy@example.com",
+                                                first_name = "Lazy", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+
+    def test_instances_decrypt_on_first_read(self):
+        user = AppUser.objects.get(pk = self.user.pk)
+        self.assertIsInstance(user.__dict__["email"], Ciphertext)
+        self.assertEqual(user.email, "lazy@example.com")
+        self.assertEqual(user.__dict__["email"], "lazy@example.com")
+        self.assertIsInstance(user.__dict__["secret_hint"], Ciphertext)
+
+    def test_values_and_base_manager_stay_eager(self):
+        self.assertEqual(AppUser.objects.filter(pk = self.user.pk).values_list("email", flat = True).get(), "lazy@example.com")
+        self.assertEqual(AppUser._base_manager.get(pk = self.user.pk).__dict__["email"], "lazy@example.com")
+
+    def test_save_round_trip_of_unread_fields(self):
+        user = AppUser.objects.get(pk = self.user.pk)
+        user.is_staff = True
+        user.save()
+        user = AppUser.objects.get(pk = self.user.pk)
+        self.assertEqual((user.first_name, user.last_name, user.secret_hint), ("Lazy", "User", "hint"))
+
+
+class KeyRotationTests(TestCase):
+    """Multi-key FIELD_ENCRYPTION_KEY + reencrypt_fields"""
+
+    OLD_KEY, NEW_KEY = Fernet.generate_key().decode(), Fernet.generate_key().decode()
+
+    @contextmanager
+    def _keys(self, *keys):
+        """The library builds its crypter once at import - rebuild it for the overridden keys"""
+        with override_settings(FIELD_ENCRYPTION_KEY = list(keys)):
+            with patch.object(library_fields, "CRYPTER", library_fields.get_crypter()):
+                yield
+
+    def _stored_email(self, pk) -> str:
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT email FROM app_users WHERE id = %s", [pk])
+            return cursor.fetchone()[0]
+
+    def test_rows_on_old_key_are_readable_and_rewritten(self):
+        with self._keys(self.OLD_KEY):
+            user = AppUser.objects.create_user(employee_id = "EMP0200", password = "Valid#Pass123", email = "rotate@example.com",
+                                               first_name = "Key", last_name = "Rotation", secret_hint = "hint",
+                                               secret_answer = "answer")
+
+        with self._keys(self.NEW_KEY, self.OLD_KEY):
+            self.assertEqual(AppUser.objects.get(pk = user.pk).email, "rotate@example.com")
+            self.assertFalse(is_current(self._stored_email(user.pk)))
+
+            with tempfile.TemporaryDirectory() as directory:
+                call_command("reencrypt_fields", checkpoint = f"{directory}/checkpoint", batch_size = 1, stdout = StringIO())
+                # Second run resumes from the finished checkpoint → nothing to do
+                call_command("reencrypt_fields", checkpoint = f"{directory}/checkpoint", stdout = StringIO())
+
+            self.assertTrue(is_current(self._stored_email(user.pk)))
+
+        with self._keys(self.NEW_KEY):
+            user = AppUser.objects.get(pk = user.pk)
+            self.assertEqual((user.email, user.first_name, user.secret_hint), ("rotate@example.com", "Key", "hint"))
+
+
+class _SlowListHandler(logging.Handler):
+    """Target handler that takes its time, like a disk under load"""
+
+    def __init__(self, delay : float = 0.0):
+        super().__init__()
+        self.delay, self.messages, self.records = delay, [], []
+
+    def emit(self, record):
+        sleep(self.delay)
+        self.messages.append(record.getMessage())
+        self.records.append(record)
+
+
+class _RecordListHandler(logging.Handler):
+    """Plain handler next to the queue handler on the same logger"""
+
+    def __init__(self):
+        super().__init__()
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+class BoundedQueueHandlerTests(SimpleTestCase):
+    """Queue logging: records written by the listener, bounded queue, drop accounting"""
+
+    def _logger(self, target : logging.Handler, **options) -> logging.Logger:
+        name = f"queue-test-{self._testMethodName}"
+        target.set_name(f"{name}-target")
+        handler = BoundedQueueHandler([target.get_name()], **options)
+        self.addCleanup(handler.close)
+
+        logger = logging.getLogger(name)
+        logger.handlers, logger.propagate = [handler], False
+        logger.setLevel(logging.DEBUG)
+        return logger
+
+    def test_records_reach_targets_in_order(self):
+        target = _SlowListHandler()
+        logger = self._logger(target, queue_size = 100)
+        for index in range(50):
+            logger.info("line %s", index)
+        logger.handlers[0].close()
+        self.assertEqual(target.messages, [f"line {index}" for index in range(50)])
+
+    def test_other_handlers_see_the_original_record(self):
+        target, sibling = _SlowListHandler(), _RecordListHandler()
+        logger = self._logger(target, queue_size = 100)
+        logger.addHandler(sibling)
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed %s", "job")
+        logger.handlers[0].close()
+
+        original = sibling.records[0]
+        self.assertEqual((original.msg, original.args), ("failed %s", ("job",)))
+        self.assertIs(original.exc_info[0], ValueError)
+
+        queued = target.records[0]
+        self.assertIsNot(queued, original)
+        self.assertEqual((queued.msg, queued.args, queued.exc_info), ("failed job", None, None))
+        self.assertIn("ValueError: boom", queued.exc_text)
+
+    def test_drop_policy_never_blocks_and_counts_drops(self):
+        target = _SlowListHandler(delay = 0.01)
+        logger = self._logger(target, queue_size = 5, policy = "drop")
+
+        started = perf_counter()
+        for index in range(100):
+            logger.warning("line %s", index)
+        self.assertLess(perf_counter() - started, 0.5)
+
+        handler = logger.handlers[0]
+        stats = handler.stats()
+        handler.close()
+        self.assertGreater(stats["dropped"], 0)
+        self.assertEqual(stats["dropped_by_level"], {"WARNING" : stats["dropped"]})
+        # Everything not dropped was written, plus the drop report(s)
+        written = [message for message in target.messages if message.startswith("line")]
+        self.assertEqual(len(written) + stats["dropped"], 100)
+        self.assertTrue(any("dropped" in message for message in target.messages))
+
+    def test_block_policy_without_timeout_loses_nothing(self):
+        target = _SlowListHandler(delay = 0.001)
+        logger = self._logger(target, queue_size = 5, policy = "block", block_timeout = None)
+        for index in range(100):
+            logger.info("line %s", index)
+        handler = logger.handlers[0]
+        handler.close()
+        self.assertEqual(handler.stats()["dropped"], 0)
+        self.assertEqual(len(target.messages), 100)
+
+    def test_missing_target_fails_configuration(self):
+        with self.assertRaisesMessage(ValueError, "queue-test-no-such-target"):
+            BoundedQueueHandler(["queue-test-no-such-target"])
+
+    def test_targets_used_only_by_the_queue_stay_alive(self):
+        target = _SlowListHandler()
+        logger = self._logger(target, queue_size = 100)
+        target_ref = weakref.ref(target)
+        del target
+        gc.collect()
+
+        logger.info("kept")
+        logger.handlers[0].close()
+        self.assertEqual(target_ref().messages, ["kept"])
+
+    def test_listener_start_failure_is_a_logging_error(self):
+        logger = self._logger(_SlowListHandler())
+        handler = logger.handlers[0]
+        with patch.object(handler, "_start", side_effect = RuntimeError("can't start new thread")), \
+             patch.object(handler, "handleError") as handle_error:
+            logger.info("lost")
+        handle_error.assert_called_once()
+
+
+def _write_log_lines(filename : str, worker : int, count : int, max_bytes : int) -> None:
+    """Child process of the rotation stress test: own handler on the shared file, like a gunicorn worker"""
+    handler = ProcessSafeRotatingFileHandler(filename, maxBytes = max_bytes, backupCount = 10000, encoding = "utf-8")
+    logger = logging.getLogger(f"stress.{worker}")
+    logger.propagate = False
+    logger.addHandler(handler)
+    # Long lines → a torn / interleaved write would show up as invalid JSON
+    padding = "x" * 200
+    for index in range(count):
+        logger.error(json.dumps({"worker" : worker, "index" : index, "padding" : padding}))
+    handler.close()
+    os._exit(0)
+
+
+class ProcessSafeRotationTests(SimpleTestCase):
+    WORKERS = 6
+    LINES = 1500
+
+    def _read_all(self, directory : str, prefix : str):
+        lines = []
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and not name.endswith(".lock"):
+                with open(os.path.join(directory, name), encoding = "utf-8") as handle:
+                    lines.extend(handle.read().splitlines())
+        return lines
+
+    def test_concurrent_processes_lose_and_interleave_no_lines(self):
+        with tempfile.TemporaryDirectory() as directory:
+            filename = os.path.join(directory, "central_log.jsonl")
+            context = multiprocessing.get_context("fork")
+            processes = [context.Process(target = _write_log_lines, args = (filename, worker, self.LINES, 64 * 1024))
+                         for worker in range(self.WORKERS)]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join(60)
+            self.assertEqual([process.exitcode for process in processes], [0] * self.WORKERS)
+
+            lines = self._read_all(directory, "central_log.jsonl")
+            # Files were rotated many times while all workers were writing
+            self.assertGreater(len(os.listdir(directory)), 10)
+            records = [json.loads(line) for line in lines]  # every line whole
+            seen = sorted((record["worker"], record["index"]) for record in records)
+            self.assertEqual(seen, [(worker, index) for worker in range(self.WORKERS) for index in range(self.LINES)])
+
+    def test_router_creates_one_handler_per_app_under_concurrency(self):
+        with tempfile.TemporaryDirectory() as directory:
+            router = AppFileRoutingHandler(base_log_dir = directory)
+            router.setFormatter(logging.Formatter("%(message)s"))
+            created = []
+            original = ProcessSafeRotatingFileHandler.__init__
+
+            def counting_init(handler, *args, **kwargs):
+                created.append(args[0])
+                sleep(0.01)  # widen the race window
+                original(handler, *args, **kwargs)
+
+            record = logging.LogRecord("app1.views", logging.INFO, __file__, 1, "hello", None, None)
+            with patch.object(ProcessSafeRotatingFileHandler, "__init__", counting_init):
+                threads = [threading.Thread(target = router.emit, args = (record,)) for _ in range(8)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+            router.close()
+
+            self.assertEqual(len(created), 1)
+            with open(os.path.join(directory, "app1.jsonl"), encoding = "utf-8") as handle:
+                self.assertEqual(handle.read().splitlines(), ["hello"] * 8)
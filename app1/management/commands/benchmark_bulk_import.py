@@ -0,0 +1,86 @@
+# Python base imports - Default ones
+import json
+from time import perf_counter
+
+# Dependent software imports
+from django.db import transaction
+from django.test.utils import override_settings
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Custom created imports
+from app1.views import SnippetViewSet
+from app2.models import AppUser
+
+LANGUAGES = ["python", "javascript", "sql", "bash", "go", "java"]
+
+
+class Command(BaseCommand):
+    """
+    Throughput of the bulk import endpoint versus one POST per snippet.
+
+        python manage.py benchmark_bulk_import --count 2000 --chunk-size 500
+
+    Both paths go through SnippetViewSet (DRF request handling, auth, validation, render,
+    encryption, INSERT) with --count distinct snippets, inside a transaction that is rolled back:
+
+    - single : POST /snippets/ per item, highlight rendered synchronously in save()
+               (what the background render costs the server anyway)
+    - bulk   : one POST /snippets/bulk-import/ (JSON array), process pool render, bulk_create
+
+    HTTP parsing and network round trips are not included - the single path pays those once
+    per item on top of the numbers shown.
+    """
+
+    help = "Benchmark items/s of POST snippets/bulk-import/ against one POST per snippet."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type = int, default = 2000)
+        parser.add_argument("--chunk-size", type = int, default = 500)
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        items = [{"title" : f"Import {index}", "code" : f"value_{index} = {index} * 2\nprint(value_{index})\n",
+                  "language" : LANGUAGES[index % len(LANGUAGES)], "style" : "friendly", "linenos" : bool(index % 2),
+                  "email" : f"import{index}@example.com", "results" : "N/A", "price" : index}
+                 for index in range(count)]
+
+        with override_settings(SNIPPET_HIGHLIGHT_ASYNC = False):
+            single = self._measure(lambda user : self._single(items, user))
+        bulk = self._measure(lambda user : self._bulk(items, user, options["chunk_size"]))
+
+        self.stdout.write(f"{'path':<7} {'items':>6} {'seconds':>8} {'items/s':>9}")
+        for label, elapsed in (("single", single), ("bulk", bulk)):
+            self.stdout.write(f"{label:<7} {count:>6} {elapsed:>8.2f} {count / elapsed:>9.0f}")
+        self.stdout.write(f"bulk speed-up: {single / bulk:.1f}x")
+
+    @staticmethod
+    def _measure(run) -> float:
+        with transaction.atomic():
+            user = AppUser.objects.create_user(employee_id = "BENCH0001", password = "Bench#Pass123",
+                                               email = "bench@example.com", first_name = "Bench", last_name = "User",
+                                               secret_hint = "hint", secret_answer = "answer")
+            started = perf_counter()
+            run(user)
+            elapsed = perf_counter() - started
+            transaction.set_rollback(True)
+        return elapsed
+
+    @staticmethod
+    def _single(items, user) -> None:
+        view = SnippetViewSet.as_view({"post" : "create"})
+        factory = APIRequestFactory()
+        for item in items:
+            request = factory.post("/snippets/", {**item, "owner_id" : user.pk}, format = "json")
+            force_authenticate(request, user = user)
+            response = view(request)
+            assert response.status_code == 201, response.data
+
+    @staticmethod
+    def _bulk(items, user, chunk_size : int) -> None:
+        view = SnippetViewSet.as_view({"post" : "bulk_import"})
+        request = APIRequestFactory().post(f"/snippets/bulk-import/?chunk_size={chunk_size}", json.dumps(items),
+                                           content_type = "application/json")
+        force_authenticate(request, user = user)
+        response = view(request)
+        assert response.status_code == 201 and response.data["failed"] == 0, response.data
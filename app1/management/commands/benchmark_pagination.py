@@ -0,0 +1,101 @@
+# Python base imports - Default ones
+from statistics import median
+from time import perf_counter
+
+# Dependent software imports
+from django.utils import timezone
+from django.db import transaction
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Custom created imports
+from app2.models import AppUser
+from app1.models import Answers, Choice, Question
+from app1.views import AnswersViewSet, ChoiceViewSet, QuestionViewSet
+
+
+class Command(BaseCommand):
+    """
+    Latency of page 1 versus a deep page, page-number versus keyset pagination.
+
+        python manage.py benchmark_pagination --page 10000 --page-size 10 --repeat 5
+
+    Fills Question, Choice and Answers with enough rows to reach --page (inside a transaction
+    that is rolled back), then times each list endpoint through its viewset:
+
+    - page   : ?page=1 and ?page=N      (COUNT(*) + OFFSET (N - 1) * size)
+    - keyset : first keyset page and the cursor that starts at the same row as page N
+
+    Median of --repeat requests each. Run it against PostgreSQL for production-like numbers.
+    """
+
+    help = "Benchmark page 1 vs page N latency of question/choice/answers lists, page-number vs keyset."
+
+    VIEWSETS = (("question", QuestionViewSet), ("choice", ChoiceViewSet), ("answers", AnswersViewSet))
+
+    def add_arguments(self, parser):
+        parser.add_argument("--page", type = int, default = 10000)
+        parser.add_argument("--page-size", type = int, default = 10)
+        parser.add_argument("--repeat", type = int, default = 5)
+
+    def handle(self, *args, **options):
+        page, size = options["page"], options["page_size"]
+        rows = page * size
+
+        with transaction.atomic():
+            user = AppUser.objects.create_user(employee_id = "BENCH0002", password = "Bench#Pass123",
+                                               email = "bench-pages@example.com", first_name = "Bench", last_name = "Pages",
+                                               secret_hint = "hint", secret_answer = "answer")
+            self._fill(rows)
+            self.stdout.write(f"{rows} rows per table, page size {size}")
+            self.stdout.write(f"{'endpoint':<9} {'mode':<7} {'page 1 ms':>10} {f'page {page} ms':>14}")
+
+            for name, viewset in self.VIEWSETS:
+                view = viewset.as_view({"get" : "list"})
+                first_page = self._time(view, user, {"page" : 1, "page_size" : size}, options["repeat"])
+                deep_page = self._time(view, user, {"page" : page, "page_size" : size}, options["repeat"])
+                self.stdout.write(f"{name:<9} {'page':<7} {first_page:>10.2f} {deep_page:>14.2f}")
+
+                cursor = self._cursor_for(viewset, page, size)
+                first_page = self._time(view, user, {"pagination" : "keyset", "page_size" : size}, options["repeat"])
+                deep_page = self._time(view, user, {"cursor" : cursor, "page_size" : size}, options["repeat"])
+                self.stdout.write(f"{name:<9} {'keyset':<7} {first_page:>10.2f} {deep_page:>14.2f}")
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _fill(rows : int) -> None:
+        now = timezone.now()
+        questions = Question.objects.bulk_create(
+            [Question(question_text = f"Question {index}", pub_date = now) for index in range(rows)], batch_size = 5000)
+        choices = Choice.objects.bulk_create(
+            [Choice(question = question, choice_text = f"Choice {index % 997}") for index, question in enumerate(questions)],
+            batch_size = 5000)
+        Answers.objects.bulk_create([Answers(choice = choice, answer = f"Answer {index}") for index, choice in enumerate(choices)],
+                                    batch_size = 5000)
+
+    @staticmethod
+    def _request(user, params : dict):
+        # Links are absolute → a host that passes ALLOWED_HOSTS outside the test runner
+        request = APIRequestFactory().get("/", params, HTTP_HOST = "localhost")
+        force_authenticate(request, user = user)
+        return request
+
+    def _time(self, view, user, params : dict, repeat : int) -> float:
+        timings = []
+        for _ in range(repeat):
+            started = perf_counter()
+            response = view(self._request(user, params))
+            response.render()
+            timings.append((perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.data
+        return median(timings)
+
+    @staticmethod
+    def _cursor_for(viewset, page : int, size : int) -> str:
+        """Cursor of the keyset page that starts where page-number page `page` starts"""
+        paginator = viewset.pagination_class()
+        queryset = viewset.queryset.all()
+        paginator.ordering = paginator.get_keyset_ordering(queryset)
+        previous_row = queryset.order_by(*paginator.ordering)[(page - 1) * size - 1]
+        return paginator.encode_cursor(previous_row, reverse = False)
@@ -0,0 +1,83 @@
+# Python base imports - Default ones
+from itertools import cycle
+from time import perf_counter
+
+# Dependent software imports
+from pygments import highlight
+from pygments.lexers import get_lexer_by_name
+from pygments.formatters.html import HtmlFormatter
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app1.services.highlight_service import (FRAGMENT_MODE, HighlighterCache, get_highlight_mode, render_highlight, 
+                                             style_css_class)
+
+# Small, typical pastes - setup cost dominates for these, which is what the cache removes
+SAMPLES = [
+    ("python", "def add(a, b):\n    return a + b\n"),
+    ("javascript", "const add = (a, b) => a + b;\n"),
+    ("java", "class A { int add(int a, int b) { return a + b; } }\n"),
+    ("sql", "SELECT id, title FROM app1_snippet WHERE price > 10;\n"),
+    ("bash", "for f in *.py; do echo \"$f\"; done\n"),
+    ("json", "{\"id\": 1, \"title\": \"demo\"}\n"),
+    ("html", "<div class=\"demo\"><p>Hello</p></div>\n"),
+    ("go", "func add(a int, b int) int { return a + b }\n"),
+]
+STYLES = ["friendly", "monokai", "default"]
+
+
+class Command(BaseCommand):
+    """
+    Micro-benchmark of the render step Snippet.save() runs for new content.
+
+        python manage.py benchmark_snippet_highlight --count 3000
+
+    Compares building lexer + formatter per row (previous behaviour) with HighlighterCache,
+    over a rotation of common languages, styles and linenos/title combinations. No DB access.
+    """
+
+    help = "Benchmark snippet highlighting with and without the lexer/formatter cache."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--count", type = int, default = 3000, help = "Number of snippets rendered per run")
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        mode = get_highlight_mode()
+        workload = self._workload(count)
+
+        started = perf_counter()
+        for language, code, style, linenos, title in workload:
+            self._render_uncached(code, language, style, linenos, title, mode)
+        uncached = perf_counter() - started
+
+        HighlighterCache.clear()
+        started = perf_counter()
+        for language, code, style, linenos, title in workload:
+            render_highlight(code, language, style, linenos, title, mode)
+        cached = perf_counter() - started
+
+        self.stdout.write(f"{count} renders in '{mode}' mode")
+        self.stdout.write(f"  uncached : {uncached:.3f}s ({uncached / count * 1000:.3f} ms/snippet)")
+        self.stdout.write(f"  cached   : {cached:.3f}s ({cached / count * 1000:.3f} ms/snippet)")
+        self.stdout.write(f"  speedup  : {uncached / cached:.2f}x, cache {HighlighterCache.info()}")
+
+    @staticmethod
+    def _workload(count : int) -> list:
+        combos = cycle([(language, code, style, linenos, title)
+                        for language, code in SAMPLES
+                        for style in STYLES
+                        for linenos in (False, True)
+                        for title in ("", "demo")])
+        return [next(combos) for _ in range(count)]
+
+    @staticmethod
+    def _render_uncached(code : str, language : str, style : str, linenos : bool, title : str, mode : str) -> str:
+        lexer = get_lexer_by_name(language)
+        linenos_option = "table" if linenos else False
+        if mode == FRAGMENT_MODE:
+            formatter = HtmlFormatter(style = style, linenos = linenos_option, cssclass = style_css_class(style)) # type: ignore
+        else:
+            options = {"title" : title} if title else {}
+            formatter = HtmlFormatter(style = style, linenos = linenos_option, full = True, **options) # type: ignore
+        return highlight(code, lexer, formatter)
@@ -0,0 +1,87 @@
+# Python base imports - Default ones
+from statistics import median
+from time import perf_counter
+
+# Dependent software imports
+from django.db import transaction
+from django.test.utils import override_settings
+from django.core.management.base import BaseCommand
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+# Custom created imports
+from app2.models import AppUser
+from app1.models import Snippet
+from app1.views import SnippetViewSet
+from file_mgr.models import UploadFile
+from file_mgr.views import UploadFileViewSet
+
+
+class Command(BaseCommand):
+    """
+    Payload size and latency of list pages with and without sparse fieldsets.
+
+        python manage.py benchmark_sparse_fieldsets --rows 200 --repeat 20
+
+    Creates --rows snippets (highlighted synchronously) and uploads with JSON metadata inside a
+    transaction that is rolled back, then requests one list page per variant through the
+    viewsets and reports the rendered JSON size and the median latency of --repeat requests.
+    """
+
+    help = "Benchmark payload bytes and latency of snippet/upload list pages with ?fields= / ?exclude=."
+
+    VARIANTS = (
+        (SnippetViewSet, "snippets", {}),
+        (SnippetViewSet, "snippets", {"fields" : "id,title,language"}),
+        (SnippetViewSet, "snippets", {"exclude" : "highlighted,code"}),
+        (UploadFileViewSet, "uploads", {}),
+        (UploadFileViewSet, "uploads", {"exclude" : "extracted_files_info,file_metadata"}),
+        (UploadFileViewSet, "uploads", {"fields" : "id,file_name,download_url"}),
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type = int, default = 200)
+        parser.add_argument("--repeat", type = int, default = 20)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            user = AppUser.objects.create_user(employee_id = "BENCH0003", password = "Bench#Pass123",
+                                               email = "bench-sparse@example.com", first_name = "Bench", last_name = "Sparse",
+                                               secret_hint = "hint", secret_answer = "answer")
+            self._fill(user, options["rows"])
+
+            self.stdout.write(f"{'endpoint':<9} {'params':<45} {'bytes':>8} {'median ms':>10}")
+            for viewset, name, params in self.VARIANTS:
+                size, latency = self._measure(viewset, user, params, options["repeat"])
+                label = "&".join(f"{key}={value}" for key, value in params.items()) or "(full)"
+                self.stdout.write(f"{name:<9} {label:<45} {size:>8} {latency:>10.2f}")
+
+            transaction.set_rollback(True)
+
+    @staticmethod
+    def _fill(user, rows : int) -> None:
+        code = "\n".join(f"def handler_{line}(request):\n    return {{'line' : {line}, 'status' : 'ok'}}" for line in range(30))
+        with override_settings(SNIPPET_HIGHLIGHT_ASYNC = False):
+            for index in range(rows):
+                Snippet.objects.create(owner = user, title = f"Snippet {index}", code = f"# {index}\n{code}", linenos = True)
+
+        members = [{"name" : f"folder/file_{member}.txt", "size" : member * 128} for member in range(50)]
+        UploadFile.objects.bulk_create([
+            UploadFile(created_by = user.employee_id, file_name = f"archive_{index}.zip", mime_type = "application/zip",
+                       file_path = f"user_{user.employee_id}/archive_{index}.zip", file_object = f"uploaded/archive_{index}.zip",
+                       extracted_files_info = members, file_metadata = {"size" : 6400, "checksum" : "0" * 64})
+            for index in range(rows)])
+
+    @staticmethod
+    def _measure(viewset, user, params : dict, repeat : int):
+        view = viewset.as_view({"get" : "list"})
+        timings, size = [], 0
+        for _ in range(repeat):
+            request = APIRequestFactory().get("/", params, HTTP_HOST = "localhost")
+            force_authenticate(request, user = user)
+            started = perf_counter()
+            response = view(request)
+            response.render()
+            timings.append((perf_counter() - started) * 1000)
+            assert response.status_code == 200, response.data
+            size = len(response.content)
+        return size, median(timings)
@@ -0,0 +1,77 @@
+# Python base imports - Default ones
+import sys
+import subprocess
+from statistics import median
+
+# Dependent software imports
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app1.pygments_registry import build_registry, get_registry_path, write_registry
+
+
+# Runs in a fresh interpreter: app registry + serializers import, then reports whether the registry got loaded
+PROBE = ("import django; django.setup(); import app1.serializers; "
+         "from app1.pygments_registry import load_registry; print(load_registry.cache_info().currsize)")
+
+
+class Command(BaseCommand):
+    """
+    Pre-build the pygments language/style registry for the installed pygments version.
+
+    Run once per deploy (or after upgrading pygments) so no worker pays the build on boot:
+        python manage.py build_pygments_registry --runs 5
+
+    Then measures process startup the way `python -X importtime` sees it, in --runs fresh
+    interpreters (django.setup() + import app1.serializers):
+
+    - import time : sum of the top-level cumulative import times (median of the runs)
+    - pygments    : share of it spent importing pygments modules
+    - registry    : whether importing models / serializers loaded the registry (must be "no")
+    """
+
+    help = "Build the precomputed pygments registry used for Snippet language/style choices."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--runs", type = int, default = 5, help = "Fresh interpreters to measure startup in (0 = skip)")
+
+    def handle(self, *args, **options):
+        file_path = get_registry_path()
+        registry = build_registry()
+        write_registry(registry, file_path)
+        self.stdout.write(self.style.SUCCESS(
+            f"Wrote {len(registry['lexers'])} lexers and {len(registry['styles'])} styles to {file_path} "
+            f"({file_path.stat().st_size} bytes)"))
+
+        if options["runs"] <= 0:
+            return
+
+        totals, pygments, loaded = [], [], set()
+        for _ in range(options["runs"]):
+            total_us, pygments_us, registry_loaded = self._probe()
+            totals.append(total_us)
+            pygments.append(pygments_us)
+            loaded.add(registry_loaded)
+
+        self.stdout.write(f"Startup import time (median of {options['runs']}): {median(totals) / 1000:.1f} ms, "
+                          f"pygments {median(pygments) / 1000:.1f} ms, "
+                          f"registry loaded at import: {'yes' if True in loaded else 'no'}")
+
+    @staticmethod
+    def _probe():
+        result = subprocess.run([sys.executable, "-X", "importtime", "-c", PROBE], capture_output = True, text = True,
+                                cwd = settings.BASE_DIR, check = True)
+        total_us = pygments_us = 0
+        for line in result.stderr.splitlines():
+            # "import time: <self us> | <cumulative us> | <module, indented 2 spaces per nesting level>"
+            if not line.startswith("import time:"):
+                continue
+            self_us, cumulative_us, module = line[len("import time:") : ].split("|")
+            if not self_us.strip().isdigit():
+                continue  # column header
+            if not module[1 : ].startswith(" "):
+                total_us += int(cumulative_us)
+            if module.strip().split(".")[0] == "pygments":
+                pygments_us += int(self_us)
+        return total_us, pygments_us, result.stdout.strip().splitlines()[-1] != "0"
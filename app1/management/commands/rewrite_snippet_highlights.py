@@ -0,0 +1,111 @@
+# Python base imports - Default ones
+from typing import Dict
+
+# Dependent software imports
+from django.db.models import Sum
+from django.db.models.functions import Length
+from django.db import connection, transaction
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app1.models import HighlightArtifact, Snippet
+from app1.services.highlight_service import compute_highlight_hash, get_highlight_mode, render_highlight
+
+
+class Command(BaseCommand):
+    """
+    Re-render existing snippets into the configured SNIPPET_HIGHLIGHT_MODE.
+
+    Typical use after switching to fragment mode:
+        python manage.py rewrite_snippet_highlights --measure --prune-artifacts
+
+    Rows are processed in primary-key batches, one transaction per batch, and rows already
+    stored in the target mode are skipped - the command can be interrupted and re-run safely.
+    """
+
+    help = "Rewrite Snippet.highlighted into the configured SNIPPET_HIGHLIGHT_MODE (full document or fragment)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type = int, default = 500, help = "Rows rewritten per transaction")
+        parser.add_argument("--measure", action = "store_true", help = "Report snippet table size before and after")
+        parser.add_argument("--prune-artifacts", action = "store_true", help = "Delete highlight artifacts no snippet points to")
+
+    def handle(self, *args, **options):
+        mode = get_highlight_mode()
+        batch_size = options["batch_size"]
+
+        if options["measure"]:
+            before = self._measure()
+            self._report("Before", before)
+
+        # 🗄️ Rendered HTML per hash for this run (identical snippets render once)
+        rendered : Dict[str, str] = {}
+        rewritten = 0
+        last_pk = 0
+
+        fields = ("id", "code", "language", "style", "linenos", "title", "highlight_hash")
+        while True:
+            batch = list(Snippet.objects.filter(pk__gt = last_pk).order_by("pk").only(*fields)[ : batch_size])
+            if not batch:
+                break
+            last_pk = batch[-1].pk
+
+            changed = []
+            for snippet in batch:
+                content_hash = compute_highlight_hash(snippet.code, snippet.language, snippet.style,
+                                                      snippet.linenos, snippet.title, mode)
+                if content_hash == snippet.highlight_hash:
+                    continue
+
+                if content_hash not in rendered:
+                    html = HighlightArtifact.objects.filter(content_hash = content_hash).values_list("html", flat = True).first()
+                    if html is None:
+                        html = render_highlight(snippet.code, snippet.language, snippet.style, snippet.linenos, snippet.title, mode)
+                        HighlightArtifact.objects.get_or_create(content_hash = content_hash, defaults = {"html" : html})
+                    rendered[content_hash] = html
+
+                snippet.highlight_hash = content_hash
+                snippet.highlighted = rendered[content_hash]
+                changed.append(snippet)
+
+            with transaction.atomic():
+                Snippet.objects.bulk_update(changed, ["highlight_hash", "highlighted"])
+            rewritten += len(changed)
+            self.stdout.write(f"Processed up to id {last_pk}, rewritten so far: {rewritten}")
+
+        if options["prune_artifacts"]:
+            used = Snippet.objects.values("highlight_hash")
+            pruned, _ = HighlightArtifact.objects.exclude(content_hash__in = used).delete()
+            self.stdout.write(f"Pruned {pruned} unused highlight artifacts")
+
+        self.stdout.write(self.style.SUCCESS(f"Rewrote {rewritten} snippets into '{mode}' mode"))
+
+        if options["measure"]:
+            after = self._measure()
+            self._report("After", after)
+            if before["highlighted_chars"]:
+                saved = 100 * (1 - after["highlighted_chars"] / before["highlighted_chars"])
+                self.stdout.write(f"highlighted column shrank by {saved:.1f}%")
+            if connection.vendor == "postgresql":
+                self.stdout.write("NOTE - PostgreSQL only returns dead tuples to the OS after VACUUM FULL; "
+                                  "run it to see the on-disk size drop.")
+
+    def _measure(self) -> dict:
+        """Logical size of the highlighted column plus, on PostgreSQL, the physical table size"""
+        result = {
+            "rows" : Snippet.objects.count(),
+            "highlighted_chars" : Snippet.objects.aggregate(total = Sum(Length("highlighted")))["total"] or 0,
+            "table_bytes" : None,
+        }
+
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT pg_total_relation_size(%s)", [Snippet._meta.db_table])
+                result["table_bytes"] = cursor.fetchone()[0]
+        return result
+
+    def _report(self, label : str, stats : dict) -> None:
+        line = f"{label}: {stats['rows']} rows, highlighted column {stats['highlighted_chars']} chars"
+        if stats["table_bytes"] is not None:
+            line += f", table (incl. TOAST + indexes) {stats['table_bytes']} bytes"
+        self.stdout.write(line)
@@ -2,30 +2,29 @@
 
 # Dependent software imports
 from django.db import models
-from pygments import highlight
 from auditlog.registry import auditlog
-from pygments.lexers import get_all_lexers
-from pygments.styles import get_all_styles
-from pygments.lexers import get_lexer_by_name
 from auditlog.models import AuditlogHistoryField
-from pygments.formatters.html import HtmlFormatter
 from django.core.validators import MinLengthValidator
-from encrypted_model_fields.fields import EncryptedCharField, EncryptedEmailField
 
 # Custom created imports
 from app2.models import AuditModel
+from _utils.encrypted_fields import EncryptedCharField, EncryptedEmailField, LazyDecryptManager
+from app1.services.highlight_service import HighlightService, compute_highlight_hash
+from app1.pygments_registry import LazyChoices, get_language_choices, get_lexers, get_style_choices
 
-LEXERS = [item for item in get_all_lexers() if item[1]]
-LANGUAGE_CHOICES = sorted([(item[1][0], item[0]) for item in LEXERS])
-STYLE_CHOICES = sorted([(item, item) for item in get_all_styles()])
+# Loaded from the precomputed pygments registry on first use, never at import time
+LEXERS = LazyChoices(get_lexers)
+LANGUAGE_CHOICES = LazyChoices(get_language_choices)
+STYLE_CHOICES = LazyChoices(get_style_choices)
 
 
 class Snippet(AuditModel):
     title = models.CharField(max_length = 100, blank = True, default = "")
     code = models.TextField()
     linenos = models.BooleanField(default = False)
-    language = models.CharField(choices = LANGUAGE_CHOICES, default = "python", max_length = 100)
-    style = models.CharField(choices = STYLE_CHOICES, default = "friendly", max_length = 100)
+    # Callable choices (Django 5.0+) are only resolved when validation/forms need them
+    language = models.CharField(choices = get_language_choices, default = "python", max_length = 100)
+    style = models.CharField(choices = get_style_choices, default = "friendly", max_length = 100)
     
     owner = models.ForeignKey("app2.AppUser", related_name = "snippets", on_delete = models.CASCADE)
     highlighted = models.TextField(default = "")
@@ -33,23 +32,52 @@ class Snippet(AuditModel):
     results = EncryptedCharField(max_length = 60, default = "N/A")
     price = models.PositiveIntegerField(default = 0)
     
+    # Content address of `highlighted` (see HighlightArtifact), empty until first save
+    highlight_hash = models.CharField(max_length = 64, blank = True, default = "", db_index = True)
+    
+    # email / results stay encrypted on loaded instances until first read
+    objects = LazyDecryptManager()
+    
     def save(self, *args, **kwargs):
         """
-        Use the `pygments` library to create a highlighted HTML representation
-        of the code snippet.
+        Keep `highlighted` in sync with the code without blocking the request.
+        
+        - Nothing that affects rendering changed → no pygments work at all
+        - Same content already rendered (by any snippet) → reuse that artifact
+        - Otherwise → `highlighted` stays empty and a background render is scheduled
         """
+        content_hash = compute_highlight_hash(self.code, self.language, self.style, self.linenos, self.title)
+        needs_render = content_hash != self.highlight_hash or not self.highlighted
+        
+        if needs_render:
+            self.highlight_hash = content_hash
+            self.highlighted = HighlightService.get_artifact_html(content_hash) or ""
+            
+            update_fields = kwargs.get("update_fields")
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "highlight_hash", "highlighted"}
         
-        lexer = get_lexer_by_name(self.language)
-        linenos = "table" if self.linenos else False
-        options = {"title" : self.title} if self.title else {}
-        formatter = HtmlFormatter(style = self.style, linenos = linenos, full = True, **options) # type: ignore
-        self.highlighted = highlight(self.code, lexer, formatter)
         super().save(*args, **kwargs)
+        
+        if needs_render and not self.highlighted:
+            self.highlighted = HighlightService.schedule(content_hash, self.code, self.language, self.style, 
+                                                         self.linenos, self.title) or ""
     
     class Meta(AuditModel.Meta):
         ordering = ["created_date"]
 
 
+class HighlightArtifact(AuditModel):
+    """
+    Rendered pygments output shared by every snippet with the same content hash.
+    """
+    content_hash = models.CharField(max_length = 64, unique = True)
+    html = models.TextField()
+    
+    def __str__(self) -> str:
+        return self.content_hash
+
+
 class Question(AuditModel):
     question_text = models.CharField(max_length = 200)
     pub_date = models.DateTimeField("date published")
@@ -57,6 +85,9 @@ class Question(AuditModel):
     
     class Meta(AuditModel.Meta):
         ordering = ["id"]
+        
+        # Serves QuestionViewSet's keyset pages: ORDER BY created_date DESC, id DESC
+        indexes = [models.Index(fields = ["-created_date", "-id"], name = "idx_question_created_id")]
 
 
 class Choice(AuditModel):
@@ -66,6 +97,9 @@ class Choice(AuditModel):
     
     class Meta(AuditModel.Meta):
         ordering = ["id"]
+        
+        # Serves ChoiceViewSet's keyset pages: ORDER BY choice_text DESC, id DESC
+        indexes = [models.Index(fields = ["-choice_text", "-id"], name = "idx_choice_text_id")]
 
 
 class Answers(AuditModel):
@@ -92,6 +126,10 @@ class Answers(AuditModel):
         # of the returned rows.
         # -------------------------------------------------------------------------------------------------------------
         ordering = ["id"]
+        
+        # Keyset pages of AnswersViewSet (ORDER BY id) are served by the primary key index, plus
+        # (choice, id) for answers listed per choice in id order
+        indexes = [models.Index(fields = ["choice", "id"], name = "idx_answers_choice_id")]
 
 
 def custom_mask(value : str) -> str:
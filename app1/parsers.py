@@ -0,0 +1,41 @@
+# Python base imports - Default ones
+import json
+
+# Dependent software imports
+from rest_framework.parsers import BaseParser
+from rest_framework.exceptions import ParseError
+
+# Custom created imports
+
+
+class NDJSONParser(BaseParser):
+    """
+    Newline-delimited JSON (one object per line) for streaming bulk uploads.
+
+    Returns a generator instead of a list: lines are decoded as the view consumes them, so
+    a large upload never has to be held in memory as one parsed document. A malformed line
+    does not abort the upload - it is yielded as a `ParseError` for the caller to report.
+    """
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type = None, parser_context = None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        return self._iter_items(stream, encoding)
+
+    @staticmethod
+    def _iter_items(stream, encoding):
+        if stream is None:
+            return
+
+        for line_number, raw_line in enumerate(stream, start = 1):
+            line = raw_line.decode(encoding).strip() if isinstance(raw_line, bytes) else raw_line.strip()
+
+            # Blank lines (e.g. trailing newline) carry no item
+            if not line:
+                continue
+
+            try:
+                yield json.loads(line)
+            except ValueError as e:
+                yield ParseError(f"Line {line_number}: invalid JSON ({e})")
@@ -17,4 +17,5 @@ class IsOwnerOrReadOnly(permissions.BasePermission):
             return True
         
         # Write permissions are only allowed to the owner of the snippet
-        return obj.owner == request.user
\ No newline at end of file
+        # Compare keys - `obj.owner` would load (and decrypt) the owner row on every write
+        return obj.owner_id == request.user.pk
\ No newline at end of file
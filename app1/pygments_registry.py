@@ -0,0 +1,151 @@
+# Python base imports - Default ones
+import json
+import logging
+from pathlib import Path
+from os import chmod, replace
+from functools import lru_cache
+from tempfile import NamedTemporaryFile
+from collections.abc import Sequence
+from typing import Callable, Dict, FrozenSet, List, Tuple
+
+# Dependent software imports
+from django.conf import settings
+from pygments import __version__ as pygments_version
+
+# Custom created imports
+
+
+logger = logging.getLogger(__name__)
+
+# ------------------------------------------------------------
+# Precomputed pygments language / style registry
+# ------------------------------------------------------------
+# Purpose:
+#   get_all_lexers() walks every pygments plugin entry point and
+#   get_all_styles() imports every style module (~0.5s per process).
+#   Doing that at import time of app1.models slowed down every worker
+#   boot, management command and test run.
+#
+# Mechanism:
+#   - The registry is built ONCE per pygments version and stored as a
+#     compact JSON file: <registry dir>/pygments-<version>.json
+#   - Processes only read that file, and only on first use
+#   - LazyChoices defers even the file read until choices are needed
+#
+# Pre-build at deploy time with:
+#   python manage.py build_pygments_registry
+# ------------------------------------------------------------
+
+# Bump when the file layout changes so stale files get rebuilt
+REGISTRY_FORMAT = 1
+
+DEFAULT_REGISTRY_DIR = Path(__file__).resolve().parent / "pygments_registry"
+
+
+def get_registry_path() -> Path:
+    registry_dir = Path(getattr(settings, "PYGMENTS_REGISTRY_DIR", DEFAULT_REGISTRY_DIR))
+    return registry_dir / f"pygments-{pygments_version}.json"
+
+
+def build_registry() -> Dict:
+    """Walk pygments (slow path) and return the registry content"""
+    from pygments.lexers import get_all_lexers
+    from pygments.styles import get_all_styles
+
+    return {
+        "format" : REGISTRY_FORMAT,
+        "pygments" : pygments_version,
+
+        # [name, [aliases...]] - only lexers reachable by alias are usable in Snippet.language
+        "lexers" : [[name, list(aliases)] for name, aliases, _, _ in get_all_lexers() if aliases],
+        "styles" : sorted(get_all_styles()),
+    }
+
+
+def write_registry(registry : Dict, file_path : Path) -> None:
+    """Atomic write - concurrent workers never read a half written file"""
+    file_path.parent.mkdir(parents = True, exist_ok = True)
+    with NamedTemporaryFile("w", dir = file_path.parent, suffix = ".tmp", delete = False, encoding = "utf-8") as tmp:
+        json.dump(registry, tmp, separators = (",", ":"))
+
+    # NamedTemporaryFile creates 0600 files, workers may run as another user
+    chmod(tmp.name, 0o644)
+    replace(tmp.name, file_path)
+
+
+@lru_cache(maxsize = 1)
+def load_registry() -> Dict:
+    """
+    Registry for the installed pygments version.
+
+    Reads the on-disk file when present and current, otherwise builds it and tries to
+    persist it for the next process (a read-only filesystem only costs the rebuild).
+    """
+    file_path = get_registry_path()
+    try:
+        with open(file_path, encoding = "utf-8") as registry_file:
+            registry = json.load(registry_file)
+        if registry.get("format") == REGISTRY_FORMAT and registry.get("pygments") == pygments_version:
+            return registry
+        logger.info(f"Stale pygments registry {file_path}, rebuilding")
+    except FileNotFoundError:
+        logger.info(f"No pygments registry at {file_path}, building it")
+    except (OSError, ValueError) as e:
+        logger.warning(f"Unreadable pygments registry {file_path} ({e}), rebuilding")
+
+    registry = build_registry()
+    try:
+        write_registry(registry, file_path)
+    except OSError as e:
+        logger.warning(f"Could not persist pygments registry to {file_path} ({e})")
+    return registry
+
+
+class LazyChoices(Sequence):
+    """
+    Read-only choices sequence computed on first access.
+
+    Behaves like the list of (value, label) tuples it replaces (iteration, len, indexing,
+    `in`), and exposes `values` for O(1) membership checks on the stored value.
+    """
+
+    def __init__(self, loader : Callable[[], List[Tuple]]):
+        self._loader = loader
+        self._items = None
+        self._values = None
+
+    def _get_items(self) -> List[Tuple]:
+        if self._items is None:
+            self._items = self._loader()
+        return self._items
+
+    def __getitem__(self, index):
+        return self._get_items()[index]
+
+    def __len__(self) -> int:
+        return len(self._get_items())
+
+    def __iter__(self):
+        return iter(self._get_items())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._items is not None else "not loaded"
+        return f"<{self.__class__.__name__} {state}>"
+
+    @property
+    def values(self) -> FrozenSet:
+        if self._values is None:
+            self._values = frozenset(item[0] for item in self._get_items())
+        return self._values
+
+
+def get_lexers() -> List[Tuple]:
+    return [(name, tuple(aliases)) for name, aliases in load_registry()["lexers"]]
+
+
+def get_language_choices() -> List[Tuple[str, str]]:
+    return sorted((aliases[0], name) for name, aliases in load_registry()["lexers"])
+
+
+def get_style_choices() -> List[Tuple[str, str]]:
+    return [(style, style) for style in load_registry()["styles"]]
@@ -2,16 +2,40 @@
 
 # Dependent software imports
 from rest_framework import serializers
+from rest_framework.fields import flatten_choices_dict, to_choices_dict
 # from django.contrib.auth.models import User
 from django.contrib.auth import get_user_model
 
 # Custom created imports
 from app1.models import LANGUAGE_CHOICES, STYLE_CHOICES, Question, Choice, Answers, Snippet
 from app2.models import AppUser
+from _utils.sparse_fieldsets import SparseFieldsetSerializerMixin
 
 User = get_user_model()
 
-class SnippetSerializer(serializers.Serializer):
+
+class LazyChoiceField(serializers.ChoiceField):
+    """
+    ChoiceField that resolves its choices on first use (validation, rendering, schema), not when
+    the serializer class is declared - LANGUAGE_CHOICES / STYLE_CHOICES stay unloaded on import.
+    """
+
+    def _set_choices(self, choices):
+        self._lazy_choices = choices
+        self._resolved_choices = None
+
+    def _resolve_choices(self):
+        if self._resolved_choices is None:
+            grouped_choices = to_choices_dict(self._lazy_choices)
+            choices = flatten_choices_dict(grouped_choices)
+            self._resolved_choices = (grouped_choices, choices, {str(key) : key for key in choices})
+        return self._resolved_choices
+
+    choices = property(lambda self : self._resolve_choices()[1], _set_choices)
+    grouped_choices = property(lambda self : self._resolve_choices()[0])
+    choice_strings_to_values = property(lambda self : self._resolve_choices()[2])
+
+class SnippetSerializer(SparseFieldsetSerializerMixin, serializers.Serializer):
     id = serializers.IntegerField(read_only = True)
     title = serializers.CharField(required = False, allow_blank = True, max_length = 100)
     
@@ -21,16 +45,17 @@ class SnippetSerializer(serializers.Serializer):
     code = serializers.CharField(style = {"base_template" : "textarea.html"})
     
     linenos = serializers.BooleanField(required = False)
-    language = serializers.ChoiceField(choices = LANGUAGE_CHOICES, default = "python")
-    style = serializers.ChoiceField(choices = STYLE_CHOICES, default = "friendly")
+    language = LazyChoiceField(choices = LANGUAGE_CHOICES, default = "python")
+    style = LazyChoiceField(choices = STYLE_CHOICES, default = "friendly")
     highlighted = serializers.CharField(read_only = True, max_length = 1000)
     email = serializers.EmailField()
     results = serializers.CharField(max_length = 1000)
     price = serializers.IntegerField()
     
     # To handle foreign key - specify the related model/queryset
+    # only("id") → validating an owner fetches the key alone, none of the encrypted columns get decrypted
     owner_id = serializers.PrimaryKeyRelatedField(
-        queryset = AppUser.objects.all(),  # Replace User with your actual model
+        queryset = AppUser.objects.only("id"),  # Replace User with your actual model
         # write_only = True  # Use write_only if you don't want to expose it on GET
     )
     
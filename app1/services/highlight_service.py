@@ -0,0 +1,292 @@
+# Python base imports - Default ones
+import logging
+from copy import copy
+from hashlib import sha256
+from threading import Lock
+from functools import lru_cache
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor
+
+# Dependent software imports
+from pygments.lexer import Lexer
+from django.conf import settings
+from django.utils.html import escape
+from pygments.lexers import get_lexer_by_name
+from django.db import connections, transaction
+from pygments import highlight, __version__ as pygments_version
+from pygments.formatters.html import HtmlFormatter
+
+# Custom created imports
+
+
+logger = logging.getLogger(__name__)
+
+
+# 🗂️ STORAGE MODES
+#   "full"     → every row stores a complete HTML document with the style's CSS inlined
+#   "fragment" → rows store only the highlighted body, CSS is served once per style (see get_style_css)
+FULL_MODE = "full"
+FRAGMENT_MODE = "fragment"
+
+
+def get_highlight_mode() -> str:
+    return getattr(settings, "SNIPPET_HIGHLIGHT_MODE", FULL_MODE)
+
+
+def style_css_class(style : str) -> str:
+    """Wrapper class of a fragment, unique per style so several styles can share one page"""
+    return f"highlight-{style}"
+
+
+@lru_cache(maxsize = None)
+def get_style_css(style : str) -> str:
+    """
+    Stylesheet for one pygments style, generated once per process.
+
+    Selectors are scoped to `style_css_class(style)` so fragments rendered with
+    different styles never pick up each other's colours.
+    """
+    return HtmlFormatter(style = style, cssclass = style_css_class(style)).get_style_defs(f".{style_css_class(style)}")
+
+
+def get_style_version() -> str:
+    """Cache-busting token for stylesheet URLs - CSS only changes with the pygments release"""
+    return pygments_version
+
+
+def compute_highlight_hash(code : str, language : str, style : str, linenos : bool, title : str, mode : Optional[str] = None) -> str:
+    """
+    Content address of a rendered snippet.
+
+    Only the inputs that change the pygments output take part in the hash, so edits to
+    `price`, `email` or `results` never invalidate an already rendered artifact. The
+    storage mode is part of the address so full and fragment artifacts never mix.
+    """
+    digest = sha256()
+    for part in (mode or get_highlight_mode(), language, style, "1" if linenos else "0", title or "", code):
+        digest.update(part.encode("utf-8"))
+
+        # Separator keeps ("ab", "c") and ("a", "bc") from colliding
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class HighlighterCache:
+    """
+    ⚡ BOUNDED LRU CACHE OF (lexer, formatter) PAIRS
+
+    get_lexer_by_name() re-resolves the lexer class and HtmlFormatter() rebuilds the style's
+    token → CSS tables on every call; bulk imports paid that per row. Entries are keyed by
+    (language, style, linenos, title-present, mode) and shared by all threads - lexers keep no
+    per-call state and cached formatters are never mutated (titled ones are shallow copies).
+
+    USAGE:
+    HighlighterCache.info() → {"hits" : 2990, "misses" : 10, "size" : 10, "maxsize" : 128}
+    """
+
+    _entries : "OrderedDict[Tuple, Tuple[Lexer, HtmlFormatter]]" = OrderedDict()
+    _lock = Lock()
+    hits = 0
+    misses = 0
+
+    @staticmethod
+    def get_maxsize() -> int:
+        return getattr(settings, "SNIPPET_HIGHLIGHT_CACHE_SIZE", 128)
+
+    @classmethod
+    def get(cls, language : str, style : str, linenos : bool, title_present : bool, mode : str) -> Tuple[Lexer, HtmlFormatter]:
+        key = (language, style, bool(linenos), bool(title_present), mode)
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                cls._entries.move_to_end(key)
+                cls.hits += 1
+                return entry
+            cls.misses += 1
+
+        # Build outside the lock - a concurrent miss on the same key only wastes one build
+        entry = (get_lexer_by_name(language), cls._build_formatter(style, linenos, mode))
+        with cls._lock:
+            cls._entries[key] = entry
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > cls.get_maxsize():
+                cls._entries.popitem(last = False)
+        return entry
+
+    @staticmethod
+    def _build_formatter(style : str, linenos : bool, mode : str) -> HtmlFormatter:
+        linenos_option = "table" if linenos else False
+        if mode == FRAGMENT_MODE:
+            # Title lives in the page wrapper (see wrap_fragment), CSS in the shared stylesheet
+            return HtmlFormatter(style = style, linenos = linenos_option, cssclass = style_css_class(style)) # type: ignore
+        return HtmlFormatter(style = style, linenos = linenos_option, full = True) # type: ignore
+
+    @classmethod
+    def info(cls) -> Dict[str, int]:
+        with cls._lock:
+            return {"hits" : cls.hits, "misses" : cls.misses, "size" : len(cls._entries), "maxsize" : cls.get_maxsize()}
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls.hits = 0
+            cls.misses = 0
+
+
+def render_highlight(code : str, language : str, style : str, linenos : bool, title : str, mode : str = FULL_MODE) -> str:
+    """
+    Use the `pygments` library to create a highlighted HTML representation of the code snippet.
+
+    Kept as a plain module level function so it can be shipped to any executor (thread or process).
+    """
+    lexer, formatter = HighlighterCache.get(language, style, linenos, bool(title), mode)
+
+    # Full documents embed the title - give this call its own shallow copy, style tables stay shared
+    if title and mode != FRAGMENT_MODE:
+        formatter = copy(formatter)
+        formatter.title = title
+    return highlight(code, lexer, formatter)
+
+
+def is_full_document(html : str) -> bool:
+    """Rows written before fragment mode (or with mode "full") already carry their own CSS"""
+    return html.lstrip().startswith("<!DOCTYPE")
+
+
+def wrap_fragment(fragment : str, title : str, stylesheet_url : str) -> str:
+    """Turn a stored fragment into a standalone page linking the shared, cacheable stylesheet"""
+    escaped_title = escape(title or "")
+    heading = f"<h2>{escaped_title}</h2>\n" if title else ""
+    return ("<!DOCTYPE html>\n<html>\n<head>\n"
+            f"<title>{escaped_title}</title>\n"
+            '<meta http-equiv="content-type" content="text/html; charset=utf-8">\n'
+            f'<link rel="stylesheet" href="{escape(stylesheet_url)}">\n'
+            f"</head>\n<body>\n{heading}{fragment}</body>\n</html>\n")
+
+
+class HighlightService:
+    """
+    🎨 CONTENT-ADDRESSED HIGHLIGHT RENDERING PIPELINE
+
+    LIFECYCLE:
+    1. Snippet.save() → computes content hash, skips everything if unchanged
+    2. Artifact already rendered for that hash? → copied onto the snippet, no pygments call
+    3. Otherwise → render job scheduled on a background pool AFTER the transaction commits
+    4. Worker renders ONCE per hash, stores `HighlightArtifact` and fills every snippet sharing it
+
+    Identical snippets submitted concurrently share one in-flight job.
+    """
+
+    # 🧵 Lazily created pool (no threads are started at import time)
+    _executor : Optional[ThreadPoolExecutor] = None
+
+    # 🔄 Hashes currently being rendered → their future
+    _in_flight : Dict[str, Future] = {}
+
+    _lock = Lock()
+
+    @classmethod
+    def _get_executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(max_workers = getattr(settings, "SNIPPET_HIGHLIGHT_WORKERS", 2),
+                                                   thread_name_prefix = "snippet-highlight")
+            return cls._executor
+
+    @staticmethod
+    def is_async() -> bool:
+        """Synchronous rendering stays available for management commands and debugging"""
+        return getattr(settings, "SNIPPET_HIGHLIGHT_ASYNC", True)
+
+    @staticmethod
+    def get_artifact_html(content_hash : str) -> Optional[str]:
+        """Return the rendered HTML stored for `content_hash`, if any"""
+        from app1.models import HighlightArtifact
+
+        return HighlightArtifact.objects.filter(content_hash = content_hash).values_list("html", flat = True).first()
+
+    @classmethod
+    def schedule(cls, content_hash : str, code : str, language : str, style : str, linenos : bool, title : str) -> Optional[str]:
+        """
+        Queue a render for `content_hash` once the surrounding transaction commits.
+
+        Deferring to on_commit guarantees the worker sees the snippet row it has to update.
+        Returns the HTML straight away only when async rendering is disabled.
+        """
+        if not cls.is_async():
+            return cls._render_and_store(content_hash, code, language, style, linenos, title)
+
+        transaction.on_commit(lambda: cls._submit(content_hash, code, language, style, linenos, title))
+        return None
+
+    @classmethod
+    def is_rendering(cls, content_hash : str) -> bool:
+        with cls._lock:
+            return content_hash in cls._in_flight
+
+    @classmethod
+    def _submit(cls, content_hash : str, code : str, language : str, style : str, linenos : bool, title : str) -> None:
+        executor = cls._get_executor()
+        with cls._lock:
+            # 🤝 Identical snippet already rendering → share that job
+            if content_hash in cls._in_flight:
+                return
+
+            future = executor.submit(cls._run_job, content_hash, code, language, style, linenos, title)
+            cls._in_flight[content_hash] = future
+
+    @classmethod
+    def _run_job(cls, content_hash : str, code : str, language : str, style : str, linenos : bool, title : str) -> None:
+        try:
+            cls._render_and_store(content_hash, code, language, style, linenos, title)
+        except Exception:
+            logger.exception(f"Highlight rendering failed for hash {content_hash}")
+        finally:
+            with cls._lock:
+                cls._in_flight.pop(content_hash, None)
+
+            # Worker threads own their DB connections, release them after every job
+            connections.close_all()
+
+    @classmethod
+    def _render_and_store(cls, content_hash : str, code : str, language : str, style : str, linenos : bool, title : str) -> str:
+        from app1.models import HighlightArtifact, Snippet
+
+        html = cls.get_artifact_html(content_hash)
+        if html is None:
+            html = render_highlight(code, language, style, linenos, title, get_highlight_mode())
+            HighlightArtifact.objects.get_or_create(content_hash = content_hash, defaults = {"html" : html})
+
+        # 📝 Fill every pending snippet pointing at this artifact (bypasses save() on purpose)
+        Snippet.objects.filter(highlight_hash = content_hash, highlighted = "").update(highlighted = html)
+        return html
+
+    @classmethod
+    def get_or_schedule(cls, snippet) -> Optional[str]:
+        """
+        🎯 READ PATH used by the highlight endpoints
+
+        RETURNS:
+        - Rendered HTML when available (snippet column or shared artifact)
+        - None while the render is still pending (a job is (re)queued if none is running)
+        """
+        if snippet.highlighted:
+            return snippet.highlighted
+
+        content_hash = snippet.highlight_hash or compute_highlight_hash(snippet.code, snippet.language, snippet.style,
+                                                                        snippet.linenos, snippet.title)
+        html = cls.get_artifact_html(content_hash)
+        if html is not None:
+            return html
+
+        # ♻️ Job lost (worker restart, failed render) → queue it again
+        if cls.is_rendering(content_hash):
+            return None
+
+        if not snippet.highlight_hash:
+            snippet.highlight_hash = content_hash
+            type(snippet).objects.filter(pk = snippet.pk).update(highlight_hash = content_hash)
+
+        return cls.schedule(content_hash, snippet.code, snippet.language, snippet.style, snippet.linenos, snippet.title)
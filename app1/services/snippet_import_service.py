@@ -0,0 +1,160 @@
+# Python base imports - Default ones
+import logging
+from threading import Lock
+from itertools import islice
+from typing import Dict, Iterable, List, Optional
+from concurrent.futures import ProcessPoolExecutor
+
+# Dependent software imports
+from django.conf import settings
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+# Custom created imports
+from app1.models import HighlightArtifact, Snippet
+from app1.serializers import SnippetSerializer
+from _utils.process_pool import create_process_pool
+from app1.services.highlight_service import compute_highlight_hash, get_highlight_mode, render_highlight
+
+
+logger = logging.getLogger(__name__)
+
+
+class SnippetImportService:
+    """
+    📦 BULK SNIPPET IMPORT
+
+    WHY THIS CLASS EXISTS:
+    One POST per snippet pays, per row: request + auth, serializer validation with an owner
+    lookup query, a pygments render, field encryption, one INSERT and one auditlog entry.
+
+    PER CHUNK (default 500 items) THIS DOES INSTEAD:
+    1. Validate every item with SnippetSerializer(many = True)'s child → per-item errors, no abort
+    2. ONE query for already rendered artifacts, render only unique missing content
+       (in a process pool once the chunk has enough of it)
+    3. ONE bulk_create for artifacts + ONE bulk_create for snippets (encryption still applies)
+
+    All chunks are written inside a single transaction. Note that bulk_create sends no
+    post_save signals, so imported rows get no per-row auditlog entry.
+    """
+
+    # 🧵 Lazily created pool (no processes at import time; workers are never forked from the web worker)
+    _executor : Optional[ProcessPoolExecutor] = None
+    _lock = Lock()
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = create_process_pool(max_workers = getattr(settings, "SNIPPET_BULK_RENDER_PROCESSES", 2))
+            return cls._executor
+
+    @staticmethod
+    def get_default_chunk_size() -> int:
+        return getattr(settings, "SNIPPET_BULK_IMPORT_CHUNK_SIZE", 500)
+
+    @staticmethod
+    def get_max_chunk_size() -> int:
+        return getattr(settings, "SNIPPET_BULK_IMPORT_MAX_CHUNK_SIZE", 5000)
+
+    @classmethod
+    def import_items(cls, items : Iterable, owner, context : Optional[Dict] = None, chunk_size : Optional[int] = None) -> Dict:
+        """
+        🎯 MAIN ENTRY POINT
+
+        `items` may be a list (JSON array body) or any iterator (NDJSON stream). Entries that
+        are exceptions (e.g. a malformed NDJSON line) are reported as errors for their index.
+
+        RETURNS:
+        ```
+        {
+            "created" : 998,
+            "failed" : 2,
+            "ids" : [101, 102, ...],
+            "errors" : [{"index" : 7, "errors" : {"code" : ["This field is required."]}}]
+        }
+        ```
+        """
+        chunk_size = max(1, min(chunk_size or cls.get_default_chunk_size(), cls.get_max_chunk_size()))
+
+        serializer = SnippetSerializer(many = True, context = context or {})
+        validator = serializer.child
+
+        # Ownership is always the importing user - drop owner_id so validation does not
+        # run one AppUser lookup per item (same rule as SnippetViewSet.perform_create)
+        validator.fields.pop("owner_id", None)
+
+        ids : List[int] = []
+        errors : List[Dict] = []
+        offset = 0
+        iterator = iter(items)
+
+        with transaction.atomic():
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+
+                valid = []
+                for index, item in enumerate(chunk, start = offset):
+                    if isinstance(item, Exception):
+                        errors.append({"index" : index, "errors" : {"non_field_errors" : [str(item)]}})
+                        continue
+                    try:
+                        valid.append(validator.run_validation(item))
+                    except ValidationError as e:
+                        errors.append({"index" : index, "errors" : e.detail})
+
+                ids.extend(cls._write_chunk(valid, owner))
+                offset += len(chunk)
+
+        logger.info(f"Bulk snippet import by {owner}: {len(ids)} created, {len(errors)} failed")
+        return {"created" : len(ids), "failed" : len(errors), "ids" : ids, "errors" : errors}
+
+    @classmethod
+    def _write_chunk(cls, validated_items : List[Dict], owner) -> List[int]:
+        if not validated_items:
+            return []
+
+        mode = get_highlight_mode()
+        snippets = []
+        for data in validated_items:
+            data.pop("owner_id", None)
+            snippet = Snippet(owner = owner, **data)
+            snippet.highlight_hash = compute_highlight_hash(snippet.code, snippet.language, snippet.style,
+                                                            snippet.linenos, snippet.title, mode)
+            snippets.append(snippet)
+
+        rendered = cls._render_missing(snippets, mode)
+        for snippet in snippets:
+            snippet.highlighted = rendered[snippet.highlight_hash]
+
+        created = Snippet.objects.bulk_create(snippets)
+        return [snippet.pk for snippet in created]
+
+    @classmethod
+    def _render_missing(cls, snippets : List[Snippet], mode : str) -> Dict[str, str]:
+        """Hash → HTML for every snippet in the chunk, rendering each unknown hash once"""
+        unique = {snippet.highlight_hash : snippet for snippet in snippets}
+        rendered = dict(HighlightArtifact.objects.filter(content_hash__in = list(unique)).values_list("content_hash", "html"))
+
+        missing = [unique[content_hash] for content_hash in unique if content_hash not in rendered]
+        if not missing:
+            return rendered
+
+        args = ([s.code for s in missing], [s.language for s in missing], [s.style for s in missing],
+                [s.linenos for s in missing], [s.title for s in missing], [mode] * len(missing))
+
+        # The pool only pays off once there is enough CPU work to spread
+        if len(missing) >= getattr(settings, "SNIPPET_BULK_RENDER_MIN_PARALLEL", 32):
+            html_list = list(cls._get_executor().map(render_highlight, *args, chunksize = 16))
+        else:
+            html_list = list(map(render_highlight, *args))
+
+        artifacts = []
+        for snippet, html in zip(missing, html_list):
+            rendered[snippet.highlight_hash] = html
+            artifacts.append(HighlightArtifact(content_hash = snippet.highlight_hash, html = html))
+
+        HighlightArtifact.objects.bulk_create(artifacts, ignore_conflicts = True)
+        return rendered
@@ -1,3 +1,337 @@
-from django.test import TestCase
+# Python base imports - Default ones
+import csv
+import json
+from io import StringIO
+from unittest.mock import Mock, patch
 
-# Create your tests here.
+# Dependent software imports
+from django.urls import reverse
+from django.core.management import call_command
+from rest_framework.test import APIRequestFactory, APITestCase, force_authenticate
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.exceptions import ValidationError
+
+# Custom created imports
+from app2.models import AppUser
+from app1.views import SnippetViewSet
+from app1.models import HighlightArtifact, Snippet
+from app1.serializers import LazyChoiceField
+from app1.pygments_registry import LazyChoices
+from app1.services.snippet_import_service import SnippetImportService
+from app1.services.highlight_service import (FRAGMENT_MODE, FULL_MODE, HighlighterCache, HighlightService, compute_highlight_hash,
+                                              is_full_document, render_highlight, style_css_class)
+
+
+class HighlightPipelineTests(TestCase):
+    """Content-addressed highlights: no re-render for unrelated edits, one artifact per content, renders after commit"""
+
+    CODE = "def handler(request):\n    return 42\n"
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0101", password = "Render#Pass123", email = "emp101@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+        self.addCleanup(HighlightService._in_flight.clear)
+
+    def _snippet(self, **fields) -> Snippet:
+        return Snippet.objects.create(owner = self.user, code = self.CODE, **fields)
+
+    @override_settings(SNIPPET_HIGHLIGHT_ASYNC = False)
+    def test_unrelated_edits_do_not_re_render(self):
+        snippet = self._snippet(title = "Handler")
+        rendered_hash = snippet.highlight_hash
+        self.assertTrue(snippet.highlighted)
+
+        with patch("app1.services.highlight_service.render_highlight") as render:
+            snippet.price, snippet.results = 10, "passed"
+            snippet.save()
+        render.assert_not_called()
+
+        snippet.refresh_from_db()
+        self.assertEqual(snippet.highlight_hash, rendered_hash)
+        self.assertTrue(snippet.highlighted)
+
+    @override_settings(SNIPPET_HIGHLIGHT_ASYNC = False)
+    def test_identical_content_shares_one_artifact(self):
+        with patch("app1.services.highlight_service.render_highlight", wraps = render_highlight) as render:
+            first, second = self._snippet(), self._snippet(price = 5)
+        render.assert_called_once()
+
+        self.assertEqual(first.highlight_hash, second.highlight_hash)
+        self.assertEqual(HighlightArtifact.objects.filter(content_hash = first.highlight_hash).count(), 1)
+        self.assertEqual(Snippet.objects.get(pk = second.pk).highlighted, first.highlighted)
+
+    @override_settings(SNIPPET_HIGHLIGHT_ASYNC = True)
+    def test_render_is_queued_after_commit_and_deduplicated(self):
+        executor = Mock()
+        with patch.object(HighlightService, "_get_executor", return_value = executor):
+            with self.captureOnCommitCallbacks(execute = False) as callbacks:
+                first, second = self._snippet(), self._snippet()
+            # Nothing is submitted while the transaction is open
+            executor.submit.assert_not_called()
+            self.assertEqual((first.highlighted, len(callbacks)), ("", 2))
+
+            for callback in callbacks:
+                callback()
+        # Same content hash → one in-flight job
+        executor.submit.assert_called_once()
+        self.assertTrue(HighlightService.is_rendering(first.highlight_hash))
+
+    @override_settings(SNIPPET_HIGHLIGHT_ASYNC = True)
+    def test_highlight_action_answers_202_until_rendered(self):
+        with self.captureOnCommitCallbacks(execute = False):
+            snippet = self._snippet(title = "Pending")
+        view = SnippetViewSet.as_view({"get" : "highlight"})
+
+        def get():
+            request = APIRequestFactory().get("/", HTTP_HOST = "localhost")
+            force_authenticate(request, user = self.user)
+            response = view(request, pk = snippet.pk)
+            response.render()
+            return response
+
+        with self.captureOnCommitCallbacks(execute = False):
+            response = get()
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response["Retry-After"], "1")
+
+        # The background job's work, run inline
+        HighlightService._render_and_store(snippet.highlight_hash, snippet.code, snippet.language, snippet.style,
+                                           snippet.linenos, snippet.title)
+        response = get()
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("handler", response.content.decode())
+        self.assertIn("<title>Pending</title>", response.content.decode())
+
+
+@override_settings(SNIPPET_HIGHLIGHT_CACHE_SIZE = 2)
+class HighlighterCacheTests(SimpleTestCase):
+    """Bounded LRU of (lexer, formatter) pairs, counters, titled renders never touch the cached formatter"""
+
+    def setUp(self):
+        HighlighterCache.clear()
+        self.addCleanup(HighlighterCache.clear)
+
+    @staticmethod
+    def _get(language : str):
+        return HighlighterCache.get(language, "friendly", False, False, FRAGMENT_MODE)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        python = self._get("python")
+        self._get("sql")
+        self.assertIs(self._get("python"), python)  # hit → python becomes most recent
+        self._get("bash")                            # evicts sql, not python
+
+        self.assertEqual(HighlighterCache.info(), {"hits" : 1, "misses" : 3, "size" : 2, "maxsize" : 2})
+        self.assertIs(self._get("python"), python)
+        self._get("sql")
+        self.assertEqual(HighlighterCache.info()["misses"], 4)
+
+        HighlighterCache.clear()
+        self.assertEqual(HighlighterCache.info(), {"hits" : 0, "misses" : 0, "size" : 0, "maxsize" : 2})
+
+    def test_titled_render_leaves_cached_formatter_untouched(self):
+        first = render_highlight("print(1)\n", "python", "friendly", False, "First title", FULL_MODE)
+        second = render_highlight("print(2)\n", "python", "friendly", False, "Second title", FULL_MODE)
+
+        _, formatter = HighlighterCache.get("python", "friendly", False, True, FULL_MODE)
+        self.assertEqual(formatter.title, "")
+        self.assertIn("First title", first)
+        self.assertIn("Second title", second)
+        self.assertNotIn("First title", second)
+        self.assertEqual(HighlighterCache.info()["misses"], 1)
+
+
+class SnippetStylesheetTests(TestCase):
+    """Fragment mode: shared per-style CSS with long-lived cache headers, no CSS in the rows"""
+
+    def test_stylesheet_is_cacheable_forever(self):
+        response = self.client.get(reverse("snippet-stylesheet", kwargs = {"style" : "friendly"}), HTTP_HOST = "localhost")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/css; charset=utf-8")
+        cache_control = {part.strip() for part in response["Cache-Control"].split(",")}
+        self.assertTrue({"immutable", "max-age=31536000", "public"} <= cache_control)
+        self.assertIn(f".{style_css_class('friendly')}", response.content.decode())
+
+    def test_unknown_style_is_404(self):
+        response = self.client.get(reverse("snippet-stylesheet", kwargs = {"style" : "no-such-style"}), HTTP_HOST = "localhost")
+        self.assertEqual(response.status_code, 404)
+
+    def test_fragments_carry_no_css(self):
+        html = render_highlight("print(1)\n", "python", "friendly", True, "Title", FRAGMENT_MODE)
+        self.assertNotIn("<style", html)
+        self.assertFalse(is_full_document(html))
+        self.assertIn(f'class="{style_css_class("friendly")}"', html)
+
+
+@override_settings(SNIPPET_HIGHLIGHT_ASYNC = False)
+class RewriteSnippetHighlightsTests(TestCase):
+    """rewrite_snippet_highlights: full documents → fragments, resumable, unused artifacts pruned"""
+
+    def setUp(self):
+        user = AppUser.objects.create_user(employee_id = "EMP0102", password = "Rewrite#Pass123", email = "emp102@example.com",
+                                           first_name = "Test", last_name = "User", secret_hint = "hint",
+                                           secret_answer = "answer")
+        with override_settings(SNIPPET_HIGHLIGHT_MODE = FULL_MODE):
+            self.snippets = [Snippet.objects.create(owner = user, title = f"Old {index}", code = f"value = {index}\n")
+                             for index in range(3)]
+
+    def test_full_rows_become_fragments(self):
+        full_hashes = {snippet.highlight_hash for snippet in self.snippets}
+        self.assertTrue(all(is_full_document(snippet.highlighted) for snippet in self.snippets))
+
+        with override_settings(SNIPPET_HIGHLIGHT_MODE = FRAGMENT_MODE):
+            call_command("rewrite_snippet_highlights", batch_size = 2, stdout = StringIO())
+            output = StringIO()
+            call_command("rewrite_snippet_highlights", stdout = output)
+
+        # Second run finds nothing left to do
+        self.assertIn("Rewrote 0 snippets", output.getvalue())
+        for snippet in Snippet.objects.all():
+            self.assertFalse(is_full_document(snippet.highlighted))
+            self.assertNotIn("<style", snippet.highlighted)
+            self.assertEqual(snippet.highlight_hash, compute_highlight_hash(snippet.code, snippet.language, snippet.style,
+                                                                            snippet.linenos, snippet.title, FRAGMENT_MODE))
+        # Without --prune-artifacts the full documents stay
+        self.assertEqual(HighlightArtifact.objects.filter(content_hash__in = full_hashes).count(), 3)
+
+    def test_prune_artifacts_drops_unused_full_documents(self):
+        full_hashes = {snippet.highlight_hash for snippet in self.snippets}
+
+        with override_settings(SNIPPET_HIGHLIGHT_MODE = FRAGMENT_MODE):
+            call_command("rewrite_snippet_highlights", prune_artifacts = True, stdout = StringIO())
+
+        self.assertFalse(HighlightArtifact.objects.filter(content_hash__in = full_hashes).exists())
+        used = set(Snippet.objects.values_list("highlight_hash", flat = True))
+        self.assertEqual(set(HighlightArtifact.objects.values_list("content_hash", flat = True)), used)
+
+
+class LazyChoiceFieldTests(SimpleTestCase):
+    """Serializer choices stay unloaded until a value is validated"""
+
+    def test_choices_resolve_on_first_use(self):
+        loader = Mock(return_value = [("python", "Python"), ("rust", "Rust")])
+        field = LazyChoiceField(choices = LazyChoices(loader), default = "python")
+        loader.assert_not_called()
+
+        self.assertEqual(field.run_validation("rust"), "rust")
+        with self.assertRaises(ValidationError):
+            field.run_validation("cobol")
+        self.assertEqual(list(field.choices), ["python", "rust"])
+        loader.assert_called_once()
+
+
+class SnippetExportTests(APITestCase):
+    """GET snippets/export/: streamed NDJSON / CSV over the same filtered queryset as the list action"""
+
+    def setUp(self):
+        owner = AppUser.objects.create_user(employee_id = "EMP0103", password = "Export#Pass123", email = "emp103@example.com",
+                                            first_name = "Test", last_name = "User", secret_hint = "hint",
+                                            secret_answer = "answer")
+        self.reader = AppUser.objects.create_user(employee_id = "EMP0104", password = "Export#Pass123", email = "emp104@example.com",
+                                                  first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                  secret_answer = "answer")
+        self.snippets = [Snippet.objects.create(owner = owner, title = f"Export {index}", code = f"select {index};",
+                                                language = language, price = index)
+                         for index, language in enumerate(("python", "sql", "python"))]
+        self.client.force_authenticate(user = self.reader)
+        self.url = reverse("snippet-export")
+
+    @staticmethod
+    def _body(response) -> str:
+        return b"".join(response.streaming_content).decode()
+
+    def test_ndjson_export(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        self.assertIn('filename="snippet-export.ndjson"', response["Content-Disposition"])
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual([row["id"] for row in rows], [snippet.pk for snippet in self.snippets])
+        self.assertEqual(set(rows[0]), set(SnippetViewSet.export_fields))
+        self.assertEqual((rows[1]["title"], rows[1]["language"], rows[1]["price"]), ("Export 1", "sql", 1))
+
+    def test_csv_export(self):
+        response = self.client.get(self.url, {"output" : "csv"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv; charset=utf-8")
+        header, *rows = list(csv.reader(StringIO(self._body(response))))
+        self.assertEqual(header, list(SnippetViewSet.export_fields))
+        self.assertEqual([int(row[0]) for row in rows], [snippet.pk for snippet in self.snippets])
+
+    def test_unknown_output_is_rejected(self):
+        self.assertEqual(self.client.get(self.url, {"output" : "xml"}).status_code, 400)
+
+    def test_filters_narrow_the_export(self):
+        response = self.client.get(self.url, {"language" : "python"})
+
+        rows = [json.loads(line) for line in self._body(response).splitlines()]
+        self.assertEqual({row["language"] for row in rows}, {"python"})
+        self.assertEqual([row["id"] for row in rows], [self.snippets[0].pk, self.snippets[2].pk])
+
+    def test_non_owner_exports_the_list_rows(self):
+        listed = self.client.get(reverse("snippet-list"), {"language" : "sql"})
+        exported = self.client.get(self.url, {"language" : "sql"})
+
+        self.assertEqual([json.loads(line)["id"] for line in self._body(exported).splitlines()],
+                         [row["id"] for row in listed.data["results"]])
+
+
+class BulkImportTests(APITestCase):
+    """POST snippets/bulk-import/: per-item errors, one owner, only arrays / NDJSON accepted"""
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0100", password = "Import#Pass123", email = "emp100@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+        self.client.force_authenticate(user = self.user)
+        self.url = reverse("snippet-bulk-import")
+
+    @staticmethod
+    def _item(index : int, **overrides) -> dict:
+        item = {"title" : f"Import {index}", "code" : f"print({index})", "language" : "python", "email" : f"imp{index}@example.com",
+                "results" : "N/A", "price" : index}
+        item.update(overrides)
+        return item
+
+    def test_valid_array_creates_every_snippet(self):
+        response = self.client.post(self.url, [self._item(index) for index in range(3)], format = "json")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data["created"], response.data["failed"]), (3, 0))
+        snippets = Snippet.objects.filter(pk__in = response.data["ids"])
+        self.assertEqual({snippet.owner_id for snippet in snippets}, {self.user.pk})
+        self.assertTrue(all(snippet.highlighted for snippet in snippets))
+
+    @override_settings(SNIPPET_BULK_RENDER_MIN_PARALLEL = 2)
+    def test_render_pool_path(self):
+        try:
+            response = self.client.post(f"{self.url}?chunk_size=2", [self._item(index) for index in range(5)], format = "json")
+        finally:
+            if SnippetImportService._executor is not None:
+                SnippetImportService._executor.shutdown()
+                SnippetImportService._executor = None
+
+        self.assertEqual((response.status_code, response.data["created"]), (201, 5))
+        self.assertTrue(all(Snippet.objects.filter(pk__in = response.data["ids"]).values_list("highlighted", flat = True)))
+
+    def test_invalid_items_are_reported_and_skipped(self):
+        items = [self._item(0), self._item(1, code = None), self._item(2, language = "no-such-language")]
+        ndjson = "\n".join([*map(json.dumps, items), "{broken", json.dumps(self._item(4))])
+        response = self.client.post(self.url, ndjson, content_type = "application/x-ndjson")
+
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual((response.data["created"], response.data["failed"]), (2, 3))
+        self.assertEqual([error["index"] for error in response.data["errors"]], [1, 2, 3])
+        self.assertIn("code", response.data["errors"][0]["errors"])
+        self.assertEqual(Snippet.objects.count(), 2)
+
+    def test_non_array_bodies_are_rejected(self):
+        for body in ("null", "5", "true", "\"text\"", json.dumps(self._item(0))):
+            with self.subTest(body = body):
+                response = self.client.post(self.url, body, content_type = "application/json")
+                self.assertEqual(response.status_code, 400)
+        self.assertFalse(Snippet.objects.exists())
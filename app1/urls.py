@@ -20,6 +20,7 @@ from app1.views import (
     UserViewSet,
     api_root, 
     index, 
+    snippet_stylesheet, 
     # snippet_detail, 
     # snippet_list
     )
@@ -60,6 +61,9 @@ urlpatterns = [
     # path("snippets/<int:pk>/", SnippetDetail.as_view(), name = "snippet-detail"), 
     path("snippets/<int:pk>/highlight/", SnippetHighlight.as_view(), name = "snippet-highlight"), 
     
+    # Shared per-style CSS for fragment-mode highlights (long-lived cache headers)
+    path("snippets/styles/<str:style>.css", snippet_stylesheet, name = "snippet-stylesheet"), 
+    
     
     # NOTE - below endpoints not required if you are using ViewSet classes
     # path("users/", UserList.as_view(), name = "user-list"), 
@@ -1,4 +1,5 @@
 # Python base imports - Default ones
+from collections.abc import Iterator
 
 # Dependent software imports
 from rest_framework import permissions
@@ -10,28 +11,76 @@ from rest_framework.parsers import JSONParser
 from django.contrib.auth import get_user_model
 from drf_spectacular.utils import extend_schema
 from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET
+from django.db.models import Prefetch
 from django.http import Http404, HttpResponse, JsonResponse
+from django.views.decorators.cache import cache_control
 from rest_framework import viewsets, status, mixins, generics, renderers
 from rest_framework.decorators import api_view, action, permission_classes
 from django_filters import UnknownFieldBehavior, rest_framework as filters
 
 # Custom created imports
+from app1.parsers import NDJSONParser
 from app1.permissions import IsOwnerOrReadOnly
-from app1.models import Question, Choice, Answers, Snippet
+from app1.services.snippet_import_service import SnippetImportService
+from app1.services.highlight_service import (HighlightService, get_style_css, get_style_version, 
+                                             is_full_document, wrap_fragment)
+from app1.models import STYLE_CHOICES, Question, Choice, Answers, Snippet
 from app1.serializers import CreateRequestSerializer, QuestionSerializer, ChoiceSerializer, AnswersSerializer, SnippetHighlightSerializer, SnippetSerializer, UserSerializer
 from app2.models import AppUser
+from _utils.pagination import ApproximateCountPagination, ApproximateKeysetPagination, KeysetPagination
+from _utils.streaming_export import StreamingExportMixin
+from _utils.sparse_fieldsets import SparseFieldsetViewMixin
 
 User = get_user_model()
 
+def highlight_response(snippet) -> Response:
+    """
+    Shared by both highlight endpoints: the rendered HTML, or `202 Accepted` while the
+    background render for this snippet is still running.
+    """
+    html = HighlightService.get_or_schedule(snippet)
+    if html is None:
+        return Response("<p>rendering</p>", status = status.HTTP_202_ACCEPTED, headers = {"Retry-After" : "1"})
+    
+    # Fragment rows only hold the highlighted body - link the shared stylesheet around it
+    if not is_full_document(html):
+        stylesheet_url = f"{reverse('snippet-stylesheet', kwargs = {'style' : snippet.style})}?v={get_style_version()}"
+        html = wrap_fragment(html, snippet.title, stylesheet_url)
+    return Response(html)
+
+
+
+@require_GET
+@cache_control(public = True, max_age = 60 * 60 * 24 * 365, immutable = True)
+def snippet_stylesheet(request, style):
+    """
+    Per-style pygments CSS used by fragment-mode snippets.
+    
+    Generated once per process and served with long-lived cache headers - URLs carry the
+    pygments version (`?v=`) so a pygments upgrade busts browser and proxy caches.
+    Plain Django view on purpose: CSS is public and needs no DRF auth/negotiation.
+    """
+    if style not in STYLE_CHOICES.values:
+        raise Http404(f"Unknown style '{style}'")
+    return HttpResponse(get_style_css(style), content_type = "text/css; charset=utf-8")
+
+
 def index(request):
     return HttpResponse("Hello, world. You're at the polls index.")
 
 
 @extend_schema(tags = ["app1 django starter"])
-class QuestionViewSet(viewsets.ModelViewSet):
+class QuestionViewSet(StreamingExportMixin, viewsets.ModelViewSet):
     queryset = Question.objects.all().order_by("-created_date")
     serializer_class = QuestionSerializer
     
+    # GET /question/export/ → streamed NDJSON / CSV (see StreamingExportMixin)
+    export_fields = ("id", "question_text", "pub_date", "created_date", "version")
+    
+    # ?pagination=keyset / ?cursor= → (created_date, id) keyset pages, ?page= keeps working
+    pagination_class = KeysetPagination
+    
     # Protects the API as only when the user is authenticated, we allow them to access API.
     # If not verified, they will get below message - "detail: Authentication credentials were not provided."
     permission_classes = [permissions.IsAuthenticated]
@@ -42,6 +91,7 @@ class ChoiceViewSet(viewsets.ModelViewSet):
     queryset = Choice.objects.all().order_by("-choice_text")
     serializer_class = ChoiceSerializer
     permission_classes = [permissions.IsAuthenticated]
+    pagination_class = KeysetPagination
 
 
 @extend_schema(tags = ["app1 django starter"])
@@ -49,6 +99,9 @@ class AnswersViewSet(viewsets.ModelViewSet):
     queryset = Answers.objects.all()
     serializer_class = AnswersSerializer
     permission_classes = [permissions.IsAuthenticated]
+    
+    # Keyset pages on request, page-number pages with planner-estimated counts otherwise
+    pagination_class = ApproximateKeysetPagination
 
 
 # NOTE - Because we want to be able to POST to this view from clients that won't have a CSRF token we need to mark
@@ -386,9 +439,10 @@ class SnippetHighlight(generics.GenericAPIView):
         Custom .get() returns the pre-rendered highlighted HTML from snippet instance.
         get_object() provides standard lookup + permission checks.
         No serialization needed - highlighted field is already HTML-ready.
+        Answers 202 with a "rendering" body until the background render lands.
         """
         snippet = self.get_object()
-        return Response(snippet.highlighted)
+        return highlight_response(snippet)
 
 
 # ------------------------------ FILTERS IN DRF ----------------------------------------- #
@@ -406,7 +460,7 @@ class SnippetFilter(filters.FilterSet):
 
 IS EQUIVALENT TO
 
-class SnippetViewSet(viewsets.ModelViewSet):
+class SnippetViewSet(StreamingExportMixin, viewsets.ModelViewSet):
     # ----------- OTHER DEFINITIONS ----------- #
     filterset_fields = ("language", "style")
 """
@@ -464,8 +518,14 @@ class UserViewSet(viewsets.ReadOnlyModelViewSet):
     Router generates:
     GET /users/          → list
     GET /users/{pk}/     → retrieve
+    
+    Query shape is fixed whatever the page size (COUNT + users + one prefetch for all snippets):
+    - prefetch_related → snippet links for the whole page in ONE query instead of one per user
+    - only() → just the rendered columns are fetched, so first_name, last_name and secret_hint
+      are never decrypted (full_name and email are, because UserSerializer renders them)
     """
-    queryset = User.objects.all()
+    queryset = (User.objects.only("id", "employee_id", "full_name", "email")
+                .prefetch_related(Prefetch("snippets", queryset = Snippet.objects.only("id", "owner_id"))))
     serializer_class = UserSerializer
 
 
@@ -480,7 +540,7 @@ if we wanted an action that respond to POST requests.
 The URLs for custom actions by default depend on the method name itself. If you want to change the way url should be 
 constructed, you can include url_path as a decorator keyword argument.
 """
-class SnippetViewSet(viewsets.ModelViewSet):
+class SnippetViewSet(SparseFieldsetViewMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """
     ModelViewSet provides full CRUD: list, create, retrieve, update, destroy actions.
     Router generates standard RESTful URLs automatically:
@@ -489,15 +549,27 @@ class SnippetViewSet(viewsets.ModelViewSet):
     - GET    /snippets/{pk}/     → retrieve
     - PUT    /snippets/{pk}/     → update
     - DELETE /snippets/{pk}/     → destroy
+    - GET    /snippets/export/   → streamed NDJSON / CSV export
+    
+    list/retrieve accept ?fields=id,title or ?exclude=highlighted,code - dropped fields are
+    deferred in SQL, so e.g. `highlighted` is not fetched and `email`/`results` not decrypted.
     """
     queryset = Snippet.objects.all()
     serializer_class = SnippetSerializer
     permission_classes = [permissions.IsAuthenticated, IsOwnerOrReadOnly]
     
+    # Large unfiltered/broad lists report a planner estimate instead of an exact COUNT(*)
+    pagination_class = ApproximateCountPagination
+    
     # Filter section
     filter_backends = (filters.DjangoFilterBackend, )
     filterset_class = SnippetFilter
     
+    # GET /snippets/export/ → streamed NDJSON / CSV, SnippetFilter params apply
+    # `highlighted` is left out on purpose: derived data, re-creatable from code/language/style
+    export_fields = ("id", "title", "code", "linenos", "language", "style", "owner_id", "email", "results", "price", 
+                     "created_date")
+    
     def perform_create(self, serializer):
         """
         Automatically associates newly created snippets with the authenticated user.
@@ -512,9 +584,41 @@ class SnippetViewSet(viewsets.ModelViewSet):
         detail=True → requires snippet pk (runs get_object())
         Returns highlighted HTML instead of JSON (StaticHTMLRenderer)
         Router auto-generates URL name: "snippet-highlight"
+        Never blocks on pygments - returns 202 "rendering" while the render is pending
         """
         snippet = self.get_object()
-        return Response(snippet.highlighted)
+        return highlight_response(snippet)
+    
+    @action(detail = False, methods = ["post"], url_path = "bulk-import", parser_classes = [JSONParser, NDJSONParser])
+    def bulk_import(self, request, *args, **kwargs):
+        """
+        Custom @action creates endpoint: POST /snippets/bulk-import/
+        detail=False → collection level, router URL name: "snippet-bulk-import"
+        
+        Body (one of):
+        - application/json      → JSON array of snippet objects
+        - application/x-ndjson  → one snippet object per line, parsed while streaming
+        
+        Optional `?chunk_size=` (server capped) controls rows per bulk_create. Every snippet is
+        owned by the requesting user. Invalid items are reported by index and skipped, the rest
+        are written in one transaction - see SnippetImportService for what is batched.
+        """
+        items = request.data
+        # JSON body → list, NDJSON body → generator; objects, scalars and null are rejected
+        if not isinstance(items, (list, Iterator)):
+            return Response({"detail" : "Expected a JSON array or an NDJSON body."}, status = status.HTTP_400_BAD_REQUEST)
+        
+        try:
+            chunk_size = int(request.query_params.get("chunk_size", 0)) or None
+        except ValueError:
+            return Response({"detail" : "chunk_size must be an integer."}, status = status.HTTP_400_BAD_REQUEST)
+        
+        result = SnippetImportService.import_items(items, owner = request.user, 
+                                                   context = self.get_serializer_context(), chunk_size = chunk_size)
+        
+        # 201 when anything was written, 400 when every item was rejected
+        response_status = status.HTTP_201_CREATED if result["created"] or not result["failed"] else status.HTTP_400_BAD_REQUEST
+        return Response(result, status = response_status)
 
 
 @permission_classes([permissions.IsAuthenticated])
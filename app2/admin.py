@@ -12,6 +12,7 @@ from django.contrib.auth.forms import ReadOnlyPasswordHashField
 
 # Custom created imports
 from app2.models import AppUser
+from app2.services.user_lookup_service import UserLookupService
 
 # ============================================================
 # Custom User Creation Form (Admin → Add User)
@@ -156,19 +157,34 @@ class AppUserAdmin(UserAdmin):
     # Fields that cannot be edited manually
     readonly_fields = ("last_password_change", "last_passwords")
 
-    # Search box fields
-    search_fields = ("employee_id", "email", "first_name", "last_name")
+    # Search box fields (plain column - encrypted fields are searched via get_search_results below)
+    search_fields = ("employee_id",)
 
     # Columns shown in user list page
     list_display = ("employee_id", "email", "first_name", "last_name", "is_staff", "is_active", "unsuccessful_attempts")
 
+    # ------------------------------------------------
+    # Search encrypted fields through blind indexes
+    # ------------------------------------------------
+    def get_search_results(self, request, queryset, search_term):
+        """
+        employee_id: the usual icontains search.
+        email / first_name / last_name / full_name: exact match (email case-insensitive) via
+        their blind-index columns - an index lookup instead of decrypting every row.
+        """
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term.strip():
+            results = results | queryset.filter(UserLookupService.search_q(search_term))
+        return results, may_have_duplicates
+
     # ------------------------------------------------
     # Edit User Page Layout
     # ------------------------------------------------
     fieldsets = (
         (None, {"fields" : ("employee_id", "password")}),
         (_("Personal Info"), {"fields" : ("first_name", "last_name", "full_name", "email")}),
-        (_("Security"), {"fields" : ("secret_hint", "secret_answer", "last_password_change", "last_passwords", "unsuccessful_attempts")}),
+        (_("Security"), {"fields" : ("secret_hint", "secret_answer", "last_password_change", "last_passwords", "unsuccessful_attempts", 
+                                         "first_failed_login", "last_failed_login")}),
         (_("Permissions"), {"fields" : ("is_active", "is_staff", "is_superuser", "groups", "user_permissions")}),
         (_("Important Dates"), {"fields" : ("last_login",)}),
     )
@@ -3,6 +3,7 @@ import logging
 
 # Dependent software imports
 from django.apps import AppConfig
+from django.core import checks
 
 # Custom created imports
 
@@ -12,3 +13,6 @@ class App2Config(AppConfig):
     def ready(self):
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"{self.name} Initializing Started, SecurityConfigManager auto-initializes on first use")
+
+        from app2.checks import check_secret_keys
+        checks.register(check_secret_keys, checks.Tags.security)
@@ -0,0 +1,125 @@
+# Python base imports - Default ones
+
+# Dependent software imports
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.authentication import BasicAuthentication
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+
+# Custom created imports
+from app2.services.lockout_service import LockoutService
+from app2.services.credential_cache_service import CredentialCache
+from app2.services.token_version_service import TokenVersionService
+
+
+# Claims LoginSerializer embeds when settings.JWT_TOKEN_USER_MODE is on - all a token user is built from
+TOKEN_USER_CLAIMS = ("employee_id", "is_staff", "is_superuser", "is_active", "token_version")
+
+
+def embed_user_claims(token, user) -> None:
+    """
+    🏷️ Copy the claims onto a (refresh) token - access tokens derived from it inherit them
+
+    Always "token_version" (revocation). The rest of TOKEN_USER_CLAIMS only in token user
+    mode; they stay trustworthy because changing is_active / is_staff / is_superuser bumps
+    token_version (AppUser.save) and so revokes every token carrying the old values.
+    """
+    claims = TOKEN_USER_CLAIMS if getattr(settings, "JWT_TOKEN_USER_MODE", False) else ("token_version",)
+    for claim in claims:
+        token[claim] = getattr(user, claim)
+
+
+class CachedBasicAuthentication(BasicAuthentication):
+    """
+    🔐 BasicAuthentication WITHOUT A PBKDF2 RUN ON EVERY REQUEST
+
+    Scripted clients send employee_id:password with each call. The first request is verified
+    exactly like BasicAuthentication (authenticate() → hash check); after that the pair is
+    trusted from CredentialCache for settings.BASIC_AUTH_CACHE_TTL seconds.
+
+    A cache hit still loads the user row by primary key and rejects the entry when:
+    - the password hash changed (password changed in any process)
+    - the account was deactivated
+    - the account is locked (LockoutService)
+
+    Locked accounts are also refused on the uncached path.
+    """
+
+    def authenticate_credentials(self, userid, password, request = None):
+        key = CredentialCache.make_key(userid, password)
+        cached = CredentialCache.get(key)
+
+        if cached is not None:
+            user_pk, digest = cached
+            user = get_user_model()._default_manager.filter(pk = user_pk).first()
+            if (user is not None and user.is_active and CredentialCache.hash_digest(user.password) == digest
+                and not LockoutService.is_locked(user)):
+                return (user, None)
+
+            # Stale entry → full verification below decides
+            CredentialCache.invalidate(key)
+
+        user, auth = super().authenticate_credentials(userid, password, request)
+        if LockoutService.is_locked(user):
+            raise AuthenticationFailed("Account locked after too many failed attempts.")
+
+        CredentialCache.put(key, user.pk, user.password)
+        return (user, auth)
+
+
+class AppJWTAuthentication(JWTAuthentication):
+    """
+    🎫 JWTAuthentication WITH AN OPT-IN STATELESS USER (settings.JWT_TOKEN_USER_MODE)
+
+    DEFAULT (mode off):
+    Same as JWTAuthentication - one SELECT of the full AppUser row per request (and email /
+    names decrypted) - plus the token_version check below when the token carries it.
+
+    TOKEN USER MODE (mode on, token issued with TOKEN_USER_CLAIMS):
+    request.user is an AppUser instance built from the claims alone - id, employee_id,
+    is_staff, is_superuser, is_active, token_version. Every other field is deferred: touching
+    e.g. user.email loads it on first access, so views that need more still work, and
+    `serializer.save(owner = request.user)` still gets a real model instance.
+
+    REVOCATION:
+    Tokens whose "token_version" differs from the user's current one are rejected
+    (TokenVersionService - cached, no full row load). It is bumped on password change,
+    deactivation and is_staff / is_superuser changes, so stale privilege claims die with it.
+    Older tokens without the claims keep using the regular path.
+    """
+
+    def get_user(self, validated_token):
+        version = validated_token.get("token_version")
+        if getattr(settings, "JWT_TOKEN_USER_MODE", False) and version is not None and "employee_id" in validated_token:
+            return self.get_token_user(validated_token)
+
+        user = super().get_user(validated_token)
+        if version is not None and version != user.token_version:
+            raise AuthenticationFailed("Token has been revoked", code = "token_revoked")
+        return user
+
+    def get_token_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError:
+            raise AuthenticationFailed("Token contained no recognizable user identification", code = "token_not_valid")
+
+        if not validated_token.get("is_active", False):
+            raise AuthenticationFailed("User is inactive", code = "user_inactive")
+
+        current = TokenVersionService.get(user_id)
+        if current is None:
+            raise AuthenticationFailed("User not found", code = "user_not_found")
+        if current != validated_token["token_version"]:
+            raise AuthenticationFailed("Token has been revoked", code = "token_revoked")
+
+        values = {api_settings.USER_ID_FIELD : user_id}
+        values.update((claim, validated_token[claim]) for claim in TOKEN_USER_CLAIMS if claim in validated_token)
+
+        # from_db() with a subset of columns → every other field is deferred (lazy-loaded).
+        # It pairs the values with the model's concrete fields in declaration order.
+        model = get_user_model()
+        field_names = [field.attname for field in model._meta.concrete_fields if field.attname in values]
+        return model.from_db(None, field_names, [values[name] for name in field_names])
@@ -0,0 +1,27 @@
+# Python base imports - Default ones
+
+# Dependent software imports
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+
+# Custom created imports
+from app2.services.blind_index_service import BlindIndexService
+from app2.services.password_history_service import PasswordHistoryService
+
+
+def check_secret_keys(app_configs, **kwargs):
+    """
+    🔑 DEDICATED HMAC KEYS MUST BE CONFIGURED
+
+    The services only raise ImproperlyConfigured on first use (a password change in production);
+    the same validation here makes `runserver`, `migrate`, `check` and the test runner stop at startup.
+    """
+    errors = []
+    for service, setting, check_id in ((PasswordHistoryService, "PASSWORD_HISTORY_KEY", "app2.E001"),
+                                       (BlindIndexService, "BLIND_INDEX_KEY", "app2.E002")):
+        try:
+            service._get_key()
+        except ImproperlyConfigured as e:
+            errors.append(checks.Error(str(e), hint = f"Set the {setting} environment variable to a long random value.",
+                                       id = check_id))
+    return errors
@@ -5,155 +5,113 @@
 🎯 WHAT THIS SOLVES (CRITICAL PROBLEMS):
 ────────────────────────────────────────
 1️⃣ Django 5.1+ "DB access during startup" WARNING → FIXED
-2️⃣ Fresh DB deployment (no GlobalAppConfig table) → ✅ Works immediately  
+2️⃣ Fresh DB deployment (no GlobalAppConfig table) → ✅ Works immediately
 3️⃣ Empty GlobalAppConfig table → ✅ Safe defaults
 4️⃣ Production performance → 0 DB queries after first call ⚡
+5️⃣ Many workers, one admin edit → every worker reloads within seconds ✅
+6️⃣ Values parsed ONCE → int / bool / compiled regex / timedelta, no int() per call ✅
 
 🎮 HOW TO USE:
-SecurityConfigManager.get("auth_retries") → "3" (or DB value)
+SecurityConfigManager.get("auth_retries") → 3 (int, or DB value)
+
+Loading, caching and invalidation live in _utils.app_config.AppConfigService (all
+GlobalAppConfig categories); this module only declares the "security" schema.
 """
 
 # Python base imports - Default ones
 import logging
-from functools import lru_cache
-from typing import Dict, Optional
+from typing import Any, Dict
 
 # Dependent software imports
 
-
 # Custom created imports
+from _utils.app_config import AppConfigService, ConfigField
 
 
 # 📋 Global logger for debugging
 logger = logging.getLogger(__name__)
 
+
+# 🛡️ BUILT-IN SAFETY NET: Type + default value for ALL scenarios
+SECURITY_SCHEMA = {
+    "auth_retries" : ConfigField("int", "3", min_value = 1),                         # Max failed logins before lockout
+    "password_limit" : ConfigField("int", "5", min_value = 0),                       # Password history (can't reuse last N)
+    "password_age" : ConfigField("duration", "90", unit = "d"),                      # Before password expires (bare number = days)
+    "password_min_length" : ConfigField("int", "8", min_value = 1),                  # Minimum password length
+    "password_max_length" : ConfigField("int", "64", min_value = 1),                 # Maximum password length
+    "require_uppercase" : ConfigField("bool", "true"),                               # Must have uppercase letter?
+    "require_lowercase" : ConfigField("bool", "true"),                               # Must have lowercase letter?
+    "require_numeric" : ConfigField("bool", "true"),                                 # Must have numbers?
+    "require_special" : ConfigField("bool", "true"),                                 # Must have special chars?
+    "special_characters" : ConfigField("regex", "[!@#$%^&*()_+={}:;\"'<>,.?/]"),     # Allowed special chars
+}
+
+AppConfigService.register("security", SECURITY_SCHEMA)
+
+
 class SecurityConfigManager:
     """
-    🔐 CENTRAL SECURITY POLICY MANAGER
-    
+    🔐 CENTRAL SECURITY POLICY MANAGER - thin view over AppConfigService("security")
+
     LIFECYCLE (What happens when your app runs):
     1. Django starts → NO DB calls (no warnings!)
-    2. First login → _load_configs() runs ONCE
-    3. Loads DB OR uses defaults → CACHES FOREVER!
-    4. Next 1M logins → Instant cache lookup ⚡
+    2. First login → every GlobalAppConfig category loaded + parsed in ONE query
+    3. Next 1M logins → Instant dict lookup, typed value ⚡
+    4. Admin edit → new version stamp → every worker reloads within SECURITY_CONFIG_CHECK_INTERVAL
     """
 
-    # 🗄️ INTERNAL CACHE (Populated on first use)
-    _configs : Optional[Dict[str, str]] = None
-    
-    # 🛡️ BUILT-IN SAFETY NET: Default values for ALL scenarios
-    DEFAULTS = {
-        "auth_retries" : "3",           # Max failed logins before lockout
-        "password_limit" : "5",         # Password history (can't reuse last N)
-        "password_age" : "90",          # Days before password expires
-        "password_min_length" : "8",    # Minimum password length
-        "password_max_length" : "64",   # Maximum password length  
-        "require_uppercase" : "true",   # Must have uppercase letter?
-        "require_lowercase" : "true",   # Must have lowercase letter?
-        "require_numeric" : "true",     # Must have numbers?
-        "require_special" : "true",     # Must have special chars?
-        "special_characters" : "[!@#$%^&*()_+={}:;\"'<>,.?/]"  # Allowed special chars
-    }
+    CATEGORY = "security"
 
-    # ==================================== CORE METHODS ====================================
+    # Raw defaults (what an empty table behaves like)
+    DEFAULTS = {name : field.default for name, field in SECURITY_SCHEMA.items()}
 
-    @classmethod
-    @lru_cache(maxsize = 1)
-    # 🔥 MAGIC: Runs EXACTLY ONCE, then cached forever! ⚡
-    # Python remembers result - next calls are instant!
-    def _load_configs(cls) -> Dict[str, str]:
-        """
-        🚀 LAZY LOADING STRATEGY (The secret sauce!)
-        
-        WHEN IT RUNS: Only on FIRST SecurityConfigManager.get() call
-        WHAT IT DOES: 
-        1. Try load from GlobalAppConfig table
-        2. 4 possible outcomes → ALL HANDLED PERFECTLY:
-            - SCENARIO 1: Fresh DB (no table yet)
-                - Exception → Return defaults → Cached ✅
-            - SCENARIO 2: Empty table (0 records)
-                - [] → db_configs = {} → Defaults cached ✅
-            - SCENARIO 3: Partial configs (3/10 records) 
-                - DB values + defaults → Cached ✅
-            - SCENARIO 4: Full table (10/10 records)                  
-                - All DB values cached ✅ 
-        """
-        try:
-            from _utils.models import GlobalAppConfig
-            
-            # 📊 SINGLE OPTIMIZED QUERY (returns name/value pairs)
-            configs = GlobalAppConfig.objects.filter(category = "security").values("name", "value")
-            
-            # 🔄 Transform DB rows → Python dict
-            # Example: [{"name" : "auth_retries", "value" : "5"}] → {"auth_retries": "5"}
-            db_configs = {c["name"] : c["value"] for c in configs}
-            
-            # 🎯 CRITICAL MERGE LOGIC (DB wins over defaults!)
-            result = cls.DEFAULTS.copy()  # Start with safe defaults
-            result.update(db_configs)  # DB values OVERRIDE defaults
-            
-            # 📋 Debug info (remove in production if desired)
-            logger.info(f"Loaded {len(db_configs)} security configs from DB")
-            return result
-            
-        except Exception as e:
-            # 🛡️ SAFETY NET: Table missing? Migrations pending? No problem!
-            logger.warning(f"⚠️ Database unavailable ({e}). Using built-in defaults.")
-            return cls.DEFAULTS.copy()
-    
+    # ==================================== CORE METHODS ====================================
 
     @classmethod
-    def get(cls, name : str) -> str:
+    def get(cls, name : str) -> Any:
         """
         🎯 MAIN ENTRY POINT - Bulletproof config access
-        
+
         USAGE:
-        int(SecurityConfigManager.get("auth_retries")) → 3
-        
+        SecurityConfigManager.get("auth_retries") → 3
+        SecurityConfigManager.get("require_special") → True
+        SecurityConfigManager.get("special_characters") → re.compile("[!@#...]")
+        SecurityConfigManager.get("password_age") → timedelta(days = 90)
+
         SAFETY GUARANTEES:
-        1. Always returns VALID value (never None/null)
+        1. Always returns a VALID typed value (invalid DB rows fall back to the default)
         2. First call: ~1ms (DB), Next calls: ~0.0001ms ⚡
         3. Works on fresh DB, empty table, partial configs
         """
-
-        # 🔍 Validate config exists in our known list
-        if name not in cls.DEFAULTS:
-            raise ValueError(f"❌ Unknown security config '{name} Available: {list(cls.DEFAULTS.keys())}")
-        
-        # 🔥 LAZY MAGIC: First call triggers _load_configs(), then instant!
-        configs = cls._load_configs()
-        return configs[name]
-    
+        try:
+            return AppConfigService.get(cls.CATEGORY, name)
+        except KeyError:
+            raise ValueError(f"❌ Unknown security config '{name}' Available: {list(cls.DEFAULTS.keys())}")
 
     # ==================================== UTILITY METHODS ====================================
-    
+
     @classmethod
     def reload(cls):
         """
-        🔄 ADMIN ONLY: Force refresh cache (rarely needed)
-        
+        🔄 ADMIN ONLY: Force refresh cache in ALL processes (rarely needed - saves do it already)
+
         USE CASES:
-            • Admin changed GlobalAppConfig values
+            • After bulk config updates (QuerySet.update() / raw SQL skip save())
             • Development: Test new DB values without restart
-            • After bulk config updates
-        
-        CALL FROM: 
-            • Admin endpoint or management command
         """
-        logger.info("🔄 SecurityConfigManager cache cleared - next get() will reload")
-        cls._load_configs.cache_clear()
-    
+        AppConfigService.reload()
+
 
     @classmethod
     def is_initialized(cls) -> bool:
         """🔍 DEBUG: Check if configs loaded from DB"""
-        return cls._load_configs.cache_info().currsize > 0
-    
+        return AppConfigService.is_loaded()
+
 
     @classmethod
-    def get_all_configs(cls) -> Dict[str, str]:
+    def get_all_configs(cls) -> Dict[str, Any]:
         """📋 DEBUG: Dump complete cached config for inspection"""
-        return cls._load_configs().copy()
+        return dict(AppConfigService.category(cls.CATEGORY))
 
 
 """
@@ -164,17 +122,23 @@ app2.apps.py ✅ (No DB - Safe!)
 User Logs In
     ↓
 AppUser.get_max_login_attempts()
-    ↓ 
-SecurityConfigManager.get("auth_retries")
+    ↓
+SecurityConfigManager.get("auth_retries") → AppConfigService.get("security", "auth_retries")
     ↓ FIRST TIME ONLY!
-_load_configs() ──┐
+_fetch() ─────────┐
                   │ ✅ DB table exists?
              YES  │    ↓
-                  ├─── Load DB configs
+                  ├─── Load ALL categories, parse against schemas
                   │    ↓
-                  └─── Cache: defaults + DB overrides ⚡
+                  └─── Cache: defaults + valid DB overrides ⚡
              NO   │    ↓
                   └─── Cache: defaults only ⚡
     ↓
-Return: "3" (cached forever!)
-"""
\ No newline at end of file
+Return: 3 (cached, stamp re-checked every few seconds)
+
+Admin saves GlobalAppConfig
+    ↓
+GlobalAppConfig.save() → AppConfigService.bump_version() → new stamp row
+    ↓ within SECURITY_CONFIG_CHECK_INTERVAL
+Every worker: stamp changed → _fetch() → new limits live
+"""
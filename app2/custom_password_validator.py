@@ -1,13 +1,49 @@
 # Python base imports - Default ones
-from typing import Optional
-from re import search as re_search
+import re
+from typing import Callable, List, Mapping, Optional, Sequence, Tuple
 
 # Dependent software imports
 from django.utils.translation import gettext
 from django.core.exceptions import ValidationError
 
 # Custom created imports
-from _utils.models import GlobalAppConfig
+from app2.config import SecurityConfigManager
+from _utils.app_config import AppConfigService
+
+
+# 🔤 Character classes - compiled once per process
+UPPERCASE_PATTERN = re.compile("[A-Z]")
+LOWERCASE_PATTERN = re.compile("[a-z]")
+NUMERIC_PATTERN = re.compile("[0-9]")
+
+
+class PasswordRules:
+    """
+    📐 ONE SNAPSHOT OF THE SECURITY CONFIG, READY FOR VALIDATION
+
+    Lengths + the list of (compiled pattern, message, code) character checks that are switched
+    on. Built from AppConfigService's "security" mapping and reused until that mapping is
+    replaced (= the config version changed).
+    """
+
+    __slots__ = ("config", "min_length", "max_length", "require_uppercase", "require_lowercase",
+                 "require_numeric", "require_special", "checks")
+
+    def __init__(self, config : Mapping, help_special : str):
+        self.config = config
+        self.min_length, self.max_length = config["password_min_length"], config["password_max_length"]
+        self.require_uppercase, self.require_lowercase = config["require_uppercase"], config["require_lowercase"]
+        self.require_numeric, self.require_special = config["require_numeric"], config["require_special"]
+
+        candidates = (
+            (self.require_uppercase, UPPERCASE_PATTERN, "The password must contain at least one uppercase letter", "password_uppercase"),
+            (self.require_lowercase, LOWERCASE_PATTERN, "The password must contain at least one lowercase letter", "password_lowercase"),
+            (self.require_numeric, NUMERIC_PATTERN, "The password must contain at least one numeric character", "password_numeric"),
+            (self.require_special, config["special_characters"],
+             f"The password must contain at least one special character from: {help_special}", "password_special"),
+        )
+        self.checks : List[Tuple[Callable, str, str]] = [(pattern.search, message, code)
+                                                         for enabled, pattern, message, code in candidates if enabled]
 
 
 class AppPasswordValidator:
@@ -21,32 +57,30 @@ class AppPasswordValidator:
         • Username similarity check
     
     🔄 HOW IT WORKS:
-    1. __init__() → Cache ALL config values (1-time setup)
-    2. validate() → Check password against cached rules
-    3. get_help_text() → Dynamic help text for forms
+    1. rules → PasswordRules from the cached security config (SecurityConfigManager / AppConfigService)
+    2. validate() → Check password against the precompiled rules
+    3. validate_many() → Same rules for a whole batch (bulk user provisioning)
+    4. get_help_text() → Dynamic help text for forms
     
-    🚀 PERFORMANCE: Zero DB queries per validation!
+    🚀 PERFORMANCE: Zero DB queries per instantiation and per validation!
+    Django builds new validator instances in several code paths (get_default_password_validators),
+    so nothing is loaded in __init__; the compiled rules are shared by every instance and rebuilt
+    only when the config version changes.
     """
-    
-    def __init__(self):
-        """
-        🚀 ONE-TIME SETUP (Runs when Django loads validators)
-        
-        WHY CACHE HERE?
-            • Password validation called 1000s times/session
-            • Avoid 10x DB queries per user registration
-            • ConfigManager already cached → Double fast! ⚡
-        """
 
-        # 📊 Load ALL security configs (cached by SecurityConfigManager!)
-        self.password_min_length = int(GlobalAppConfig.objects.get(category = "security", name = "password_min_length").value)
-        self.password_max_length = int(GlobalAppConfig.objects.get(category = "security", name = "password_max_length").value)
-        self.require_uppercase = GlobalAppConfig.objects.get(category = "security", name = "require_uppercase").value
-        self.require_lowercase = GlobalAppConfig.objects.get(category = "security", name = "require_lowercase").value
-        self.require_numeric = GlobalAppConfig.objects.get(category = "security", name = "require_numeric").value
-        self.require_special = GlobalAppConfig.objects.get(category = "security", name = "require_special").value
-        self.special_characters = GlobalAppConfig.objects.get(category = "security", name = "special_characters").value
-        self.help_special = "!, @, #, $, %, ^, &, *, (, ), _, +, -, <, >, =, ~"
+    help_special = "!, @, #, $, %, ^, &, *, (, ), _, +, -, <, >, =, ~"
+
+    # 🗄️ Shared by all instances (rebuilt when the config mapping is replaced)
+    _rules : Optional[PasswordRules] = None
+
+    @property
+    def rules(self) -> PasswordRules:
+        config = AppConfigService.category(SecurityConfigManager.CATEGORY)
+        rules = AppPasswordValidator._rules
+        # A reload creates a new mapping object → identity tells whether the config changed
+        if rules is None or rules.config is not config:
+            rules = AppPasswordValidator._rules = PasswordRules(config, self.help_special)
+        return rules
 
     # ====================================== CORE VALIDATION ======================================
     def validate(self, password : str, user : Optional[object] = None) -> None:
@@ -61,10 +95,40 @@ class AppPasswordValidator:
         
         RAISES ValidationError → Django shows to user automatically
         """
+        self._check(self.rules, password, user)
+
 
+    def validate_many(self, passwords : Sequence[str], users : Optional[Sequence[Optional[object]]] = None) -> List[Optional[ValidationError]]:
+        """
+        📦 BATCH VALIDATION (bulk user provisioning)
+        
+        One result per password, in order: None when valid, else the ValidationError validate()
+        would have raised. The rules are resolved once for the whole batch.
+        
+        USAGE:
+        errors = AppPasswordValidator().validate_many(passwords, users)
+        rejected = [(index, error) for index, error in enumerate(errors) if error]
+        """
+        if users is not None and len(users) != len(passwords):
+            raise ValueError("validate_many() needs one user per password (or users = None)")
+
+        rules = self.rules
+        results : List[Optional[ValidationError]] = []
+        for index, password in enumerate(passwords):
+            try:
+                self._check(rules, password, users[index] if users is not None else None)
+            except ValidationError as e:
+                results.append(e)
+            else:
+                results.append(None)
+        return results
+
+
+    @staticmethod
+    def _check(rules : PasswordRules, password : str, user : Optional[object]) -> None:
         # 📏 LENGTH VALIDATION (Fastest checks first)
-        if self.password_min_length and len(password) < self.password_min_length:
-            raise ValidationError(gettext(f"The password should be at least {self.password_min_length} characters long."), code = "password_too_short")
+        if rules.min_length and len(password) < rules.min_length:
+            raise ValidationError(gettext(f"The password should be at least {rules.min_length} characters long."), code = "password_too_short")
 
         # 👤 USERNAME SIMILARITY (Custom user model safe)
         if user:
@@ -73,22 +137,14 @@ class AppPasswordValidator:
             if username and username in password:
                 raise ValidationError(gettext("The password cannot contain the username."), code = "password_username")
         
-        # 🔤 CHARACTER REQUIREMENTS (Regex - super fast!)
-        if self.require_uppercase and not re_search("[A-Z]", password):
-            raise ValidationError(gettext("The password must contain at least one uppercase letter"), code = "password_uppercase")
-
-        if self.require_lowercase and not re_search("[a-z]", password):
-            raise ValidationError(gettext("The password must contain at least one lowercase letter"), code = "password_lowercase")
-
-        if self.require_numeric and not re_search("[0-9]", password):
-            raise ValidationError(gettext("The password must contain at least one numeric character"), code = "password_numeric")
-
-        if self.require_special and not re_search(self.special_characters, password):
-            raise ValidationError(gettext(f"The password must contain at least one special character from: {self.help_special}"), code = "password_special")
+        # 🔤 CHARACTER REQUIREMENTS (precompiled, only the enabled ones)
+        for search, message, code in rules.checks:
+            if not search(password):
+                raise ValidationError(gettext(message), code = code)
 
         # 📏 MAX LENGTH (Last check)
-        if self.password_max_length and len(password) > self.password_max_length:
-            raise ValidationError(gettext(f"The password should be less than {self.password_max_length} characters long."), code = "password_too_long")
+        if rules.max_length and len(password) > rules.max_length:
+            raise ValidationError(gettext(f"The password should be less than {rules.max_length} characters long."), code = "password_too_long")
 
 
     # ====================================== USER HELP TEXT ======================================
@@ -103,22 +159,23 @@ class AppPasswordValidator:
         
         SMART: Only shows REQUIRED rules!
         """
+        rules = self.rules
         required_parts = []
 
-        if self.require_uppercase:
+        if rules.require_uppercase:
             required_parts.append("one uppercase")
         
-        if self.require_lowercase:
+        if rules.require_lowercase:
             required_parts.append("one lowercase")
 
-        if self.require_numeric:
+        if rules.require_numeric:
             required_parts.append("one numeric")
 
-        if self.require_special:
+        if rules.require_special:
            required_parts.append(f"one special from: {self.help_special}")
         
         # 📏 Always include length
-        length_text = f"{self.password_min_length}-{self.password_max_length} characters"
+        length_text = f"{rules.min_length}-{rules.max_length} characters"
 
         if required_parts:
             rules_text = f"{length_text} + {' and '.join(required_parts)}"
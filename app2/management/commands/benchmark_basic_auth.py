@@ -0,0 +1,45 @@
+# Python base imports - Default ones
+from time import perf_counter
+from base64 import b64encode
+
+# Dependent software imports
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from rest_framework.authentication import BasicAuthentication
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app2.authentication import CachedBasicAuthentication
+from app2.services.credential_cache_service import CredentialCache
+
+
+class Command(BaseCommand):
+    """
+    Basic-auth requests/second with and without the verified-credential cache.
+
+        python manage.py benchmark_basic_auth --employee-id EMP001 --password 'Secret#123' --count 200
+
+    Runs the authentication step of a request (what every Basic-auth API call pays) for an
+    existing account, in process, against the configured database.
+    """
+
+    help = "Benchmark BasicAuthentication against CachedBasicAuthentication."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employee-id", required = True)
+        parser.add_argument("--password", required = True)
+        parser.add_argument("--count", type = int, default = 200, help = "Authenticated requests per run")
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        token = b64encode(f"{options['employee_id']}:{options['password']}".encode("utf-8")).decode("ascii")
+        factory = APIRequestFactory()
+
+        CredentialCache.clear()
+        for label, authenticator in (("basic", BasicAuthentication()), ("cached", CachedBasicAuthentication())):
+            started = perf_counter()
+            for _ in range(count):
+                request = Request(factory.get("/", HTTP_AUTHORIZATION = f"Basic {token}"))
+                authenticator.authenticate(request)
+            elapsed = perf_counter() - started
+            self.stdout.write(f"{label:<7}: {count / elapsed:9.1f} req/s ({elapsed / count * 1000:.2f} ms/request)")
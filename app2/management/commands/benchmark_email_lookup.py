@@ -0,0 +1,96 @@
+# Python base imports - Default ones
+import random
+from time import perf_counter
+
+# Dependent software imports
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app2.models import AppUser
+from app2.services.blind_index_service import BlindIndexService
+from app2.services.user_lookup_service import UserLookupService
+
+
+class Command(BaseCommand):
+    """
+    "Find user by email" on a large app_users table - blind index versus decrypt-and-compare.
+
+        python manage.py benchmark_email_lookup --users 1000000 --lookups 1000
+        python manage.py benchmark_email_lookup --cleanup
+
+    Seeds BENCH* users (bulk_create, encrypted like real rows) up to --users, then times
+    UserLookupService.find_by_email ("blind index") and a full scan that decrypts every email
+    until it matches ("scan", the only option before). Run it against a scratch database -
+    seeding 1M users takes a few minutes, mostly encryption.
+    """
+
+    help = "Benchmark email lookup: blind-index probe vs decrypting every row."
+
+    prefix = "BENCH"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type = int, default = 1000000)
+        parser.add_argument("--lookups", type = int, default = 1000, help = "Blind-index lookups timed")
+        parser.add_argument("--scan-lookups", type = int, default = 1, help = "Full-scan lookups timed (each reads every row)")
+        parser.add_argument("--batch-size", type = int, default = 5000)
+        parser.add_argument("--cleanup", action = "store_true", help = "Delete the BENCH users and exit")
+
+    def handle(self, *args, **options):
+        if options["cleanup"]:
+            deleted, _ = AppUser.objects.filter(employee_id__startswith = self.prefix).delete()
+            self.stdout.write(f"Deleted {deleted} row(s)")
+            return
+
+        total = options["users"]
+        self._seed(total, options["batch_size"])
+
+        rng = random.Random(0)
+        targets = [rng.randrange(total) for _ in range(options["lookups"])]
+        started = perf_counter()
+        for index in targets:
+            user = UserLookupService.find_by_email(self._email(index).upper())
+            assert user is not None and user.employee_id == self._employee_id(index)
+        indexed = (perf_counter() - started) / max(1, len(targets))
+        self.stdout.write(f"blind index: {indexed * 1000:10.3f} ms/lookup over {len(targets)} lookups")
+
+        if options["scan_lookups"] > 0:
+            started = perf_counter()
+            for index in targets[ : options["scan_lookups"]]:
+                self._scan(self._email(index))
+            scan = (perf_counter() - started) / min(options["scan_lookups"], len(targets))
+            self.stdout.write(f"scan       : {scan * 1000:10.1f} ms/lookup ({scan / indexed:,.0f}x slower)")
+
+    def _employee_id(self, index : int) -> str:
+        return f"{self.prefix}{index:07d}"
+
+    @staticmethod
+    def _email(index : int) -> str:
+        return f"bench.user{index}@example.com"
+
+    def _seed(self, total : int, batch_size : int) -> None:
+        existing = AppUser.objects.filter(employee_id__startswith = self.prefix).count()
+        if existing >= total:
+            return
+
+        self.stdout.write(f"Seeding {total - existing} users...")
+        password = make_password("Bench#Pass123")
+        for start in range(existing, total, batch_size):
+            users = []
+            for index in range(start, min(start + batch_size, total)):
+                user = AppUser(employee_id = self._employee_id(index), email = self._email(index), first_name = "Bench",
+                               last_name = f"User{index}", full_name = f"Bench User{index}", secret_hint = "hint",
+                               secret_answer = password, password = password)
+                # bulk_create skips save() → digests set here
+                for column, digest in BlindIndexService.compute(user).items():
+                    setattr(user, column, digest)
+                users.append(user)
+            AppUser.objects.bulk_create(users, batch_size = batch_size)
+
+    @staticmethod
+    def _scan(email : str):
+        """Previous behaviour: decrypt every email until one matches"""
+        for pk, candidate in AppUser.objects.values_list("pk", "email").iterator(chunk_size = 5000):
+            if candidate.lower() == email:
+                return pk
+        return None
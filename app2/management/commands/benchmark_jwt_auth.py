@@ -0,0 +1,56 @@
+# Python base imports - Default ones
+from time import perf_counter
+
+# Dependent software imports
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+from django.core.management.base import BaseCommand
+from django.test.utils import CaptureQueriesContext, override_settings
+
+# Custom created imports
+from app2.models import AppUser
+from app1.views import SnippetViewSet
+from app2.authentication import embed_user_claims
+
+
+class Command(BaseCommand):
+    """
+    Per-request latency of GET /snippets/ with a JWT, regular user load vs token user mode.
+
+        python manage.py benchmark_jwt_auth --employee-id EMP001 --count 200
+
+    Runs SnippetViewSet.list in process against the configured database with a freshly issued
+    token for the given account (issuing it records an OutstandingToken row, nothing else).
+    """
+
+    help = "Compare SnippetViewSet.list latency with and without JWT_TOKEN_USER_MODE."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employee-id", required = True)
+        parser.add_argument("--count", type = int, default = 200, help = "Requests per mode")
+
+    def handle(self, *args, **options):
+        count = options["count"]
+        user = AppUser.objects.get(employee_id = options["employee_id"])
+        refresh = RefreshToken.for_user(user)
+        embed_user_claims(refresh, user)
+        header = f"Bearer {refresh.access_token}"
+
+        view = SnippetViewSet.as_view({"get" : "list"})
+        factory = APIRequestFactory()
+
+        for label, mode in (("full user", False), ("token user", True)):
+            with override_settings(JWT_TOKEN_USER_MODE = mode):
+                # Warm-up: config / token version caches, first connection
+                view(factory.get("/snippets/", HTTP_AUTHORIZATION = header))
+
+                with CaptureQueriesContext(connection) as context:
+                    started = perf_counter()
+                    for _ in range(count):
+                        response = view(factory.get("/snippets/", HTTP_AUTHORIZATION = header))
+                        response.render()
+                    elapsed = perf_counter() - started
+
+            self.stdout.write(f"{label:<11}: {elapsed / count * 1000:7.2f} ms/request, "
+                              f"{len(context.captured_queries) / count:.1f} queries/request (status {response.status_code})")
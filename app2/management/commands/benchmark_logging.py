@@ -0,0 +1,109 @@
+# Python base imports - Default ones
+import os
+import copy
+import logging
+import tempfile
+import threading
+import logging.config
+from time import perf_counter
+from statistics import quantiles
+
+# Dependent software imports
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+
+
+class Command(BaseCommand):
+    """
+    Request latency of a logging-heavy code path, with synchronous handlers versus the queue.
+
+        python manage.py benchmark_logging --threads 8 --requests 4000 --records 25
+
+    Each simulated request (one loop iteration of a request thread) logs --records records through the project's
+    LOGGING handlers - central_file, app_router and console, files redirected to a temporary
+    directory and the console to os.devnull - and is timed end to end:
+
+    - sync  : root logger → the three handlers, on the request thread (previous behaviour)
+    - queue : root logger → BoundedQueueHandler, the listener thread does the writing
+
+    The queue mode also prints how long the listener needed to drain after the last request and
+    the drop counters (raise --queue-size or use --policy block if records were dropped).
+    """
+
+    help = "Benchmark p50/p95/p99 latency of a logging-heavy request with and without queue logging."
+
+    TARGETS = ["central_file", "app_router", "console"]
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type = int, default = 8, help = "Concurrent request threads")
+        parser.add_argument("--requests", type = int, default = 4000, help = "Requests per mode")
+        parser.add_argument("--records", type = int, default = 25, help = "Log records per request")
+        parser.add_argument("--queue-size", type = int, default = settings.LOG_QUEUE_SIZE)
+        parser.add_argument("--policy", default = settings.LOG_QUEUE_POLICY, choices = ["drop", "block"])
+
+    def handle(self, *args, **options):
+        try:
+            with tempfile.TemporaryDirectory() as directory:
+                for mode in ("sync", "queue"):
+                    self._run(mode, directory, options)
+        finally:
+            logging.config.dictConfig(settings.LOGGING)
+
+    def _configure(self, mode : str, directory : str, options : dict) -> None:
+        config = copy.deepcopy(settings.LOGGING)
+        handlers = config["handlers"]
+        handlers["central_file"]["filename"] = os.path.join(directory, f"{mode}-central_log.jsonl")
+        handlers["app_router"]["base_log_dir"] = os.path.join(directory, mode)
+        os.makedirs(handlers["app_router"]["base_log_dir"], exist_ok = True)
+        handlers["queue"].update({"queue_size" : options["queue_size"], "policy" : options["policy"]})
+        config["loggers"][""]["handlers"] = ["queue"] if mode == "queue" else list(self.TARGETS)
+        logging.config.dictConfig(config)
+
+        # Console output would flood the terminal - same formatting work, written to devnull
+        get_handler = getattr(logging, "getHandlerByName", None) or logging._handlers.get # Python < 3.12
+        get_handler("console").setStream(open(os.devnull, "w", encoding = "utf-8"))
+
+    def _run(self, mode : str, directory : str, options : dict) -> None:
+        self._configure(mode, directory, options)
+        logger = logging.getLogger("app1.views")
+        records = options["records"]
+
+        latencies = []
+        lock = threading.Lock()
+        remaining = iter(range(options["requests"]))
+
+        def worker():
+            local = []
+            while True:
+                with lock:
+                    request_id = next(remaining, None)
+                if request_id is None:
+                    break
+                started = perf_counter()
+                for index in range(records):
+                    logger.info("request %s step %s user=%s", request_id, index, "EMP0001", extra = {"request_id" : request_id})
+                local.append(perf_counter() - started)
+            with lock:
+                latencies.extend(local)
+
+        threads = [threading.Thread(target = worker) for _ in range(options["threads"])]
+        started = perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = perf_counter() - started
+
+        cuts = quantiles(latencies, n = 100)
+        self.stdout.write(f"{mode:<6}: {len(latencies)} requests in {elapsed:6.2f}s  p50={cuts[49] * 1000:7.2f}ms "
+                          f"p95={cuts[94] * 1000:7.2f}ms p99={cuts[98] * 1000:7.2f}ms")
+
+        if mode == "queue":
+            handler = next(handler for handler in logging.getLogger().handlers if hasattr(handler, "stats"))
+            stats = handler.stats()
+            drain_started = perf_counter()
+            handler.close()
+            self.stdout.write(f"        drained {stats['queued']} queued record(s) in {(perf_counter() - drain_started) * 1000:.0f}ms, "
+                              f"dropped {stats['dropped']} {stats['dropped_by_level']}")
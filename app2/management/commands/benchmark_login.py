@@ -0,0 +1,59 @@
+# Python base imports - Default ones
+from time import perf_counter
+
+# Dependent software imports
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth import authenticate
+from django.contrib.auth.models import update_last_login
+from django.core.management.base import BaseCommand, CommandError
+
+# Custom created imports
+from app2.models import AppUser
+from app2.services.auth_service import AuthService
+
+
+class Command(BaseCommand):
+    """
+    Login throughput benchmark against the configured database.
+
+        python manage.py benchmark_login --employee-id EMP001 --password 'Secret#123' --count 50
+
+    Compares the previous login sequence (get + authenticate() + counter save + update_last_login)
+    with AuthService.login, reporting queries per login and logins per second. The password hash
+    dominates both, so the gap is mostly the saved round trips - larger with a remote database.
+    Only writes what a real login writes (counter reset, last_login) for the given account.
+    """
+
+    help = "Benchmark AuthService.login against the previous multi-query login sequence."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employee-id", required = True, help = "Existing, unlocked account")
+        parser.add_argument("--password", required = True, help = "That account's password")
+        parser.add_argument("--count", type = int, default = 50, help = "Logins per run")
+
+    def handle(self, *args, **options):
+        employee_id, password, count = options["employee_id"], options["password"], options["count"]
+        if authenticate(employee_id = employee_id, password = password) is None:
+            raise CommandError("Credentials rejected - pass an existing, unlocked account")
+
+        for label, login in (("previous", self._previous_login), ("current", AuthService.login)):
+            with CaptureQueriesContext(connection) as context:
+                started = perf_counter()
+                for _ in range(count):
+                    login(employee_id, password)
+                elapsed = perf_counter() - started
+
+            self.stdout.write(f"{label:<9}: {count / elapsed:8.1f} logins/s, "
+                              f"{elapsed / count * 1000:.2f} ms/login, {len(context.captured_queries) / count:.1f} queries/login")
+
+    @staticmethod
+    def _previous_login(employee_id : str, password : str) -> AppUser:
+        """The login sequence AuthService used before the single-round-trip path"""
+        user = AppUser.objects.get(employee_id = employee_id)
+        user.is_locked()
+        authenticate(employee_id = employee_id, password = password)
+        user.unsuccessful_attempts = 0
+        user.save(update_fields = ["unsuccessful_attempts"])
+        update_last_login(AppUser, user)
+        return user
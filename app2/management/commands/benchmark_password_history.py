@@ -0,0 +1,58 @@
+# Python base imports - Default ones
+from time import perf_counter
+
+# Dependent software imports
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app2.models import AppUser
+from app2.services.password_history_service import PasswordHistoryService
+
+
+class Command(BaseCommand):
+    """
+    change_password() latency versus password history length.
+
+        python manage.py benchmark_password_history --lengths 0 1 3 5 10 20 --repeat 3
+
+    "legacy" has no fingerprints, so every history entry costs a PBKDF2 run (previous behaviour).
+    "fingerprint" is the current path. Both include the PBKDF2 check of the current password
+    (never fingerprinted) and the one unavoidable hash of the new password.
+    Users are built in memory - nothing is written.
+    """
+
+    help = "Benchmark AppUser.change_password latency against the password history length."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--lengths", type = int, nargs = "+", default = [0, 1, 3, 5, 10, 20])
+        parser.add_argument("--repeat", type = int, default = 3, help = "Password changes timed per length and mode")
+
+    def handle(self, *args, **options):
+        lengths, repeat = sorted(options["lengths"]), options["repeat"]
+
+        # Hash the longest history once, every length reuses a slice of it
+        passwords = [f"Old#Pass{index:03d}" for index in range(max(lengths) + 1)]
+        hashes = [make_password(password) for password in passwords]
+        fingerprints = {encoded : PasswordHistoryService.fingerprint(password) for encoded, password in zip(hashes, passwords)}
+
+        self.stdout.write(f"{'history':>8} {'legacy ms':>12} {'fingerprint ms':>15} {'speedup':>8}")
+        for length in lengths:
+            legacy = self._time(hashes[ : length + 1], {}, repeat)
+            fast = self._time(hashes[ : length + 1], fingerprints, repeat)
+            self.stdout.write(f"{length:>8} {legacy * 1000:>12.1f} {fast * 1000:>15.1f} {legacy / fast:>7.2f}x")
+
+    @staticmethod
+    def _time(hashes : list, fingerprints : dict, repeat : int) -> float:
+        elapsed = 0.0
+        for index in range(repeat):
+            user = AppUser(employee_id = "BENCHMARK")
+            # Any truthy pk enables the history check in change_password()
+            user.pk = -1
+            user.password, user.last_passwords = hashes[-1], list(hashes[ : -1])
+            user.password_fingerprints = {encoded : fingerprints[encoded] for encoded in hashes[ : -1]}
+
+            started = perf_counter()
+            user.change_password(f"New#Pass{index:03d}")
+            elapsed += perf_counter() - started
+        return elapsed / repeat
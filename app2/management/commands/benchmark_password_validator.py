@@ -0,0 +1,81 @@
+# Python base imports - Default ones
+import random
+import string
+from time import perf_counter
+from re import search as re_search
+
+# Dependent software imports
+from django.db import connection
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand
+from django.test.utils import CaptureQueriesContext
+
+# Custom created imports
+from _utils.models import GlobalAppConfig
+from app2.custom_password_validator import AppPasswordValidator
+
+
+class Command(BaseCommand):
+    """
+    AppPasswordValidator throughput.
+
+        python manage.py benchmark_password_validator --passwords 20000
+
+    "legacy" replays the previous behaviour: a fresh validator per password (as Django's
+    validate_password does) loading the seven security rows with one query each, then
+    re.search with string patterns. "validate" is a fresh validator per password on the
+    cached config, "validate_many" one batch call. Reads only - nothing is written.
+    """
+
+    help = "Benchmark AppPasswordValidator.validate / validate_many throughput."
+
+    NAMES = ("password_min_length", "password_max_length", "require_uppercase", "require_lowercase",
+             "require_numeric", "require_special", "special_characters")
+
+    def add_arguments(self, parser):
+        parser.add_argument("--passwords", type = int, default = 20000)
+        parser.add_argument("--legacy-passwords", type = int, default = 500, help = "Legacy runs 7 queries per password - keep it small")
+
+    def handle(self, *args, **options):
+        rng = random.Random(0)
+        alphabet = string.ascii_letters + string.digits + "!@#$%^&*"
+        passwords = ["".join(rng.choice(alphabet) for _ in range(rng.randint(6, 16))) for _ in range(options["passwords"])]
+
+        # Warm the config cache once, then count what a new instance costs
+        AppPasswordValidator().validate_many(passwords[ : 1])
+        with CaptureQueriesContext(connection) as context:
+            AppPasswordValidator().validate("Warm#Up123")
+        self.stdout.write(f"queries per new validator + validate(): {len(context.captured_queries)}")
+
+        legacy = passwords[ : options["legacy_passwords"]]
+        self._report("legacy", len(legacy), self._time(lambda : [self._legacy_validate(password) for password in legacy]))
+        self._report("validate", len(passwords), self._time(lambda : [self._validate(password) for password in passwords]))
+        self._report("validate_many", len(passwords), self._time(lambda : AppPasswordValidator().validate_many(passwords)))
+
+    @staticmethod
+    def _time(run) -> float:
+        started = perf_counter()
+        run()
+        return perf_counter() - started
+
+    def _report(self, label : str, count : int, elapsed : float) -> None:
+        self.stdout.write(f"{label:<14}: {count:>7} passwords in {elapsed * 1000:9.1f}ms → {count / elapsed:>10.0f}/s")
+
+    @staticmethod
+    def _validate(password : str) -> bool:
+        try:
+            AppPasswordValidator().validate(password)
+        except ValidationError:
+            return False
+        return True
+
+    def _legacy_validate(self, password : str) -> bool:
+        config = {name : GlobalAppConfig.objects.filter(category = "security", name = name).values_list("value", flat = True).first()
+                  for name in self.NAMES}
+        min_length, max_length = int(config["password_min_length"] or 8), int(config["password_max_length"] or 64)
+        if len(password) < min_length or len(password) > max_length:
+            return False
+        for pattern in ("[A-Z]", "[a-z]", "[0-9]", config["special_characters"] or "[!@#$%^&*]"):
+            if not re_search(pattern, password):
+                return False
+        return True
@@ -0,0 +1,68 @@
+# Python base imports - Default ones
+from time import perf_counter
+
+# Dependent software imports
+from django.db import connection
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.test.utils import CaptureQueriesContext, override_settings
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+# Custom created imports
+from app2.models import AppUser
+from app2.tokens import AppRefreshToken
+from app2.serializers import AppTokenRefreshSerializer
+from app2.services.token_revocation_service import TokenRevocationService
+
+
+class Command(BaseCommand):
+    """
+    Refresh latency with/without the revocation Bloom filter, plus blacklist table growth
+    projected over a simulated week.
+
+        python manage.py benchmark_token_refresh --employee-id EMP001 --count 200 --refreshes-per-day 50000
+
+    Runs real rotations (AppTokenRefreshSerializer) for one account against the configured
+    database - every rotation leaves an outstanding + blacklisted row behind, as in production.
+    The week projection uses the measured rows per refresh and REFRESH_TOKEN_LIFETIME: without
+    a purge both tables grow forever, with a daily purge_token_blacklist they plateau at one
+    token lifetime's worth of refreshes.
+    """
+
+    help = "Benchmark token refresh latency and project blacklist table growth."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--employee-id", required = True)
+        parser.add_argument("--count", type = int, default = 200, help = "Refreshes per mode")
+        parser.add_argument("--refreshes-per-day", type = int, default = 50000, help = "Traffic assumed for the week projection")
+
+    def handle(self, *args, **options):
+        user = AppUser.objects.get(employee_id = options["employee_id"])
+        count = options["count"]
+        before = (OutstandingToken.objects.count(), BlacklistedToken.objects.count())
+
+        for label, bloom in (("db lookup", False), ("bloom", True)):
+            with override_settings(JWT_REVOCATION_BLOOM = bloom):
+                TokenRevocationService.rebuild()
+                refresh = str(AppRefreshToken.for_user(user))
+
+                with CaptureQueriesContext(connection) as context:
+                    started = perf_counter()
+                    for _ in range(count):
+                        serializer = AppTokenRefreshSerializer(data = {"refresh" : refresh})
+                        serializer.is_valid(raise_exception = True)
+                        refresh = serializer.validated_data["refresh"]
+                    elapsed = perf_counter() - started
+
+            self.stdout.write(f"{label:<10}: {elapsed / count * 1000:7.2f} ms/refresh, "
+                              f"{len(context.captured_queries) / count:.1f} queries/refresh")
+
+        after = (OutstandingToken.objects.count(), BlacklistedToken.objects.count())
+        rows_per_refresh = ((after[0] - before[0]) + (after[1] - before[1])) / (count * 2 + 2)
+        lifetime_days = max(1, settings.SIMPLE_JWT["REFRESH_TOKEN_LIFETIME"].days)
+        per_day = options["refreshes_per_day"] * rows_per_refresh
+
+        self.stdout.write(f"rows per refresh (outstanding + blacklisted): {rows_per_refresh:.2f}")
+        self.stdout.write(f"{'day':>4} {'no purge':>12} {'daily purge':>12}")
+        for day in range(1, 8):
+            self.stdout.write(f"{day:>4} {per_day * day:>12,.0f} {per_day * min(day, lifetime_days):>12,.0f}")
@@ -0,0 +1,104 @@
+# Python base imports - Default ones
+import json
+import threading
+from time import perf_counter, sleep
+from collections import Counter
+from statistics import quantiles
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+
+# Dependent software imports
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+
+
+class Command(BaseCommand):
+    """
+    Latency of a non-auth endpoint while a login storm hits a running server.
+
+        uvicorn demo_app.asgi:application --workers 2 &
+        python manage.py loadtest_login_storm --employee-id EMP001 --password 'Secret#123' \\
+            --login-path /app2/api/v1/auth/login/async/
+
+    Run it once with the sync endpoint (--login-path /app2/api/v1/auth/login/) and once with the
+    async one, against the same server setup, and compare the probe p99 during the storm.
+    Phase 1 measures the probe alone, phase 2 the probe while --login-workers threads log in
+    back to back. Wrong passwords count towards the lockout - use a dedicated account.
+    """
+
+    help = "Measure non-auth endpoint p50/p95/p99 latency before and during a login storm."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default = "http://127.0.0.1:8000")
+        parser.add_argument("--login-path", default = "/app2/api/v1/auth/login/async/")
+        parser.add_argument("--probe-path", default = "/app1/snippets/styles/friendly.css", help = "Public, non-auth endpoint")
+        parser.add_argument("--employee-id", required = True)
+        parser.add_argument("--password", required = True)
+        parser.add_argument("--login-workers", type = int, default = 32, help = "Concurrent login clients")
+        parser.add_argument("--duration", type = float, default = 10.0, help = "Seconds per phase")
+        parser.add_argument("--probe-interval", type = float, default = 0.05, help = "Pause between probe requests")
+
+    def handle(self, *args, **options):
+        base_url = options["base_url"].rstrip("/")
+        probe_url, login_url = base_url + options["probe_path"], base_url + options["login_path"]
+        body = json.dumps({"employee_id" : options["employee_id"], "password" : options["password"]}).encode("utf-8")
+
+        baseline = self._probe(probe_url, options["duration"], options["probe_interval"])
+        self._report("baseline", baseline)
+
+        stop = threading.Event()
+        statuses = Counter()
+        login_latencies = []
+        lock = threading.Lock()
+
+        def storm():
+            while not stop.is_set():
+                request = Request(login_url, data = body, headers = {"Content-Type" : "application/json"}, method = "POST")
+                status, elapsed = self._call(request)
+                with lock:
+                    statuses[status] += 1
+                    login_latencies.append(elapsed)
+
+        workers = [threading.Thread(target = storm, daemon = True) for _ in range(options["login_workers"])]
+        for worker in workers:
+            worker.start()
+
+        during = self._probe(probe_url, options["duration"], options["probe_interval"])
+        stop.set()
+        for worker in workers:
+            worker.join()
+
+        self._report("storm", during)
+        self._report("logins", login_latencies)
+        self.stdout.write(f"  login statuses: {dict(sorted(statuses.items(), key = lambda item : str(item[0])))}")
+
+    def _probe(self, url : str, duration : float, interval : float) -> list:
+        latencies = []
+        deadline = perf_counter() + duration
+        while perf_counter() < deadline:
+            _, elapsed = self._call(Request(url))
+            latencies.append(elapsed)
+            sleep(interval)
+        return latencies
+
+    @staticmethod
+    def _call(request : Request):
+        started = perf_counter()
+        try:
+            with urlopen(request, timeout = 30) as response:
+                response.read()
+                status = response.status
+        except HTTPError as e:
+            status = e.code
+        except (URLError, TimeoutError):
+            status = "error"
+        return status, perf_counter() - started
+
+    def _report(self, label : str, latencies : list) -> None:
+        if len(latencies) < 2:
+            self.stdout.write(f"{label:<9}: not enough samples")
+            return
+        cuts = quantiles(latencies, n = 100)
+        self.stdout.write(f"{label:<9}: n={len(latencies):<6} p50={cuts[49] * 1000:8.1f}ms "
+                          f"p95={cuts[94] * 1000:8.1f}ms p99={cuts[98] * 1000:8.1f}ms")
@@ -0,0 +1,87 @@
+# Python base imports - Default ones
+import pstats
+import cProfile
+from time import perf_counter
+
+# Dependent software imports
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app2.models import AppUser
+from app1.models import Snippet
+
+
+class Command(BaseCommand):
+    """
+    Per-row decryption cost of one list page, before and after lazy decryption.
+
+        python manage.py profile_decryption --rows 1000
+
+    For AppUser (email, first_name, last_name, full_name, secret_hint) and Snippet (email,
+    results), on the first --rows rows:
+
+    - eager       : every encrypted column decrypted while loading (previous behaviour,
+                    reproduced through the plain _base_manager)
+    - lazy/unread : default manager, page only touches unencrypted columns
+    - lazy/read   : default manager, every encrypted column read once
+
+    "decrypts" is the number of Fernet decryptions measured with cProfile; timings include the
+    profiler overhead, equally for every mode.
+    """
+
+    help = "Profile per-row decryption cost of a list page with and without lazy decryption."
+
+    MODELS = {
+        "AppUser" : (AppUser, ("email", "first_name", "last_name", "full_name", "secret_hint")),
+        "Snippet" : (Snippet, ("email", "results")),
+    }
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rows", type = int, default = 1000)
+
+    def handle(self, *args, **options):
+        rows = options["rows"]
+        self.stdout.write(f"{'model':<8} {'mode':<13} {'rows':>6} {'decrypts':>9} {'total ms':>10} {'us/row':>9}")
+
+        for label, (model, fields) in self.MODELS.items():
+            available = model._base_manager.count()
+            if available == 0:
+                self.stdout.write(f"{label:<8} no rows - skipped")
+                continue
+            if available < rows:
+                self.stdout.write(f"{label:<8} only {available} rows available")
+
+            def page(manager, read : bool):
+                instances = list(manager.order_by("pk")[ : rows])
+                if read:
+                    for instance in instances:
+                        for field in fields:
+                            getattr(instance, field)
+                return len(instances)
+
+            modes = (
+                ("eager", lambda : page(model._base_manager, False)),
+                ("lazy/unread", lambda : page(model.objects, False)),
+                ("lazy/read", lambda : page(model.objects, True)),
+            )
+            for mode, run in modes:
+                count, decrypts, elapsed = self._profile(run)
+                self.stdout.write(f"{label:<8} {mode:<13} {count:>6} {decrypts:>9} {elapsed * 1000:>10.1f} "
+                                  f"{elapsed / max(1, count) * 1e6:>9.1f}")
+
+    @staticmethod
+    def _profile(run):
+        profiler = cProfile.Profile()
+        started = perf_counter()
+        profiler.enable()
+        try:
+            count = run()
+        finally:
+            profiler.disable()
+        elapsed = perf_counter() - started
+
+        decrypts = 0
+        for (filename, _, function), stat in pstats.Stats(profiler).stats.items(): # type: ignore
+            if function == "_decrypt_data" and filename.endswith("fernet.py"):
+                decrypts += stat[1]
+        return count, decrypts, elapsed
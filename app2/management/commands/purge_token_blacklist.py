@@ -0,0 +1,30 @@
+# Python base imports - Default ones
+
+# Dependent software imports
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app2.services.token_revocation_service import TokenRevocationService
+
+
+class Command(BaseCommand):
+    """
+    Bounded-batch replacement for simplejwt's flushexpiredtokens - run it from cron:
+
+        python manage.py purge_token_blacklist --batch-size 5000 --pause 0.2
+
+    Expired outstanding tokens can never be used again, so they and their blacklist rows go.
+    """
+
+    help = "Delete expired outstanding/blacklisted JWT refresh tokens in bounded batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type = int, default = 5000, help = "Outstanding tokens deleted per statement")
+        parser.add_argument("--max-batches", type = int, default = None, help = "Stop after this many batches (default: all)")
+        parser.add_argument("--pause", type = float, default = 0.0, help = "Seconds to sleep between batches")
+
+    def handle(self, *args, **options):
+        totals = TokenRevocationService.purge_expired(batch_size = max(1, options["batch_size"]), max_batches = options["max_batches"],
+                                                      pause = options["pause"])
+        self.stdout.write(f"Purged {totals['outstanding']} outstanding and {totals['blacklisted']} blacklisted tokens "
+                          f"in {totals['batches']} batch(es)")
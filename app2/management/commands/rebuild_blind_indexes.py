@@ -0,0 +1,51 @@
+# Python base imports - Default ones
+
+# Dependent software imports
+from django.core.management.base import BaseCommand
+
+# Custom created imports
+from app2.models import AppUser
+from app2.services.blind_index_service import BlindIndexService
+
+
+class Command(BaseCommand):
+    """
+    (Re)compute the blind-index columns of every AppUser - after adding them, or after changing
+    settings.BLIND_INDEX_KEY (including moving off the former SECRET_KEY fallback):
+
+        python manage.py rebuild_blind_indexes --batch-size 2000
+
+    Rows are walked in primary-key order and written with one bulk UPDATE per batch; save()
+    (and its side effects) is not called.
+    """
+
+    help = "Recompute AppUser blind-index columns (email / name lookups) in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type = int, default = 2000)
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        columns = list(BlindIndexService.FIELDS.values())
+        fields = ["id", *BlindIndexService.FIELDS, *columns]
+
+        last_pk, updated = 0, 0
+        while True:
+            users = list(AppUser.objects.filter(pk__gt = last_pk).order_by("pk").only(*fields)[ : batch_size])
+            if not users:
+                break
+
+            changed = []
+            for user in users:
+                digests = BlindIndexService.compute(user)
+                if any(getattr(user, column) != digest for column, digest in digests.items()):
+                    for column, digest in digests.items():
+                        setattr(user, column, digest)
+                    changed.append(user)
+
+            if changed:
+                AppUser.objects.bulk_update(changed, columns)
+            updated += len(changed)
+            last_pk = users[-1].pk
+
+        self.stdout.write(f"Blind indexes updated on {updated} user(s)")
@@ -0,0 +1,194 @@
+# Python base imports - Default ones
+import os
+import json
+import multiprocessing
+from time import perf_counter, sleep
+
+# Dependent software imports
+from django.apps import apps
+from django.conf import settings
+from django.db.models import TextField
+from django.db.models.functions import Cast
+from django.db import connections, transaction
+from cryptography.fernet import InvalidToken
+from encrypted_model_fields.fields import EncryptedMixin, get_crypter
+from django.core.management.base import BaseCommand, CommandError
+
+# Custom created imports
+from _utils.encrypted_fields import is_current
+
+
+def _run_worker(index : int, count : int, options : dict) -> None:
+    """Child process entry point (fork) - a fresh DB connection per process"""
+    connections.close_all()
+    try:
+        Command().run_worker(index, count, options)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    """
+    Rewrite encrypted columns that are still on an old FIELD_ENCRYPTION_KEY with the primary key.
+
+        # 1. FIELD_ENCRYPTION_KEY="<new primary>,<old key>" deployed everywhere
+        python manage.py reencrypt_fields --batch-size 500 --rate 2000 --workers 4
+        # 2. Interrupted? Run the same command again - it resumes from its checkpoints
+        # 3. Nothing left on the old key → drop it from FIELD_ENCRYPTION_KEY
+
+    - Every model with encrypted fields (or --models app1.Snippet ...), walked by (integer) primary key
+    - Each batch: SELECT ... FOR UPDATE of at most --batch-size rows → rows with any value not
+      on the primary key get all their encrypted columns rewritten (bulk UPDATE, no save())
+    - --rate caps rewritten rows per second per worker (sleeps between batches)
+    - --workers N forks N processes; worker i owns the i-th of N disjoint primary-key ranges.
+      Several machines: --worker-index i --worker-count N on each (one checkpoint file per worker)
+    - Checkpoint: <--checkpoint>.<i>-of-<N>.json holds each model's range and last pk done.
+      Ranges are fixed on the first run; rows created later are already on the primary key.
+    """
+
+    help = "Re-encrypt encrypted model fields with the primary FIELD_ENCRYPTION_KEY in resumable, throttled batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--models", nargs = "*", default = None, help = "app_label.Model (default: all with encrypted fields)")
+        parser.add_argument("--batch-size", type = int, default = 500)
+        parser.add_argument("--rate", type = float, default = 0.0, help = "Max rewritten rows per second per worker (0 = no limit)")
+        parser.add_argument("--workers", type = int, default = 1, help = "Local worker processes")
+        parser.add_argument("--worker-index", type = int, default = None, help = "Run only this worker (multi-machine)")
+        parser.add_argument("--worker-count", type = int, default = None)
+        parser.add_argument("--checkpoint", default = "reencrypt_checkpoint", help = "Checkpoint file prefix")
+
+    def handle(self, *args, **options):
+        keys = settings.FIELD_ENCRYPTION_KEY
+        if not isinstance(keys, (list, tuple)) or len(keys) < 2:
+            self.stdout.write("Only one FIELD_ENCRYPTION_KEY configured - nothing to rotate.")
+            return
+
+        if options["worker_index"] is not None:
+            count = options["worker_count"] or 1
+            if not 0 <= options["worker_index"] < count:
+                raise CommandError("--worker-index must be within 0 .. --worker-count - 1")
+            self.run_worker(options["worker_index"], count, options)
+            return
+
+        workers = max(1, options["workers"])
+        if workers == 1:
+            self.run_worker(0, 1, options)
+            return
+
+        # Children must open their own connections, not share the parent's socket
+        connections.close_all()
+        context = multiprocessing.get_context("fork")
+        processes = [context.Process(target = _run_worker, args = (index, workers, options)) for index in range(workers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        failed = [index for index, process in enumerate(processes) if process.exitcode != 0]
+        if failed:
+            raise CommandError(f"Worker(s) {failed} failed - rerun to resume from their checkpoints")
+
+    # ==================================== WORKER ====================================
+
+    def run_worker(self, index : int, count : int, options : dict) -> None:
+        path = f"{options['checkpoint']}.{index}-of-{count}.json"
+        checkpoint = self._load_checkpoint(path)
+
+        for model in self._get_models(options["models"]):
+            label = model._meta.label
+            state = checkpoint.get(label)
+            if state is None:
+                start, end = self._get_range(model, index, count)
+                state = checkpoint[label] = {"start" : start, "end" : end, "last_pk" : start}
+                self._save_checkpoint(path, checkpoint)
+
+            if state.get("done"):
+                continue
+
+            rewritten, unreadable = self._process(model, state, path, checkpoint, options)
+            state["done"] = True
+            self._save_checkpoint(path, checkpoint)
+            self.stdout.write(f"[worker {index}/{count}] {label}: {rewritten} row(s) re-encrypted, "
+                              f"{unreadable} row(s) unreadable with the configured keys")
+
+    @staticmethod
+    def _get_models(labels):
+        if labels:
+            return [apps.get_model(label) for label in labels]
+        return [model for model in apps.get_models() if any(isinstance(field, EncryptedMixin) for field in model._meta.concrete_fields)]
+
+    @staticmethod
+    def _get_range(model, index : int, count : int):
+        """Worker `index` of `count`: pk in (start, end] - disjoint, together covering every row"""
+        pks = model._base_manager.order_by("pk").values_list("pk", flat = True)
+        first, last = pks.first(), pks.last()
+        if first is None:
+            return 0, 0
+        low = first - 1
+        width = -(-(last - low) // count)
+        return low + index * width, min(last, low + (index + 1) * width)
+
+    def _process(self, model, state : dict, path : str, checkpoint : dict, options : dict):
+        fields = [field for field in model._meta.concrete_fields if isinstance(field, EncryptedMixin)]
+        raw_names = {field.attname : f"_raw_{field.attname}" for field in fields}
+        crypter = get_crypter()
+        batch_size, rate = max(1, options["batch_size"]), options["rate"]
+
+        rewritten = unreadable = 0
+        started = perf_counter()
+        while state["last_pk"] < state["end"]:
+            with transaction.atomic(using = model._base_manager.db):
+                rows = list(model._base_manager.select_for_update()
+                            .filter(pk__gt = state["last_pk"], pk__lte = state["end"]).order_by("pk")
+                            # Cast → raw stored text, no decryption by the field
+                            .annotate(**{raw : Cast(name, TextField()) for name, raw in raw_names.items()})
+                            .values_list("pk", *raw_names.values())[ : batch_size])
+                if not rows:
+                    state["last_pk"] = state["end"]
+                    break
+
+                changed = []
+                for pk, *values in rows:
+                    if all(value is None or is_current(value) for value in values):
+                        continue
+                    try:
+                        plaintexts = [None if value is None else crypter.decrypt(value.encode("utf-8")).decode("utf-8")
+                                      for value in values]
+                    except InvalidToken:
+                        unreadable += 1
+                        continue
+                    instance = model(pk = pk)
+                    for field, plaintext in zip(fields, plaintexts):
+                        setattr(instance, field.attname, plaintext)
+                    changed.append(instance)
+
+                if changed:
+                    # Value(..., output_field = field) → encrypted with the primary key on write
+                    model._base_manager.bulk_update(changed, [field.name for field in fields])
+                rewritten += len(changed)
+                state["last_pk"] = rows[-1][0]
+
+            self._save_checkpoint(path, checkpoint)
+
+            if rate > 0:
+                ahead = rewritten / rate - (perf_counter() - started)
+                if ahead > 0:
+                    sleep(ahead)
+        return rewritten, unreadable
+
+    # ==================================== CHECKPOINT ====================================
+
+    @staticmethod
+    def _load_checkpoint(path : str) -> dict:
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding = "utf-8") as handle:
+            return json.load(handle)
+
+    @staticmethod
+    def _save_checkpoint(path : str, checkpoint : dict) -> None:
+        # Write + rename → a crash never leaves a half-written checkpoint
+        temporary = f"{path}.tmp"
+        with open(temporary, "w", encoding = "utf-8") as handle:
+            json.dump(checkpoint, handle)
+        os.replace(temporary, path)
@@ -4,9 +4,11 @@
 from django.contrib.auth.base_user import BaseUserManager
 
 # Custom created imports
+from _utils.encrypted_fields import LazyDecryptQuerySet
+from app2.services.user_lookup_service import UserLookupService
 
 
-class CustomUserManager(BaseUserManager):
+class CustomUserManager(BaseUserManager.from_queryset(LazyDecryptQuerySet)):
     """
     Custom Manager for AppUser.
 
@@ -24,6 +26,9 @@ class CustomUserManager(BaseUserManager):
     - Django's default UserManager expects 'username'
 
     So we must define how users and superusers are created.
+
+    Querysets are LazyDecryptQuerySets: encrypted fields (email, names, secret_hint) of loaded
+    users are only decrypted when read.
     """
     # Required so Django can serialize manager in migrations
     use_in_migrations = True
@@ -62,6 +67,10 @@ class CustomUserManager(BaseUserManager):
         # Normalize email (lowercase domain part)
         extra_fields["email"] = self.normalize_email(email)
 
+        # Encrypted email → uniqueness is checked on its blind index
+        if UserLookupService.email_taken(extra_fields["email"]):
+            raise ValueError("A user with this email already exists")
+
         # ------------------------------------------------
         # Create user instance (NOT saved yet)
         # ------------------------------------------------
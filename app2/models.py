@@ -1,16 +1,24 @@
 # Python base imports - Default ones
+from typing import Optional
 
 # Dependent software imports
 from django.db import models
 from django.utils import timezone
 from django.core.validators import RegexValidator
+from django.core.exceptions import ValidationError
 from django.contrib.auth.models import AbstractUser
 from django.contrib.auth.hashers import check_password, make_password
-from encrypted_model_fields.fields import EncryptedCharField, EncryptedEmailField
 
 # Custom created imports
 from app2.manager import CustomUserManager
+from _utils.encrypted_fields import EncryptedCharField, EncryptedEmailField
 from app2.config import SecurityConfigManager
+from app2.services.lockout_service import LockoutService
+from app2.services.blind_index_service import BlindIndexService
+from app2.services.user_lookup_service import UserLookupService
+from app2.services.credential_cache_service import CredentialCache
+from app2.services.token_version_service import TokenVersionService
+from app2.services.password_history_service import PasswordHistoryService
 
 class AuditModel(models.Model):
     """
@@ -96,6 +104,18 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
     # Email stored encrypted for additional protection
     email = EncryptedEmailField(unique = True)
 
+    """
+    🔎 BLIND INDEXES (maintained by save(), see BlindIndexService)
+    Deterministic HMAC of the encrypted value above → exact-match lookups, admin search and the
+    email uniqueness check hit an index instead of decrypting every row.
+    email_bidx is normalized (lowercase) and unique - the unique flag on the encrypted email
+    itself cannot catch duplicates (random IV → every ciphertext differs).
+    """
+    email_bidx = models.CharField(max_length = 64, null = True, blank = True, unique = True, editable = False)
+    first_name_bidx = models.CharField(max_length = 64, null = True, blank = True, db_index = True, editable = False)
+    last_name_bidx = models.CharField(max_length = 64, null = True, blank = True, db_index = True, editable = False)
+    full_name_bidx = models.CharField(max_length = 64, null = True, blank = True, db_index = True, editable = False)
+
     # ============================================ CORE IDENTITY FIELDS ===============================================
 
     # ============================================ SECURITY_FIELDS ====================================================
@@ -107,12 +127,29 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
     """
     last_passwords = models.JSONField(default = list, blank = True)
 
+    """
+    🧾 PASSWORD FINGERPRINTS
+    Keyed fingerprint of the password behind each hash above (never the current one), so reuse
+    checks cost an HMAC instead of a PBKDF2 run - see PasswordHistoryService
+    Example: {"pbkdf2_sha256$..." : "<salt>$<key id>$<hmac>"}
+    """
+    password_fingerprints = models.JSONField(default = dict, blank = True)
+
     # Timestamp of last password change
     last_password_change = models.DateTimeField(default = timezone.now)
 
-    # Count of failed login attempts
+    # Count of failed login attempts (maintained by LockoutService, never read-modify-written)
     unsuccessful_attempts = models.IntegerField(default = 0)
 
+    # Time of the failure that opened the current lockout window (AUTH_LOCKOUT_WINDOW)
+    first_failed_login = models.DateTimeField(null = True, blank = True)
+
+    # Time of the latest failed login - drives the automatic unlock
+    last_failed_login = models.DateTimeField(null = True, blank = True)
+
+    # Embedded in every JWT - bumped on password change / deactivation / staff or superuser change to revoke all earlier tokens
+    token_version = models.PositiveIntegerField(default = 0)
+
     # 🎛️ DJANGO AUTH CONFIGURATION
     objects = CustomUserManager() # type: ignore
 
@@ -130,26 +167,25 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
     @classmethod
     def get_max_login_attempts(cls) -> int:
         """🔒 Get max failed login attempts from GlobalAppConfig (default: 3)"""
-        return int(SecurityConfigManager.get("auth_retries"))
+        return SecurityConfigManager.get("auth_retries")
     
     @classmethod
     def get_password_history_limit(cls) -> int:
         """📜 Get password history limit from GlobalAppConfig (default: 5)"""
-        return int(SecurityConfigManager.get("password_limit"))
+        return SecurityConfigManager.get("password_limit")
     
     @classmethod
     def get_password_age_days(cls) -> int:
         """⏰ Get password expiration age from GlobalAppConfig (default: 90 days)"""
-        return int(SecurityConfigManager.get("password_age"))
+        return SecurityConfigManager.get("password_age").days
     
     # ====================================== DYNAMIC CONFIG ACCESSORS =================================================
 
     # ====================================== SECURITY BUSINESS LOGIC ==================================================
 
     def is_locked(self) -> bool:
-        """🔒 Check if account is locked due to excessive failed logins"""
-        max_attempts = self.get_max_login_attempts()
-        return self.unsuccessful_attempts >= max_attempts
+        """🔒 Check if account is locked due to excessive failed logins (window / auto-unlock aware)"""
+        return LockoutService.is_locked(self)
     
 
     def needs_password_change(self) -> bool:
@@ -163,9 +199,8 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
     
 
     def register_failed_login(self):
-        """📈 Increment failed login counter + save efficiently"""
-        self.unsuccessful_attempts = self.unsuccessful_attempts + 1
-        self.save(update_fields = ["unsuccessful_attempts"])
+        """📈 Increment failed login counter atomically (no lost updates under concurrent failures)"""
+        return LockoutService.register_failure(self)
     
 
     def is_in_password_history(self, raw_password : str) -> bool:
@@ -174,16 +209,16 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
         Checks if raw_password matches:
         1. Current password
         2. Any stored previous passwords
+        
+        ⚡ One PBKDF2 run for the current hash, one HMAC per previous password via the stored
+        fingerprints (PBKDF2 only for entries without one)
         """
-        # Check current password
         if self.password and check_password(raw_password, self.password):
             return True
-        
-        # Check history
-        return any(check_password(raw_password, old_hash) for old_hash in (self.last_passwords or []))
+        return PasswordHistoryService.is_reused(raw_password, self.last_passwords or [], self.password_fingerprints or {})
     
 
-    def change_password(self, raw_password : str):
+    def change_password(self, raw_password : str, current_password : Optional[str] = None):
         """
         🔄 COMPLETE PASSWORD CHANGE WORKFLOW
         SINGLE ENTRY POINT for ALL password changes
@@ -193,7 +228,13 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
         • Secure hashing (Django's PBKDF2)
         • Metadata updates
         • Failed login reset
+
+        `current_password` (self-service changes) is verified, and lets the outgoing hash enter
+        the history with its fingerprint - without it that entry costs a PBKDF2 run per check.
         """
+        if current_password is not None and not check_password(current_password, self.password):
+            raise ValueError("Current password is incorrect")
+
         # 🚫 Prevent password reuse (skip for new users)
         if self.pk and self.is_in_password_history(raw_password):
             raise ValueError("Cannot reuse recent passwords")
@@ -207,12 +248,42 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
             history_limit = self.get_password_history_limit()
             self.last_passwords = history[-history_limit:]
 
+            # 🧾 Fingerprinted only now that it is no longer the live password
+            if current_password is not None:
+                self.password_fingerprints = {**(self.password_fingerprints or {}),
+                                              self.password : PasswordHistoryService.fingerprint(current_password)}
+
         # 🔐 Hash & set new password (Django handles this securely)
-        super().set_password(raw_password)
+        self.set_password(raw_password)
         
         # 📊 Update metadata
         self.last_password_change = timezone.now()
         self.unsuccessful_attempts = 0
+        self.first_failed_login = None
+        self.last_failed_login = None
+
+        # 🔓 Counters kept outside the row (CacheCounterStore) must be cleared too
+        if self.pk:
+            LockoutService.reset(self)
+
+        # 🎫 Revoke every JWT issued with the old password (persisted by the next save())
+        if self.pk:
+            self._bump_token_version()
+
+    def set_password(self, raw_password):
+        """
+        🧾 Hash the password (every path - change_password, admin, hash upgrades in
+        check_password - ends up here). Only fingerprints of hashes still in the history are
+        kept: never one of the live password, none of hashes that aged out.
+        """
+        super().set_password(raw_password)
+
+        # Old password must stop working for cached Basic-auth credentials too
+        CredentialCache.invalidate_user(self.pk)
+
+        kept = set(self.last_passwords or [])
+        self.password_fingerprints = {encoded : fingerprint for encoded, fingerprint in (self.password_fingerprints or {}).items() 
+                                      if encoded in kept}
     
     # ====================================== SECURITY BUSINESS LOGIC ==================================================
 
@@ -239,10 +310,97 @@ class AppUser(AbstractUser, AuditModel): # type: ignore
         🔄 AUTO-GENERATE full_name from first_name + last_name
         Ensures data consistency across the system
         """
-        if self.first_name and self.last_name:
-            self.full_name = f"{self.first_name} {self.last_name}"
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            update_fields = set(update_fields)
+
+        # Partial saves that don't write a name leave the (lazily decrypted) names untouched
+        if update_fields is None or update_fields & {"first_name", "last_name"}:
+            if self.first_name and self.last_name:
+                self.full_name = f"{self.first_name} {self.last_name}"
+                if update_fields is not None:
+                    update_fields.add("full_name")
+
+        # 🔎 Blind indexes follow their encrypted fields (only the ones being written)
+        for column, digest in BlindIndexService.compute(self, update_fields).items():
+            setattr(self, column, digest)
+
+        # 🚫 Deactivated / privileges changed → tokens carrying the old state must stop working
+        if self.pk and self._access_changed(update_fields):
+            self._bump_token_version()
+
+        if update_fields is not None:
+            extra_fields = BlindIndexService.columns_for(update_fields)
+            # set_password() also prunes the fingerprints (hash upgrades save only "password")
+            if "password" in update_fields:
+                extra_fields.add("password_fingerprints")
+            if getattr(self, "_token_version_bumped", False):
+                extra_fields.add("token_version")
+            kwargs["update_fields"] = {*update_fields, *extra_fields}
         
         super().save(*args, **kwargs)
+        self._remember_access(kwargs.get("update_fields"))
+
+        if getattr(self, "_token_version_bumped", False):
+            TokenVersionService.remember(self.pk, self.token_version)
+            self._token_version_bumped = False
+
+        # 🚫 Deactivated → drop cached Basic-auth credentials
+        if not self.is_active:
+            CredentialCache.invalidate_user(self.pk)
+
+    def validate_unique(self, exclude = None):
+        """
+        📧 Email uniqueness through the blind index (case-insensitive)
+
+        The generic check would compare freshly encrypted ciphertext and never find a duplicate.
+        """
+        exclude = set(exclude or ())
+        super().validate_unique(exclude = exclude | {"email", "email_bidx"})
+
+        if "email" not in exclude and self.email and UserLookupService.email_taken(self.email, exclude_pk = self.pk):
+            raise ValidationError({"email" : "A user with this email already exists."})
+
+    # Columns whose change revokes every token issued before it (token user claims, see app2.authentication)
+    ACCESS_FIELDS = ("is_active", "is_staff", "is_superuser")
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        """📸 Remember the stored access flags → save() only revokes tokens when they change"""
+        instance = super().from_db(db, field_names, values)
+        instance._remember_access(field_names)
+        return instance
+
+    def refresh_from_db(self, using = None, fields = None, from_queryset = None):
+        super().refresh_from_db(using = using, fields = fields, from_queryset = from_queryset)
+        self._remember_access(fields)
+
+    def _remember_access(self, fields = None) -> None:
+        """Snapshot the stored value of ACCESS_FIELDS (`fields` → only those that were loaded / written)"""
+        stored = dict(getattr(self, "_stored_access", None) or {})
+        for field in self.ACCESS_FIELDS:
+            if (fields is None or field in fields) and field in self.__dict__:
+                stored[field] = self.__dict__[field]
+        self._stored_access = stored
+
+    def _access_changed(self, update_fields = None) -> bool:
+        """Deactivation (True → False) or a staff / superuser change among the fields being written"""
+        stored = getattr(self, "_stored_access", None) or {}
+        for field, old_value in stored.items():
+            if update_fields is not None and field not in update_fields:
+                continue
+            new_value = self.__dict__.get(field, old_value)
+            if field == "is_active" and old_value and not new_value:
+                return True
+            if field != "is_active" and new_value != old_value:
+                return True
+        return False
+
+    def _bump_token_version(self) -> None:
+        """Once per save() - re-bumping an already bumped instance changes nothing"""
+        if not getattr(self, "_token_version_bumped", False):
+            self.token_version += 1
+            self._token_version_bumped = True
     
     # ====================================== UTILITY METHODS ==========================================================
 
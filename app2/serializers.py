@@ -2,9 +2,11 @@
 
 # Dependent software imports
 from rest_framework import serializers
-from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.serializers import TokenRefreshSerializer
 
 # Custom created imports
+from app2.tokens import AppRefreshToken
+from app2.authentication import embed_user_claims
 from app2.services.auth_service import AuthService
 
 
@@ -67,13 +69,23 @@ class LoginSerializer(serializers.Serializer):
         # 🔐 STEP 1: FULL AUTHENTICATION (All security policies enforced)
         user = AuthService.login(attrs["employee_id"], attrs["password"])
 
+        # ⏰ STEP 2-4 → shared with the async login endpoint
+        return self.build_login_response(user)
+    
+    @staticmethod
+    def build_login_response(user):
+        """
+        ⏰ Password expiration check → 🔑 JWT tokens → 📤 response body, for an authenticated user
+        (used by validate() and by the async login view after AuthService.alogin())
+        """
         # ⏰ STEP 2: PASSWORD EXPIRATION CHECK (Non-blocking warning)
         password_expired = user.needs_password_change()
         if password_expired:
             raise serializers.ValidationError("Your password has expired. Please change it.")
         
-        # 🔑 STEP 3: GENERATE JWT TOKENS (SimpleJWT)
-        refresh = RefreshToken.for_user(user)
+        # 🔑 STEP 3: GENERATE JWT TOKENS (SimpleJWT) + claims for the stateless token user
+        refresh = AppRefreshToken.for_user(user)
+        embed_user_claims(refresh, user)
 
         # 📤 STEP 4: STANDARDIZED API RESPONSE
         return {
@@ -117,4 +129,14 @@ class LoginSerializer(serializers.Serializer):
         """
         if len(value) < 8:
             raise serializers.ValidationError("Password must be at least 8 characters long")
-        return value
\ No newline at end of file
+        return value
+
+
+class AppTokenRefreshSerializer(TokenRefreshSerializer):
+    """
+    🔄 REFRESH (+ ROTATION) WITH THE FAST REVOCATION CHECK
+
+    Same request/response as simplejwt's TokenRefreshSerializer; the blacklist check of the
+    presented refresh token goes through TokenRevocationService (see AppRefreshToken).
+    """
+    token_class = AppRefreshToken
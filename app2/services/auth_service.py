@@ -1,13 +1,17 @@
 # Python base imports - Default ones
+from typing import Optional
 
 # Dependent software imports
+from django.conf import settings
+from asgiref.sync import sync_to_async
 from django.utils import timezone
-from django.contrib.auth import authenticate
-from django.contrib.auth.models import update_last_login
+from django.contrib.auth.signals import user_login_failed
 from rest_framework.exceptions import AuthenticationFailed
 
 # Custom created imports
 from app2.models import AppUser
+from app2.services.lockout_service import LockoutService
+from app2.services.hash_pool_service import PasswordHashPool
 
 
 class AuthService:
@@ -27,53 +31,145 @@ class AuthService:
         🔑 COMPLETE LOGIN WORKFLOW
         ==========================
         
-        STEP-BY-STEP PROCESS:
-        1. Fetch user by employee_id
+        STEP-BY-STEP PROCESS (async twin: alogin()):
+        1. Fetch user by employee_id (the ONLY read)
         2. Check account lock status  
-        3. Django authenticate() → password verification
+        3. Verify the password hash on that same instance
         4. Register failed attempt (if needed)
-        5. Reset counters on success
-        6. Update last_login timestamp
-        7. Return authenticated user
+        5. Reset counter + last_login in ONE conditional UPDATE
+        6. Return authenticated user
+        
+        QUERIES PER SUCCESSFUL LOGIN:
+        - Before → 4 (get + authenticate() re-fetch + counter save + update_last_login)
+        - Now    → 2 (get + one UPDATE), 1 when there is nothing to write
         
         RAISES:
         - AuthenticationFailed → Invalid credentials
         - AuthenticationFailed → Account locked
         """
 
-        # 🚀 STEP 1: LOCATE USER
-        try:
-            user = AppUser.objects.get(employee_id = employee_id)
-        except AppUser.DoesNotExist:
-            # 💡 NEVER reveal if user exists (security best practice)
-            raise AuthenticationFailed("Invalid credentials")
+        # 🚀 STEP 1 + 2: LOCATE USER, CHECK ACCOUNT LOCKOUT
+        user = AuthService._get_login_user(employee_id)
+        if user is None:
+            # ⏱️ Hash anyway so response time does not reveal unknown IDs (same as ModelBackend)
+            AppUser().set_password(password)
+            AuthService._reject_unknown(employee_id)
 
-        # 🔒 STEP 2: CHECK ACCOUNT LOCKOUT (Dynamic Config)
-        if user.is_locked():
-            raise AuthenticationFailed(f"Account locked after {user.get_max_login_attempts()} failed attempts. Contact administrator to unlock.")
+        # ✅ STEP 3: PASSWORD VERIFICATION ON THE LOADED INSTANCE
+        # Same checks as authenticate() → ModelBackend (hash + is_active), minus its second SELECT.
+        # check_password() still re-saves the hash if the hasher/iterations were upgraded.
+        # 📈 STEP 4 + 🎉 STEP 5 → _finish_login()
+        return AuthService._finish_login(user, employee_id, user.check_password(password)) # type: ignore
+    
+    
+    @staticmethod
+    async def alogin(employee_id : str, password : str):
+        """
+        ⚡ ASYNC LOGIN (ASGI) - same workflow and rules as login()
+        
+        The PBKDF2 verification runs in PasswordHashPool's worker processes and is awaited,
+        so the event loop keeps serving other requests during a login burst. The DB steps
+        run through sync_to_async.
+        
+        RAISES:
+        - AuthenticationFailed → Invalid credentials / account locked
+        - Throttled (429) → hash pool queue full, retry later
+        """
+        user = await sync_to_async(AuthService._get_login_user)(employee_id)
+
+        # Unknown IDs still pay one hash in the pool (timing)
+        password_ok = await PasswordHashPool.verify(password, user.password if user else None)
+        if user is None:
+            await sync_to_async(AuthService._reject_unknown)(employee_id)
 
-        # ✅ STEP 3: DJANGO PASSWORD VERIFICATION
-        # Uses PBKDF2 hashing + timing-attack resistance
-        authenticated_user = authenticate(employee_id = employee_id, password = password)
+        return await sync_to_async(AuthService._finish_login)(user, employee_id, password_ok, password)
+    
+    
+    @staticmethod
+    def _get_login_user(employee_id : str):
+        """🚀 STEP 1 + 2: the user to check the password against (None = unknown), lock enforced"""
+        user = AppUser.objects.filter(employee_id = employee_id).first()
+        if user is None:
+            return None
 
-        if not authenticated_user:
-            # 📈 STEP 4: REGISTER FAILED ATTEMPT
+        # 🔒 CHECK ACCOUNT LOCKOUT (Dynamic Config + window / auto-unlock)
+        lockout = LockoutService.get_status(user)
+        if lockout["is_locked"]:
+            retry = (f"Try again after {lockout['locked_until']:%Y-%m-%d %H:%M:%S %Z}." if lockout["locked_until"] 
+                     else "Contact administrator to unlock.")
+            raise AuthenticationFailed(f"Account locked after {lockout['max_attempts']} failed attempts. {retry}")
+        return user
+    
+    
+    @staticmethod
+    def _reject_unknown(employee_id : str) -> None:
+        AuthService._login_failed(employee_id)
+
+        # 💡 NEVER reveal if user exists (security best practice)
+        raise AuthenticationFailed("Invalid credentials")
+    
+    
+    @staticmethod
+    def _finish_login(user : AppUser, employee_id : str, password_ok : bool, upgrade_password : Optional[str] = None) -> AppUser:
+        """
+        📈 STEP 4 / 🎉 STEP 5 once the hash was verified (in-process or in the pool)
+        
+        `upgrade_password` → re-hash when the stored hash uses outdated hasher settings
+        (what check_password() does by itself on the synchronous path).
+        """
+        if not (password_ok and user.is_active):
+            # 📈 REGISTER FAILED ATTEMPT (atomic increment, see LockoutService)
             user.register_failed_login()
+            AuthService._login_failed(employee_id)
 
             # 💡 Don't reveal attempt count (security)
             raise AuthenticationFailed("Invalid credentials")
 
-        # 🎉 STEP 5: SUCCESS - CLEANUP & AUDIT
-        user.unsuccessful_attempts = 0  # Reset counter
-        user.save(update_fields = ["unsuccessful_attempts"])  # Efficient update
+        if upgrade_password and PasswordHashPool.must_update(user.password):
+            user.set_password(upgrade_password)
+            user.save(update_fields = ["password", "password_fingerprints"])
 
-        # 📅 STEP 6: DJANGO LAST LOGIN AUDIT
-        update_last_login(AppUser, user)
+        # 🎉 SUCCESS - CLEANUP & AUDIT IN ONE STATEMENT
+        AuthService._record_successful_login(user)
 
-        # ✅ STEP 7: RETURN SUCCESSFUL USER
+        # ✅ RETURN SUCCESSFUL USER
         return user
     
     
+    @staticmethod
+    def _login_failed(employee_id : str) -> None:
+        """📣 Keep emitting Django's user_login_failed signal (authenticate() used to send it)"""
+        user_login_failed.send(sender = __name__, credentials = {"employee_id" : employee_id})
+    
+    
+    @staticmethod
+    def _record_successful_login(user : AppUser) -> None:
+        """
+        💾 ONE CONDITIONAL UPDATE FOR EVERYTHING A SUCCESSFUL LOGIN CHANGES
+        
+        - failed-login counter cleared, only when there is one (LockoutService store;
+          with the database store those columns ride along in this UPDATE)
+        - last_login → now, unless it was written less than
+          settings.AUTH_LAST_LOGIN_RESOLUTION seconds ago (0 = always write)
+        - Nothing to change → no query at all
+        
+        Uses QuerySet.update(), so no post_save signal / auditlog entry is written for it.
+        """
+        now = timezone.now()
+        resolution = getattr(settings, "AUTH_LAST_LOGIN_RESOLUTION", 0)
+
+        changes = LockoutService.reset_changes(user)
+        if user.last_login is None or (now - user.last_login).total_seconds() >= resolution:
+            changes["last_login"] = now
+
+        if not changes:
+            return
+
+        AppUser.objects.filter(pk = user.pk).update(**changes)
+        for field, value in changes.items():
+            setattr(user, field, value)
+    
+    
     @staticmethod
     def verify_employee_exists(employee_id : str) -> bool:
         """
@@ -94,10 +190,9 @@ class AuthService:
         """
         🔓 ADMIN-ONLY: Reset failed attempts counter
         
-        USE CASE: Helpdesk unlocks locked accounts
+        USE CASE: Helpdesk unlocks locked accounts (before any automatic unlock)
         """
-        user.unsuccessful_attempts = 0
-        user.save(update_fields = ["unsuccessful_attempts"])
+        LockoutService.reset(user)
     
     
     @staticmethod
@@ -110,6 +205,7 @@ class AuthService:
         {
             "exists": true/false,
             "is_locked": true/false,
+            "locked_until": "2026-01-01T10:15:00Z" / null,  # null = no automatic unlock
             "failed_attempts": 3,
             "max_attempts": 5,
             "password_age_days": 45  # days since last change
@@ -118,11 +214,13 @@ class AuthService:
         """
         try:
             user = AppUser.objects.get(employee_id = employee_id)
+            lockout = LockoutService.get_status(user)
             return {
                 "exists" : True, 
-                "is_locked" : user.is_locked(), 
-                "failed_attempts" : user.unsuccessful_attempts, 
-                "max_attempts" : user.get_max_login_attempts(), 
+                "is_locked" : lockout["is_locked"], 
+                "locked_until" : lockout["locked_until"], 
+                "failed_attempts" : lockout["attempts"], 
+                "max_attempts" : lockout["max_attempts"], 
                 "password_expired" : user.needs_password_change(), 
                 "password_age_days" : (timezone.now() - user.last_password_change).days
             }
@@ -0,0 +1,77 @@
+# Python base imports - Default ones
+from typing import Dict, Optional
+
+# Dependent software imports
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.crypto import salted_hmac
+
+# Custom created imports
+
+
+class BlindIndexService:
+    """
+    🔎 SEARCHABLE DIGESTS OF ENCRYPTED AppUser FIELDS
+
+    WHY THIS CLASS EXISTS:
+    email / first_name / last_name / full_name are encrypted with a random IV, so the same value
+    never produces the same ciphertext: `filter(email = ...)`, admin search and the database
+    unique constraint on email cannot match anything, and a lookup meant decrypting every row.
+
+    HOW:
+    Next to each encrypted field the model stores a deterministic HMAC-SHA256 of its value
+    (<field>_bidx, indexed). Equal values → equal digests → an exact-match lookup is one index
+    probe. Emails are normalized (stripped, lowercased) first, names are matched exactly.
+
+    KEY:
+    settings.BLIND_INDEX_KEY - required, and it must differ from SECRET_KEY. Changing it invalidates
+    every stored digest - run `python manage.py rebuild_blind_indexes` afterwards. Digests of
+    low-entropy values (names) can be brute-forced by anyone holding this key, so keep it out of
+    the database.
+    """
+
+    key_salt = "app2.blind-index"
+
+    # encrypted field → digest column
+    FIELDS = {
+        "email" : "email_bidx",
+        "first_name" : "first_name_bidx",
+        "last_name" : "last_name_bidx",
+        "full_name" : "full_name_bidx",
+    }
+
+    @staticmethod
+    def _get_key() -> str:
+        key = getattr(settings, "BLIND_INDEX_KEY", None)
+        if not key or key == settings.SECRET_KEY:
+            raise ImproperlyConfigured("BLIND_INDEX_KEY must be set to a dedicated key (not SECRET_KEY)")
+        return key
+
+    @staticmethod
+    def normalize(field : str, value : str) -> str:
+        if field == "email":
+            return value.strip().lower()
+        return value
+
+    @classmethod
+    def digest(cls, field : str, value : Optional[str]) -> Optional[str]:
+        """Digest stored in FIELDS[field] for `value` (None for empty values)"""
+        if value is None or value == "":
+            return None
+        # Field name in the salt → the same string in two fields gives unrelated digests
+        return salted_hmac(f"{cls.key_salt}:{field}", cls.normalize(field, value), secret = cls._get_key(),
+                           algorithm = "sha256").hexdigest()
+
+    @classmethod
+    def compute(cls, user, fields = None) -> Dict[str, Optional[str]]:
+        """
+        {digest column : digest} for the current field values of `user` - only those in `fields`
+        when given (a partial save must not load / decrypt fields it does not write)
+        """
+        return {column : cls.digest(field, getattr(user, field)) for field, column in cls.FIELDS.items()
+                if fields is None or field in fields}
+
+    @classmethod
+    def columns_for(cls, fields) -> set:
+        """Digest columns to write alongside a partial save(update_fields = fields)"""
+        return {cls.FIELDS[field] for field in fields if field in cls.FIELDS}
@@ -0,0 +1,117 @@
+# Python base imports - Default ones
+import hashlib
+from time import monotonic
+from threading import Lock
+from collections import OrderedDict
+from typing import Dict, Optional, Set, Tuple
+
+# Dependent software imports
+from django.conf import settings
+from django.utils.crypto import salted_hmac
+
+# Custom created imports
+
+
+class CredentialCache:
+    """
+    🗝️ IN-MEMORY CACHE OF RECENTLY VERIFIED (employee_id, password) PAIRS
+
+    WHY THIS CLASS EXISTS:
+    BasicAuthentication sends credentials with every request, and each one used to pay a full
+    PBKDF2 verification. A pair verified less than settings.BASIC_AUTH_CACHE_TTL seconds ago
+    is trusted again without hashing (see app2.authentication.CachedBasicAuthentication).
+
+    WHAT IS STORED (per process, at most settings.BASIC_AUTH_CACHE_SIZE entries, LRU):
+    HMAC-SHA256(SECRET_KEY, employee_id + password) → (user pk, digest of the password hash,
+    expiry). No plaintext, no password hash.
+
+    INVALIDATION:
+    - invalidate_user() on password change, lockout and deactivation (this process)
+    - Other processes: the caller re-checks the freshly loaded user row on every hit -
+      changed password hash, is_active=False or a lock all reject the entry
+    """
+
+    key_salt = "app2.basic-auth-cache"
+
+    _lock = Lock()
+    _entries : "OrderedDict[str, Tuple[int, str, float]]" = OrderedDict()
+    _keys_by_user : Dict[int, Set[str]] = {}
+
+    @staticmethod
+    def get_ttl() -> float:
+        return getattr(settings, "BASIC_AUTH_CACHE_TTL", 60)
+
+    @staticmethod
+    def get_size() -> int:
+        return getattr(settings, "BASIC_AUTH_CACHE_SIZE", 1024)
+
+    @classmethod
+    def make_key(cls, employee_id : str, password : str) -> str:
+        return salted_hmac(cls.key_salt, f"{employee_id}\x00{password}", algorithm = "sha256").hexdigest()
+
+    @staticmethod
+    def hash_digest(encoded_password : str) -> str:
+        return hashlib.sha256((encoded_password or "").encode("utf-8")).hexdigest()
+
+    @classmethod
+    def get(cls, key : str) -> Optional[Tuple[int, str]]:
+        """(user pk, password hash digest) for a live entry, else None"""
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            user_pk, digest, expires = entry
+            if expires <= monotonic():
+                cls._discard(key, user_pk)
+                return None
+            cls._entries.move_to_end(key)
+            return user_pk, digest
+
+    @classmethod
+    def put(cls, key : str, user_pk : int, encoded_password : str) -> None:
+        ttl = cls.get_ttl()
+        if ttl <= 0:
+            return
+        with cls._lock:
+            cls._entries[key] = (user_pk, cls.hash_digest(encoded_password), monotonic() + ttl)
+            cls._entries.move_to_end(key)
+            cls._keys_by_user.setdefault(user_pk, set()).add(key)
+            while len(cls._entries) > cls.get_size():
+                old_key, (old_pk, _, _) = cls._entries.popitem(last = False)
+                cls._forget_key(old_key, old_pk)
+
+    @classmethod
+    def invalidate(cls, key : str) -> None:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is not None:
+                cls._discard(key, entry[0])
+
+    @classmethod
+    def invalidate_user(cls, user_pk : Optional[int]) -> None:
+        """🧹 Drop every cached credential of one user (password change / lockout / deactivation)"""
+        if user_pk is None:
+            return
+        with cls._lock:
+            for key in cls._keys_by_user.pop(user_pk, set()):
+                cls._entries.pop(key, None)
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+            cls._keys_by_user.clear()
+
+    # Callers hold cls._lock
+    @classmethod
+    def _discard(cls, key : str, user_pk : int) -> None:
+        cls._entries.pop(key, None)
+        cls._forget_key(key, user_pk)
+
+    @classmethod
+    def _forget_key(cls, key : str, user_pk : int) -> None:
+        keys = cls._keys_by_user.get(user_pk)
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                cls._keys_by_user.pop(user_pk, None)
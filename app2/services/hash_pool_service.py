@@ -0,0 +1,114 @@
+# Python base imports - Default ones
+import os
+import asyncio
+import logging
+from threading import Lock
+from typing import Optional
+from concurrent.futures import ProcessPoolExecutor
+
+# Dependent software imports
+from django.conf import settings
+from rest_framework.exceptions import Throttled
+from django.contrib.auth.hashers import check_password, get_hasher, identify_hasher, make_password
+
+# Custom created imports
+from _utils.process_pool import create_process_pool
+
+
+logger = logging.getLogger(__name__)
+
+
+def _verify_password(raw_password : str, encoded : Optional[str]) -> bool:
+    """Runs inside a pool worker. encoded=None → hash once anyway (unknown user timing) and fail"""
+    if encoded is None:
+        make_password(raw_password)
+        return False
+    return check_password(raw_password, encoded)
+
+
+class PasswordHashPool:
+    """
+    🧮 BOUNDED PROCESS POOL FOR PASSWORD HASH VERIFICATION
+
+    WHY THIS CLASS EXISTS:
+    A PBKDF2 check holds a worker for 100ms+ of pure CPU. On the async login endpoint it runs
+    here instead, in separate processes, while the event loop keeps serving other requests.
+
+    BACK-PRESSURE:
+    At most settings.AUTH_HASH_QUEUE_LIMIT verifications may be running or waiting per
+    process. Beyond that verify() raises Throttled → 429 with Retry-After
+    (settings.AUTH_HASH_RETRY_AFTER), so a login storm is shed instead of queueing up
+    unbounded work and memory.
+
+    SETTINGS:
+    - AUTH_HASH_WORKERS → pool processes (default: half the CPUs, at least 1)
+    - AUTH_HASH_QUEUE_LIMIT → admitted verifications (default: 4 x workers)
+
+    A slot is released when the job finishes in the pool, not when the awaiting request goes
+    away: a cancelled login (client disconnect, timeout) keeps counting while its hash still
+    occupies a worker.
+    """
+
+    # 🧵 Lazily created pool, workers started by forkserver / spawn (see _utils.process_pool)
+    _executor : Optional[ProcessPoolExecutor] = None
+    _lock = Lock()
+    _pending = 0
+
+    @staticmethod
+    def get_workers() -> int:
+        return getattr(settings, "AUTH_HASH_WORKERS", None) or max(1, (os.cpu_count() or 2) // 2)
+
+    @classmethod
+    def get_queue_limit(cls) -> int:
+        return getattr(settings, "AUTH_HASH_QUEUE_LIMIT", None) or cls.get_workers() * 4
+
+    @staticmethod
+    def get_retry_after() -> int:
+        return getattr(settings, "AUTH_HASH_RETRY_AFTER", 1)
+
+    @classmethod
+    def _get_executor(cls) -> ProcessPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = create_process_pool(max_workers = cls.get_workers())
+            return cls._executor
+
+    @classmethod
+    def _acquire(cls) -> None:
+        with cls._lock:
+            if cls._pending >= cls.get_queue_limit():
+                logger.warning(f"Password hash pool saturated ({cls._pending} pending), rejecting login")
+                raise Throttled(wait = cls.get_retry_after(), detail = "Too many concurrent logins, retry shortly.")
+            cls._pending += 1
+
+    @classmethod
+    def _release(cls) -> None:
+        with cls._lock:
+            cls._pending -= 1
+
+    @classmethod
+    async def verify(cls, raw_password : str, encoded : Optional[str]) -> bool:
+        """⚡ Await check_password(raw_password, encoded) in the pool (Throttled when saturated)"""
+        cls._acquire()
+        try:
+            future = cls._get_executor().submit(_verify_password, raw_password, encoded)
+        except BaseException:
+            cls._release()
+            raise
+
+        future.add_done_callback(lambda _ : cls._release())
+        return await asyncio.wrap_future(future)
+
+    @staticmethod
+    def must_update(encoded : str) -> bool:
+        """True when the stored hash uses another hasher / outdated settings (same rule as check_password)"""
+        preferred = get_hasher("default")
+        try:
+            hasher = identify_hasher(encoded)
+        except ValueError:
+            return False
+        return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+    @classmethod
+    def info(cls) -> dict:
+        return {"workers" : cls.get_workers(), "pending" : cls._pending, "queue_limit" : cls.get_queue_limit()}
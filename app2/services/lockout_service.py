@@ -0,0 +1,264 @@
+# Python base imports - Default ones
+import logging
+from datetime import timedelta
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+# Dependent software imports
+from django.conf import settings
+from django.core.cache import caches
+from django.utils import timezone
+from django.db import connections
+from django.db.models.sql import UpdateQuery
+from django.db.models import Case, F, Q, Value, When
+from django.db.models.functions import Coalesce
+from django.utils.module_loading import import_string
+
+# Custom created imports
+from app2.services.credential_cache_service import CredentialCache
+
+logger = logging.getLogger(__name__)
+
+
+class DatabaseCounterStore:
+    """
+    🗄️ FAILED-LOGIN COUNTER ON THE USER ROW (default)
+
+    One UPDATE ... SET unsuccessful_attempts = CASE ... END RETURNING unsuccessful_attempts,
+    first_failed_login per failure - the database does the increment (and opens a new window when
+    the old one ran out) and hands back what it wrote, so concurrent failures from any number of
+    workers are all counted and each sees its own count.
+    Works with every deployment that supports UPDATE ... RETURNING (PostgreSQL, SQLite 3.35+),
+    shares app_users as the hot table.
+    """
+
+    def register_failure(self, user, now, window : Optional[timedelta], duration : Optional[timedelta],
+                         max_attempts : int) -> Tuple[int, Optional[object], Optional[object]]:
+        # Start a fresh count (1) and window when the window opened by the first failure ran out,
+        # or an expired lock is being retried
+        restart = Q()
+        if window:
+            restart |= Q(first_failed_login__lt = now - window, unsuccessful_attempts__lt = max_attempts)
+        if duration:
+            restart |= Q(last_failed_login__lt = now - duration, unsuccessful_attempts__gte = max_attempts)
+
+        attempts = F("unsuccessful_attempts") + 1
+        window_start = Coalesce(F("first_failed_login"), Value(now))
+        if restart:
+            attempts = Case(When(restart, then = Value(1)), default = attempts)
+            window_start = Case(When(restart, then = Value(now)), default = window_start)
+
+        # QuerySet.update() returns only a row count - same UPDATE, compiled by hand with RETURNING
+        model = type(user)
+        queryset = model._default_manager.filter(pk = user.pk)
+        query = queryset.query.chain(UpdateQuery)
+        query.add_update_values({"unsuccessful_attempts" : attempts, "first_failed_login" : window_start, "last_failed_login" : now})
+        sql, params = query.get_compiler(queryset.db).as_sql()
+
+        connection = connections[queryset.db]
+        fields = [model._meta.get_field(name) for name in ("unsuccessful_attempts", "first_failed_login")]
+        columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+        with connection.cursor() as cursor:
+            cursor.execute(f"{sql} RETURNING {columns}", params)
+            row = cursor.fetchone()
+        if row is None:
+            raise model.DoesNotExist(f"User {user.pk} no longer exists")
+
+        # Raw cursor → apply the converters a queryset would (e.g. SQLite hands back the timestamp as text)
+        window_start, column = row[1], fields[1].get_col(model._meta.db_table)
+        for converter in connection.ops.get_db_converters(column) + column.get_db_converters(connection):
+            window_start = converter(window_start, column, connection)
+        return row[0], window_start, now
+
+    def get_state(self, user) -> Tuple[int, Optional[object], Optional[object]]:
+        # The row was just loaded with the user - no extra query
+        return user.unsuccessful_attempts, user.first_failed_login, user.last_failed_login
+
+    def reset_changes(self, user) -> Dict:
+        """Columns a successful login must clear - folded into AuthService's single UPDATE"""
+        if user.unsuccessful_attempts or user.first_failed_login or user.last_failed_login:
+            return {"unsuccessful_attempts" : 0, "first_failed_login" : None, "last_failed_login" : None}
+        return {}
+
+    def reset(self, user) -> None:
+        type(user)._default_manager.filter(pk = user.pk).update(unsuccessful_attempts = 0, first_failed_login = None,
+                                                                 last_failed_login = None)
+
+
+class CacheCounterStore:
+    """
+    ⚡ FAILED-LOGIN COUNTER IN A DJANGO CACHE (settings.AUTH_LOCKOUT_CACHE, default "default")
+
+    Failures never touch app_users. cache.incr() is atomic on Redis / Memcached (shared by all
+    workers) and on LocMemCache within one process - pick a shared backend in multi-worker setups.
+    A restart of the count (window ran out / expired lock) is a plain set(), so failures racing on
+    exactly that boundary may count once less.
+    """
+
+    key_prefix = "auth-lockout"
+
+    def _cache(self):
+        return caches[getattr(settings, "AUTH_LOCKOUT_CACHE", "default")]
+
+    def _keys(self, user) -> Tuple[str, str, str]:
+        prefix = f"{self.key_prefix}:{user.pk}"
+        return f"{prefix}:attempts", f"{prefix}:first", f"{prefix}:last"
+
+    @staticmethod
+    def _timeout(window : Optional[timedelta], duration : Optional[timedelta]) -> Optional[float]:
+        # Past both periods the state is irrelevant anyway - let the cache drop it
+        if window and duration:
+            return max(window, duration).total_seconds()
+        return None
+
+    def register_failure(self, user, now, window : Optional[timedelta], duration : Optional[timedelta],
+                         max_attempts : int) -> Tuple[int, Optional[object], Optional[object]]:
+        cache = self._cache()
+        attempts_key, first_key, last_key = self._keys(user)
+        timeout = self._timeout(window, duration)
+
+        attempts, window_start, last_failure = self.get_state(user)
+        if LockoutService.should_restart(attempts, window_start, last_failure, now, window, duration, max_attempts):
+            cache.set(attempts_key, 1, timeout)
+            attempts, window_start = 1, now
+        else:
+            cache.add(attempts_key, 0, timeout)
+            try:
+                attempts = cache.incr(attempts_key)
+            except ValueError:
+                # Key evicted between add() and incr()
+                cache.set(attempts_key, 1, timeout)
+                attempts = 1
+            if timeout:
+                cache.touch(attempts_key, timeout)
+            window_start = window_start or now
+
+        # Re-set with the same timeout as the counter so the window start never expires before it
+        cache.set_many({first_key : window_start, last_key : now}, timeout)
+        return attempts, window_start, now
+
+    def get_state(self, user) -> Tuple[int, Optional[object], Optional[object]]:
+        attempts_key, first_key, last_key = self._keys(user)
+        values = self._cache().get_many([attempts_key, first_key, last_key])
+        return values.get(attempts_key, 0), values.get(first_key), values.get(last_key)
+
+    def reset_changes(self, user) -> Dict:
+        self.reset(user)
+        return {}
+
+    def reset(self, user) -> None:
+        self._cache().delete_many(list(self._keys(user)))
+
+
+class LockoutService:
+    """
+    🛡️ ACCOUNT LOCKOUT ENGINE
+
+    WHY THIS CLASS EXISTS:
+    AppUser.register_failed_login() used to read the counter into Python, add 1 and save it back.
+    Concurrent failures (several workers, one brute-forced account) overwrote each other's
+    increments, so more guesses than "auth_retries" got through before the lock applied.
+
+    RULES (seconds from settings, 0 = disabled):
+    - Failures are counted atomically by the configured store (AUTH_LOCKOUT_STORE)
+    - AUTH_LOCKOUT_WINDOW → the first failure opens a window of WINDOW seconds, failures inside
+      it are counted. The first failure after it ran out starts a new count and a new window -
+      the count never carries failures older than WINDOW seconds from the window start, however
+      closely they are spaced.
+    - "auth_retries" failures → locked
+    - AUTH_LOCKOUT_DURATION → automatic unlock that long after the last failure
+      (0 = stays locked until AuthService.unlock_account / a successful password change)
+    - Successful login → counter cleared
+
+    Requests already past the lock check when the limit is reached still get their password
+    checked - at most one guess per request that was in flight at that moment.
+    """
+
+    DEFAULT_STORE = "app2.services.lockout_service.DatabaseCounterStore"
+
+    @staticmethod
+    @lru_cache(maxsize = None)
+    def _load_store(path : str):
+        return import_string(path)()
+
+    @classmethod
+    def get_store(cls):
+        return cls._load_store(getattr(settings, "AUTH_LOCKOUT_STORE", cls.DEFAULT_STORE))
+
+    @staticmethod
+    def _seconds(name : str) -> Optional[timedelta]:
+        seconds = getattr(settings, name, 0)
+        return timedelta(seconds = seconds) if seconds else None
+
+    @classmethod
+    def get_window(cls) -> Optional[timedelta]:
+        return cls._seconds("AUTH_LOCKOUT_WINDOW")
+
+    @classmethod
+    def get_duration(cls) -> Optional[timedelta]:
+        return cls._seconds("AUTH_LOCKOUT_DURATION")
+
+    @staticmethod
+    def should_restart(attempts : int, window_start, last_failure, now, window : Optional[timedelta],
+                       duration : Optional[timedelta], max_attempts : int) -> bool:
+        """Python twin of DatabaseCounterStore's CASE: does the next failure start a new count?"""
+        if last_failure is None:
+            return False
+        if attempts < max_attempts:
+            return bool(window) and window_start is not None and window_start < now - window # type: ignore
+        return bool(duration) and last_failure < now - duration # type: ignore
+
+    # ==================================== PUBLIC API ====================================
+
+    @classmethod
+    def register_failure(cls, user) -> int:
+        """📈 Count one failed login atomically, returns the attempts now on record"""
+        now = timezone.now()
+        max_attempts = user.get_max_login_attempts()
+        attempts, window_start, last_failure = cls.get_store().register_failure(user, now, cls.get_window(), cls.get_duration(),
+                                                                                max_attempts)
+
+        # Keep the in-memory instance in step with what was stored
+        user.unsuccessful_attempts, user.first_failed_login, user.last_failed_login = attempts, window_start, last_failure
+        if attempts >= max_attempts:
+            # Locked → cached Basic-auth credentials must stop working immediately
+            CredentialCache.invalidate_user(user.pk)
+            if attempts == max_attempts:
+                logger.warning(f"Account {user} locked after {attempts} failed login attempts")
+        return attempts
+
+    @classmethod
+    def get_status(cls, user) -> Dict:
+        """
+        📊 CURRENT LOCKOUT STATE
+        ```
+        {"attempts" : 2, "max_attempts" : 3, "is_locked" : false, "locked_until" : null}
+        ```
+        `attempts` already ignores failures that fell out of the window / an expired lock.
+        """
+        now = timezone.now()
+        max_attempts = user.get_max_login_attempts()
+        attempts, window_start, last_failure = cls.get_store().get_state(user)
+        window, duration = cls.get_window(), cls.get_duration()
+
+        if cls.should_restart(attempts, window_start, last_failure, now, window, duration, max_attempts):
+            attempts = 0
+
+        is_locked = attempts >= max_attempts
+        locked_until = last_failure + duration if is_locked and duration and last_failure else None
+        return {"attempts" : attempts, "max_attempts" : max_attempts, "is_locked" : is_locked, "locked_until" : locked_until}
+
+    @classmethod
+    def is_locked(cls, user) -> bool:
+        return cls.get_status(user)["is_locked"]
+
+    @classmethod
+    def reset_changes(cls, user) -> Dict:
+        """Column updates a successful login applies (DB store), or {} once the store was cleared"""
+        return cls.get_store().reset_changes(user)
+
+    @classmethod
+    def reset(cls, user) -> None:
+        """🔓 Clear the counter (admin unlock)"""
+        cls.get_store().reset(user)
+        user.unsuccessful_attempts, user.first_failed_login, user.last_failed_login = 0, None, None
@@ -0,0 +1,97 @@
+# Python base imports - Default ones
+import hashlib
+import secrets
+from typing import Dict, Iterable
+
+# Dependent software imports
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils.crypto import constant_time_compare, salted_hmac
+from django.contrib.auth.hashers import check_password
+
+# Custom created imports
+
+
+class PasswordHistoryService:
+    """
+    📜 BOUNDED-COST PASSWORD REUSE DETECTION
+
+    WHY THIS CLASS EXISTS:
+    AppUser.is_in_password_history() ran check_password() - a full PBKDF2 run (~0.1-0.3s) - against
+    the current hash and every entry of last_passwords: 6 runs per password change with the
+    default history of 5, growing linearly with "password_limit".
+
+    HOW:
+    When a hash moves into last_passwords and its password is known (the verified current
+    password of a self-service change), a keyed fingerprint of it is stored next to the hash
+    (AppUser.password_fingerprints, {hash : fingerprint}):
+
+        "<random salt>$<key id>$<HMAC-SHA256(key, salt + password)>"
+
+    A reuse check is then one PBKDF2 run for the current hash plus one HMAC per history entry
+    (microseconds). PBKDF2 only runs for entries without a usable fingerprint: hashes that
+    entered the history without their password (admin resets, rows older than fingerprints),
+    or fingerprints made with a previous key (key id mismatch) - so key rotation never lets a
+    reused password through, it only makes those entries slow until they age out.
+
+    The CURRENT password is never fingerprinted: a fast hash of a live password would let
+    anyone holding the database and the key guess it at HMAC speed instead of PBKDF2 speed.
+
+    KEY:
+    settings.PASSWORD_HISTORY_KEY - required, and it must differ from SECRET_KEY. Even for old
+    passwords a fingerprint is a fast hash, so keep the key out of the database.
+    """
+
+    key_salt = "app2.password-history"
+
+    @staticmethod
+    def _get_key() -> str:
+        key = getattr(settings, "PASSWORD_HISTORY_KEY", None)
+        if not key or key == settings.SECRET_KEY:
+            raise ImproperlyConfigured("PASSWORD_HISTORY_KEY must be set to a dedicated key (not SECRET_KEY)")
+        return key
+
+    @classmethod
+    def _key_id(cls) -> str:
+        # Identifies the key without revealing it
+        return hashlib.sha256(f"{cls.key_salt}:{cls._get_key()}".encode()).hexdigest()[ : 8]
+
+    @classmethod
+    def _digest(cls, salt : str, raw_password : str) -> str:
+        return salted_hmac(cls.key_salt, f"{salt}{raw_password}", secret = cls._get_key(), algorithm = "sha256").hexdigest()
+
+    @classmethod
+    def fingerprint(cls, raw_password : str) -> str:
+        salt = secrets.token_hex(8)
+        return f"{salt}${cls._key_id()}${cls._digest(salt, raw_password)}"
+
+    @classmethod
+    def matches(cls, raw_password : str, fingerprint : str):
+        """True / False, or None when the fingerprint cannot answer (malformed / other key)"""
+        try:
+            salt, key_id, digest = fingerprint.split("$")
+        except (AttributeError, ValueError):
+            return None
+        if key_id != cls._key_id():
+            return None
+        return constant_time_compare(digest, cls._digest(salt, raw_password))
+
+    @classmethod
+    def is_reused(cls, raw_password : str, hashes : Iterable[str], fingerprints : Dict[str, str]) -> bool:
+        """
+        🔍 Does raw_password match any of `hashes`?
+
+        Cheap fingerprint checks for every entry first, PBKDF2 only for the entries they could
+        not answer - and it stops at the first match.
+        """
+        unresolved = []
+        for encoded in hashes:
+            if not encoded:
+                continue
+            result = cls.matches(raw_password, fingerprints.get(encoded, ""))
+            if result:
+                return True
+            if result is None:
+                unresolved.append(encoded)
+
+        return any(check_password(raw_password, encoded) for encoded in unresolved)
@@ -0,0 +1,192 @@
+# Python base imports - Default ones
+import math
+import hashlib
+import logging
+from time import monotonic, sleep
+from threading import Lock
+from typing import Dict, Optional
+
+# Dependent software imports
+from django.conf import settings
+from django.utils import timezone
+from django.db.models import Max
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+
+# Custom created imports
+
+
+logger = logging.getLogger(__name__)
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings (token jtis).
+
+    "Not in the filter" is definite, "in the filter" means "maybe" (false-positive rate
+    `error_rate` up to `capacity` items).
+    """
+
+    def __init__(self, capacity : int, error_rate : float = 0.001):
+        capacity = max(1, capacity)
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item : str):
+        # Double hashing: k positions from the two halves of one 128-bit digest
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size = 16).digest()
+        first, second = int.from_bytes(digest[ : 8], "big"), int.from_bytes(digest[8 : ], "big") | 1
+        return ((first + index * second) % self.size for index in range(self.hash_count))
+
+    def add(self, item : str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item : str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+class TokenRevocationService:
+    """
+    🚫 REFRESH TOKEN REVOCATION CHECK + BLACKLIST HOUSEKEEPING
+
+    WHY THIS CLASS EXISTS:
+    With ROTATE_REFRESH_TOKENS + BLACKLIST_AFTER_ROTATION every refresh runs a
+    blacklist JOIN outstanding lookup, and both tables only ever grow.
+
+    REVOCATION CHECK (is_revoked):
+    - An in-process Bloom filter holds the jti of every blacklisted, not yet expired token
+    - Not in the filter → not revoked, no query (the common case: a valid token)
+    - Maybe in the filter → confirmed with the usual DB lookup
+    - Rebuilt from the table every JWT_REVOCATION_REBUILD_INTERVAL seconds (drops expired
+      entries), topped up with rows added by other processes every
+      JWT_REVOCATION_SYNC_INTERVAL seconds (one primary-key range query)
+    - Tokens blacklisted by this process are added immediately
+
+    ⚠️ A token blacklisted by ANOTHER process is accepted here for at most
+    JWT_REVOCATION_SYNC_INTERVAL seconds. JWT_REVOCATION_BLOOM = False → plain DB check.
+
+    HOUSEKEEPING (purge_expired):
+    Deletes expired outstanding tokens (their blacklist rows cascade) in bounded batches -
+    unlike simplejwt's flushexpiredtokens, which deletes everything in one statement.
+    """
+
+    _lock = Lock()
+    _bloom : Optional[BloomFilter] = None
+    _built_at = 0.0
+    _synced_at = 0.0
+    _last_id = 0
+
+    # ==================================== SETTINGS ====================================
+
+    @staticmethod
+    def is_enabled() -> bool:
+        return getattr(settings, "JWT_REVOCATION_BLOOM", True)
+
+    @staticmethod
+    def get_sync_interval() -> float:
+        return getattr(settings, "JWT_REVOCATION_SYNC_INTERVAL", 5)
+
+    @staticmethod
+    def get_rebuild_interval() -> float:
+        return getattr(settings, "JWT_REVOCATION_REBUILD_INTERVAL", 3600)
+
+    @staticmethod
+    def get_capacity() -> int:
+        return getattr(settings, "JWT_REVOCATION_BLOOM_CAPACITY", 100000)
+
+    # Ids committed out of order (concurrent transactions) are re-read by looking back this far
+    sync_overlap = 200
+
+    # ==================================== REVOCATION ====================================
+
+    @classmethod
+    def is_revoked(cls, jti : str) -> bool:
+        if cls.is_enabled():
+            bloom = cls._get_bloom()
+            if jti not in bloom:
+                return False
+        return BlacklistedToken.objects.filter(token__jti = jti).exists()
+
+    @classmethod
+    def mark_revoked(cls, jti : str) -> None:
+        """Called right after this process blacklisted a token"""
+        bloom = cls._bloom
+        if bloom is not None:
+            with cls._lock:
+                bloom.add(jti)
+
+    @classmethod
+    def _get_bloom(cls) -> BloomFilter:
+        now = monotonic()
+        if cls._bloom is None or now - cls._built_at >= cls.get_rebuild_interval():
+            with cls._lock:
+                # Another thread may have rebuilt it while this one waited
+                if cls._bloom is None or monotonic() - cls._built_at >= cls.get_rebuild_interval():
+                    cls._rebuild()
+        elif now - cls._synced_at >= cls.get_sync_interval() and cls._lock.acquire(blocking = False):
+            # One thread syncs, the others keep using the current filter meanwhile
+            try:
+                cls._sync(now)
+            finally:
+                cls._lock.release()
+        return cls._bloom # type: ignore
+
+    @classmethod
+    def rebuild(cls) -> BloomFilter:
+        """Fresh filter from every blacklisted token that has not expired yet"""
+        with cls._lock:
+            return cls._rebuild()
+
+    @classmethod
+    def _rebuild(cls) -> BloomFilter:
+        """Caller holds the lock"""
+        # Read the high-water mark first - later rows are picked up by _sync()
+        last_id = BlacklistedToken.objects.aggregate(last = Max("id"))["last"] or 0
+
+        queryset = BlacklistedToken.objects.filter(token__expires_at__gt = timezone.now())
+        bloom = BloomFilter(max(cls.get_capacity(), queryset.count() * 2))
+        for jti in queryset.values_list("token__jti", flat = True).iterator(chunk_size = 5000):
+            bloom.add(jti)
+
+        cls._bloom, cls._last_id = bloom, last_id
+        cls._built_at = cls._synced_at = monotonic()
+        logger.info(f"Token revocation filter rebuilt with {bloom.count} entries")
+        return bloom
+
+    @classmethod
+    def _sync(cls, now : float) -> None:
+        """Add rows blacklisted elsewhere since the last sync (caller holds the lock)"""
+        rows = BlacklistedToken.objects.filter(id__gt = cls._last_id - cls.sync_overlap).values_list("id", "token__jti")
+        for row_id, jti in rows:
+            cls._bloom.add(jti) # type: ignore
+            cls._last_id = max(cls._last_id, row_id)
+        cls._synced_at = now
+
+    # ==================================== HOUSEKEEPING ====================================
+
+    @staticmethod
+    def purge_expired(batch_size : int = 5000, max_batches : Optional[int] = None, pause : float = 0.0) -> Dict:
+        """
+        🧹 Delete expired outstanding tokens (+ their blacklist rows) batch by batch
+
+        Each batch is its own short DELETE, so locks and WAL stay bounded however far behind
+        the purge is. Returns {"outstanding" : 12000, "blacklisted" : 11000, "batches" : 3}.
+        """
+        totals = {"outstanding" : 0, "blacklisted" : 0, "batches" : 0}
+        now = timezone.now()
+        while max_batches is None or totals["batches"] < max_batches:
+            ids = list(OutstandingToken.objects.filter(expires_at__lte = now).order_by("id")
+                       .values_list("id", flat = True)[ : batch_size])
+            if not ids:
+                break
+
+            _, deleted = OutstandingToken.objects.filter(id__in = ids).delete()
+            totals["outstanding"] += deleted.get(OutstandingToken._meta.label, 0)
+            totals["blacklisted"] += deleted.get(BlacklistedToken._meta.label, 0)
+            totals["batches"] += 1
+            if pause:
+                sleep(pause)
+        return totals
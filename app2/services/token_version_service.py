@@ -0,0 +1,52 @@
+# Python base imports - Default ones
+from typing import Optional
+
+# Dependent software imports
+from django.conf import settings
+from django.core.cache import caches
+from django.contrib.auth import get_user_model
+
+# Custom created imports
+
+
+class TokenVersionService:
+    """
+    🏷️ PER-USER TOKEN VERSION
+
+    Every JWT carries the user's token_version at issue time ("token_version" claim). Bumping
+    the version (password change, deactivation) makes every earlier access / refresh token
+    fail authentication, without a blacklist lookup per request.
+
+    The current version is read from the cache (settings.JWT_TOKEN_VERSION_CACHE alias,
+    settings.JWT_TOKEN_VERSION_CACHE_TTL seconds) and only falls back to a single-column
+    SELECT - no encrypted field is loaded or decrypted. Saves of AppUser refresh the cached
+    value; with a per-process cache other workers see a bump after at most the TTL.
+    """
+
+    key_prefix = "auth-token-version"
+
+    @staticmethod
+    def _cache():
+        return caches[getattr(settings, "JWT_TOKEN_VERSION_CACHE", "default")]
+
+    @staticmethod
+    def get_ttl() -> int:
+        return getattr(settings, "JWT_TOKEN_VERSION_CACHE_TTL", 30)
+
+    @classmethod
+    def _key(cls, user_pk) -> str:
+        return f"{cls.key_prefix}:{user_pk}"
+
+    @classmethod
+    def get(cls, user_pk) -> Optional[int]:
+        """Current version, None for an unknown user"""
+        version = cls._cache().get(cls._key(user_pk))
+        if version is None:
+            version = get_user_model()._default_manager.filter(pk = user_pk).values_list("token_version", flat = True).first()
+            if version is not None:
+                cls.remember(user_pk, version)
+        return version
+
+    @classmethod
+    def remember(cls, user_pk, version : int) -> None:
+        cls._cache().set(cls._key(user_pk), version, cls.get_ttl())
@@ -0,0 +1,59 @@
+# Python base imports - Default ones
+from typing import Optional
+
+# Dependent software imports
+from django.db.models import Q
+from django.contrib.auth import get_user_model
+
+# Custom created imports
+from app2.services.blind_index_service import BlindIndexService
+
+
+class UserLookupService:
+    """
+    👤 FIND USERS BY ENCRYPTED FIELDS THROUGH THEIR BLIND INDEXES
+
+    Every method is an indexed equality filter on a <field>_bidx column - no row is decrypted to
+    decide whether it matches (see BlindIndexService).
+
+    USAGE:
+    UserLookupService.find_by_email("John.Doe@Company.com ") → AppUser or None
+    UserLookupService.email_taken("john.doe@company.com", exclude_pk = user.pk) → True / False
+    AppUser.objects.filter(UserLookupService.search_q("John Doe"))
+    """
+
+    @staticmethod
+    def _queryset():
+        return get_user_model()._default_manager.all()
+
+    @staticmethod
+    def match_q(field : str, value : Optional[str]) -> Q:
+        """Exact match on one encrypted field (Q that matches nothing for empty values)"""
+        digest = BlindIndexService.digest(field, value)
+        if digest is None:
+            return Q(pk__in = [])
+        return Q(**{BlindIndexService.FIELDS[field] : digest})
+
+    @classmethod
+    def find_by_email(cls, email : str):
+        """Email comparison is case-insensitive and ignores surrounding spaces"""
+        return cls._queryset().filter(cls.match_q("email", email)).first()
+
+    @classmethod
+    def email_taken(cls, email : str, exclude_pk = None) -> bool:
+        queryset = cls._queryset().filter(cls.match_q("email", email))
+        if exclude_pk is not None:
+            queryset = queryset.exclude(pk = exclude_pk)
+        return queryset.exists()
+
+    @classmethod
+    def search_q(cls, term : str) -> Q:
+        """
+        Users whose email, full name, first name or last name equals `term` - or, for a
+        multi-word term, whose first / last name equals one of the words.
+        """
+        term = term.strip()
+        query = cls.match_q("email", term) | cls.match_q("full_name", term)
+        for word in {term, *term.split()}:
+            query |= cls.match_q("first_name", word) | cls.match_q("last_name", word)
+        return query
@@ -1,3 +1,592 @@
-from django.test import TestCase
+# Python base imports - Default ones
+import asyncio
+import multiprocessing
+from time import sleep, time
+from base64 import b64encode
+from datetime import timedelta
+from unittest.mock import patch
+from threading import Barrier, Event, Thread
+from concurrent.futures import ThreadPoolExecutor
 
-# Create your tests here.
+# Dependent software imports
+from django.conf import settings
+from django.db import connection, connections
+from django.utils import timezone
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIRequestFactory
+from rest_framework.request import Request
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework.exceptions import AuthenticationFailed
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+# Custom created imports
+from app2.models import AppUser
+from app2.checks import check_secret_keys
+from app2.config import SecurityConfigManager
+from app2.custom_password_validator import AppPasswordValidator
+from _utils.app_config import AppConfigService
+from _utils.models import GlobalAppConfig
+from app2.services.auth_service import AuthService
+from app2.services.hash_pool_service import PasswordHashPool
+from app2.tokens import AppRefreshToken
+from app2.authentication import AppJWTAuthentication, CachedBasicAuthentication, embed_user_claims
+from app2.serializers import AppTokenRefreshSerializer
+from app2.services.credential_cache_service import CredentialCache
+from app2.services.token_revocation_service import BloomFilter, TokenRevocationService
+from app2.services.lockout_service import LockoutService
+from app2.services.password_history_service import PasswordHistoryService
+from app2.services.blind_index_service import BlindIndexService
+from app2.services.user_lookup_service import UserLookupService
+
+
+class LoginQueryCountTests(TestCase):
+    """AuthService.login round trips: one SELECT, at most one UPDATE"""
+
+    PASSWORD = "Valid#Pass123"
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0001", password = self.PASSWORD, email = "emp1@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+        # Security config is loaded once per process - keep that query out of the counts
+        AppUser.get_max_login_attempts()
+
+    def _login(self, password : str):
+        with CaptureQueriesContext(connection) as context:
+            try:
+                AuthService.login(self.user.employee_id, password)
+            except AuthenticationFailed:
+                pass
+        return context.captured_queries
+
+    @override_settings(AUTH_LAST_LOGIN_RESOLUTION = 60)
+    def test_successful_login_reads_once_and_writes_once(self):
+        queries = self._login(self.PASSWORD)
+        self.assertEqual(len(queries), 2, [q["sql"] for q in queries])
+        self.assertTrue(queries[1]["sql"].startswith("UPDATE"))
+
+        # Counter already 0 and last_login fresh → nothing to write
+        self.assertEqual(len(self._login(self.PASSWORD)), 1)
+
+    @override_settings(AUTH_LAST_LOGIN_RESOLUTION = 0)
+    def test_counter_reset_and_last_login_share_one_update(self):
+        self._login("Wrong#Pass123")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.unsuccessful_attempts, 1)
+
+        queries = self._login(self.PASSWORD)
+        self.assertEqual(len(queries), 2, [q["sql"] for q in queries])
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.unsuccessful_attempts, 0)
+        self.assertIsNotNone(self.user.last_login)
+
+    def test_unknown_employee_is_rejected_with_generic_message(self):
+        with self.assertRaisesMessage(AuthenticationFailed, "Invalid credentials"):
+            AuthService.login("NOBODY", self.PASSWORD)
+
+
+class LockoutTests(TransactionTestCase):
+    """Failed-login counting under concurrency, window from the first failure and automatic unlock"""
+
+    THREADS = 25
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0002", password = "Valid#Pass123", email = "emp2@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+
+    def _hammer(self) -> list:
+        """THREADS workers, each holding its own stale copy of the user, fail at the same moment"""
+        barrier = Barrier(self.THREADS)
+        counts = []
+
+        def worker():
+            try:
+                user = AppUser.objects.get(pk = self.user.pk)
+                barrier.wait()
+                counts.append(LockoutService.register_failure(user))
+            finally:
+                connection.close()
+
+        threads = [Thread(target = worker) for _ in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return counts
+
+    @override_settings(AUTH_LOCKOUT_WINDOW = 0, AUTH_LOCKOUT_DURATION = 0)
+    def test_database_store_counts_every_concurrent_failure(self):
+        counts = self._hammer()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.unsuccessful_attempts, self.THREADS)
+        self.assertTrue(self.user.is_locked())
+
+        # Each failure got the count its own UPDATE wrote - no two saw the same value
+        self.assertEqual(sorted(counts), list(range(1, self.THREADS + 1)))
+
+    @override_settings(AUTH_LOCKOUT_WINDOW = 0, AUTH_LOCKOUT_DURATION = 0,
+                       AUTH_LOCKOUT_STORE = "app2.services.lockout_service.CacheCounterStore",
+                       CACHES = {"default" : {"BACKEND" : "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_cache_store_counts_every_concurrent_failure(self):
+        self._hammer()
+        self.assertEqual(LockoutService.get_status(self.user)["attempts"], self.THREADS)
+
+        # Counters live in the cache - the user row is never written
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.unsuccessful_attempts, 0)
+
+        LockoutService.reset(self.user)
+        self.assertFalse(self.user.is_locked())
+
+    @override_settings(AUTH_LOCKOUT_WINDOW = 0, AUTH_LOCKOUT_DURATION = 0,
+                       AUTH_LOCKOUT_STORE = "app2.services.lockout_service.CacheCounterStore",
+                       CACHES = {"default" : {"BACKEND" : "django.core.cache.backends.locmem.LocMemCache"}})
+    def test_password_change_unlocks_cache_store(self):
+        for _ in range(AppUser.get_max_login_attempts()):
+            self.user.register_failed_login()
+        self.assertTrue(self.user.is_locked())
+
+        self.user.change_password("Changed#Pass456")
+        self.user.save()
+        self.assertFalse(AppUser.objects.get(pk = self.user.pk).is_locked())
+
+    @override_settings(AUTH_LOCKOUT_WINDOW = 60, AUTH_LOCKOUT_DURATION = 300)
+    def test_window_restarts_count_and_lock_expires(self):
+        max_attempts = AppUser.get_max_login_attempts()
+        now = timezone.now()
+
+        # Window opened by the first failure ran out → counting starts again
+        AppUser.objects.filter(pk = self.user.pk).update(unsuccessful_attempts = max_attempts - 1,
+                                                         first_failed_login = now - timedelta(minutes = 2),
+                                                         last_failed_login = now - timedelta(minutes = 2))
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.register_failed_login(), 1)
+        self.assertGreaterEqual(self.user.first_failed_login, now)
+
+        # Locked within the duration...
+        AppUser.objects.filter(pk = self.user.pk).update(unsuccessful_attempts = max_attempts,
+                                                         last_failed_login = now - timedelta(minutes = 1))
+        self.user.refresh_from_db()
+        status = LockoutService.get_status(self.user)
+        self.assertTrue(status["is_locked"])
+        self.assertIsNotNone(status["locked_until"])
+
+        # ...and unlocked once it has passed
+        AppUser.objects.filter(pk = self.user.pk).update(last_failed_login = now - timedelta(minutes = 10))
+        self.user.refresh_from_db()
+        self.assertFalse(self.user.is_locked())
+        self.assertEqual(self.user.register_failed_login(), 1)
+
+    def _spaced_failures(self, failures : int) -> list:
+        """Failures 40s apart - each within 60s of the previous one, so a quiet-gap reset would never fire"""
+        start = timezone.now() - timedelta(seconds = 40 * failures)
+        counts = []
+        for step in range(failures):
+            with patch("app2.services.lockout_service.timezone.now", return_value = start + timedelta(seconds = 40 * step)):
+                counts.append(LockoutService.register_failure(self.user))
+        return counts
+
+    @override_settings(AUTH_LOCKOUT_WINDOW = 60, AUTH_LOCKOUT_DURATION = 300)
+    def test_window_starts_at_first_failure(self):
+        for store in ("app2.services.lockout_service.DatabaseCounterStore", "app2.services.lockout_service.CacheCounterStore"):
+            with self.subTest(store = store), override_settings(AUTH_LOCKOUT_STORE = store,
+                                                               CACHES = {"default" : {"BACKEND" : "django.core.cache.backends.locmem.LocMemCache"}}):
+                LockoutService.reset(self.user)
+                counts = self._spaced_failures(5)
+
+                # 0s, 40s → same window; 80s → new window opened, 120s → counted in it, 160s → new window again
+                self.assertEqual(counts, [1, 2, 1, 2, 1])
+
+
+class PasswordHistoryTests(TestCase):
+    """Reuse detection through fingerprints of previous passwords, PBKDF2 for the current one"""
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0003", password = "First#Pass123", email = "emp3@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+        self.user.change_password("Second#Pass123", current_password = "First#Pass123")
+        self.user.save()
+
+    def test_only_previous_passwords_are_fingerprinted(self):
+        self.user.refresh_from_db()
+        self.assertEqual(set(self.user.password_fingerprints), set(self.user.last_passwords))
+        self.assertNotIn(self.user.password, self.user.password_fingerprints)
+
+        # Admin reset: the outgoing password is unknown → its entry has no fingerprint
+        self.user.change_password("Third#Pass123")
+        self.assertEqual(len(self.user.last_passwords), 2)
+        self.assertEqual(set(self.user.password_fingerprints), {self.user.last_passwords[0]})
+
+    def test_wrong_current_password_is_rejected(self):
+        with self.assertRaisesMessage(ValueError, "Current password is incorrect"):
+            self.user.change_password("Third#Pass123", current_password = "Wrong#Pass123")
+
+    @override_settings(PASSWORD_HISTORY_KEY = "")
+    def test_dedicated_key_is_required(self):
+        with self.assertRaises(ImproperlyConfigured):
+            self.user.is_in_password_history("First#Pass123")
+
+    def test_missing_key_fails_system_check(self):
+        self.assertEqual(check_secret_keys(None), [])
+        for key in ("", settings.SECRET_KEY):
+            with self.subTest(key = key), override_settings(PASSWORD_HISTORY_KEY = key):
+                self.assertEqual([error.id for error in check_secret_keys(None)], ["app2.E001"])
+
+    def test_hash_upgrade_persists_pruned_fingerprints(self):
+        # A row written by an older scheme: weaker hash, fingerprint of the live password
+        self.user.password = PBKDF2PasswordHasher().encode("Second#Pass123", "legacysalt", iterations = 1000)
+        self.user.password_fingerprints = {**self.user.password_fingerprints,
+                                           self.user.password : PasswordHistoryService.fingerprint("Second#Pass123")}
+        self.user.save()
+
+        # check_password() re-hashes and saves with update_fields = ["password"]
+        self.assertTrue(self.user.check_password("Second#Pass123"))
+
+        self.user.refresh_from_db()
+        self.assertNotIn("legacysalt", self.user.password)
+        self.assertEqual(set(self.user.password_fingerprints), set(self.user.last_passwords))
+        self.assertTrue(self.user.is_in_password_history("Second#Pass123"))
+
+    def test_reuse_detected_without_pbkdf2(self):
+        with patch("app2.services.password_history_service.check_password") as slow_check:
+            self.assertTrue(self.user.is_in_password_history("First#Pass123"))
+            self.assertTrue(self.user.is_in_password_history("Second#Pass123"))
+            self.assertFalse(self.user.is_in_password_history("Third#Pass123"))
+        slow_check.assert_not_called()
+
+    def test_entries_without_fingerprint_fall_back_to_hash_check(self):
+        self.user.password_fingerprints = {}
+        self.assertTrue(self.user.is_in_password_history("First#Pass123"))
+        self.assertFalse(self.user.is_in_password_history("Third#Pass123"))
+
+
+class PasswordHashPoolTests(SimpleTestCase):
+    """Queue slots follow the pool jobs, not the awaiting coroutines"""
+
+    def test_cancelled_login_keeps_its_slot_until_the_job_finishes(self):
+        release = Event()
+        executor = ThreadPoolExecutor(max_workers = 1)
+
+        async def cancel_while_hashing():
+            task = asyncio.create_task(PasswordHashPool.verify("Valid#Pass123", None))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions = True)
+
+        with patch.object(PasswordHashPool, "_get_executor", return_value = executor), \
+             patch("app2.services.hash_pool_service._verify_password", side_effect = lambda *args : release.wait(5)):
+            asyncio.run(cancel_while_hashing())
+            self.assertEqual(PasswordHashPool.info()["pending"], 1)
+
+            release.set()
+            executor.shutdown(wait = True)
+        self.assertEqual(PasswordHashPool.info()["pending"], 0)
+
+
+class CachedBasicAuthenticationTests(TestCase):
+    """Verified Basic-auth credentials skip hashing until the password / lock / activity changes"""
+
+    PASSWORD = "Basic#Pass123"
+
+    def setUp(self):
+        CredentialCache.clear()
+        self.user = AppUser.objects.create_user(employee_id = "EMP0004", password = self.PASSWORD, email = "emp4@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer")
+        self.authenticator = CachedBasicAuthentication()
+
+    def _authenticate(self, password : str):
+        token = b64encode(f"{self.user.employee_id}:{password}".encode("utf-8")).decode("ascii")
+        request = Request(APIRequestFactory().get("/", HTTP_AUTHORIZATION = f"Basic {token}"))
+        return self.authenticator.authenticate(request)
+
+    def test_second_request_skips_password_hashing(self):
+        self._authenticate(self.PASSWORD)
+        with patch("django.contrib.auth.base_user.check_password") as slow_check:
+            user, _ = self._authenticate(self.PASSWORD)
+        slow_check.assert_not_called()
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_password_change_and_deactivation_invalidate(self):
+        self._authenticate(self.PASSWORD)
+        self.user.change_password("Other#Pass123")
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate(self.PASSWORD)
+
+        self._authenticate("Other#Pass123")
+        self.user.is_active = False
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate("Other#Pass123")
+
+
+@override_settings(JWT_TOKEN_USER_MODE = True)
+class TokenUserTests(TestCase):
+    """JWT token user: no row load per request, revoked by token_version bumps"""
+
+    def setUp(self):
+        # Cached token versions outlive the rolled back rows of earlier tests (same pks)
+        cache.clear()
+        self.user = AppUser.objects.create_user(employee_id = "EMP0005", password = "Token#Pass123", email = "emp5@example.com",
+                                                first_name = "Test", last_name = "User", secret_hint = "hint",
+                                                secret_answer = "answer", is_staff = True)
+        refresh = RefreshToken.for_user(self.user)
+        embed_user_claims(refresh, self.user)
+        self.header = f"Bearer {refresh.access_token}"
+
+    def _authenticate(self):
+        request = Request(APIRequestFactory().get("/", HTTP_AUTHORIZATION = self.header))
+        return AppJWTAuthentication().authenticate(request)
+
+    def test_token_user_needs_no_user_row(self):
+        self._authenticate()
+        with CaptureQueriesContext(connection) as context:
+            user, _ = self._authenticate()
+        self.assertEqual(len(context.captured_queries), 0)
+        self.assertEqual(user.employee_id, self.user.employee_id)
+
+        # Anything beyond the claims is loaded on demand
+        self.assertEqual(user.email, "emp5@example.com")
+
+    def test_password_change_revokes_earlier_tokens(self):
+        self._authenticate()
+        self.user.change_password("Other#Pass123")
+        self.user.save()
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_staff_demotion_revokes_earlier_tokens(self):
+        user, _ = self._authenticate()
+        self.assertTrue(user.is_staff)
+
+        demoted = AppUser.objects.get(pk = self.user.pk)
+        demoted.is_staff = False
+        demoted.save(update_fields = ["is_staff"])
+        with self.assertRaises(AuthenticationFailed):
+            self._authenticate()
+
+    def test_only_deactivation_bumps_token_version(self):
+        self.user.is_active = False
+        self.user.save()
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
+
+        # Further saves of the inactive user (admin edits, lockout writes) leave it alone
+        self.user.first_name = "Renamed"
+        self.user.save()
+        AppUser.objects.get(pk = self.user.pk).save(update_fields = ["first_name"])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.token_version, 1)
+
+    @override_settings(JWT_TOKEN_USER_MODE = False)
+    def test_mode_off_embeds_only_the_token_version(self):
+        refresh = RefreshToken.for_user(self.user)
+        embed_user_claims(refresh, self.user)
+        self.assertEqual(refresh["token_version"], self.user.token_version)
+        for claim in ("employee_id", "is_staff", "is_superuser", "is_active"):
+            self.assertNotIn(claim, refresh.payload)
+
+
+class TokenRevocationTests(TestCase):
+    """Bloom-filtered blacklist check still rejects rotated-out refresh tokens"""
+
+    def test_bloom_filter_has_no_false_negatives(self):
+        bloom = BloomFilter(1000)
+        items = [f"jti-{index}" for index in range(1000)]
+        for item in items:
+            bloom.add(item)
+        self.assertTrue(all(item in bloom for item in items))
+
+    def test_rotated_refresh_token_is_rejected(self):
+        user = AppUser.objects.create_user(employee_id = "EMP0006", password = "Rotate#Pass123", email = "emp6@example.com",
+                                           first_name = "Test", last_name = "User", secret_hint = "hint",
+                                           secret_answer = "answer")
+        TokenRevocationService.rebuild()
+        refresh = str(AppRefreshToken.for_user(user))
+
+        first = AppTokenRefreshSerializer(data = {"refresh" : refresh})
+        self.assertTrue(first.is_valid())
+
+        # The presented token was blacklisted by the rotation above
+        replay = AppTokenRefreshSerializer(data = {"refresh" : refresh})
+        with self.assertRaisesMessage(TokenError, "Token is blacklisted"):
+            replay.is_valid(raise_exception = True)
+
+
+def _watch_security_config(ready, results, expected : int, timeout : float) -> None:
+    """Child process: warm the config cache, then poll until auth_retries becomes `expected`"""
+    try:
+        AppConfigService.reset()
+        SecurityConfigManager.get("auth_retries")
+        ready.put(True)
+
+        deadline = time() + timeout
+        while time() < deadline:
+            if SecurityConfigManager.get("auth_retries") == expected:
+                results.put(time())
+                return
+            sleep(0.05)
+        results.put(None)
+    finally:
+        connections.close_all()
+
+
+class SecurityConfigPropagationTests(TransactionTestCase):
+    """GlobalAppConfig saves reach the SecurityConfigManager cache of every process"""
+
+    PROCESSES = 4
+    INTERVAL = 1
+
+    def setUp(self):
+        AppConfigService.reset()
+
+    def tearDown(self):
+        AppConfigService.reset()
+
+    @override_settings(SECURITY_CONFIG_CHECK_INTERVAL = 3600)
+    def test_save_reloads_this_process_immediately(self):
+        self.assertEqual(SecurityConfigManager.get("auth_retries"), 3)
+        GlobalAppConfig.objects.create(category = "security", name = "auth_retries", value = "5")
+        self.assertEqual(SecurityConfigManager.get("auth_retries"), 5)
+
+        # QuerySet.update() skips save() → stale until reload()
+        GlobalAppConfig.objects.filter(name = "auth_retries").update(value = "6")
+        self.assertEqual(SecurityConfigManager.get("auth_retries"), 5)
+        SecurityConfigManager.reload()
+        self.assertEqual(SecurityConfigManager.get("auth_retries"), 6)
+
+    @override_settings(SECURITY_CONFIG_CHECK_INTERVAL = INTERVAL)
+    def test_save_propagates_to_other_processes(self):
+        context = multiprocessing.get_context("fork")
+        ready, results = context.Queue(), context.Queue()
+
+        # Children must open their own connections, not share the parent's socket
+        connections.close_all()
+        children = [context.Process(target = _watch_security_config, args = (ready, results, 7, self.INTERVAL + 10))
+                    for _ in range(self.PROCESSES)]
+        for child in children:
+            child.start()
+        for _ in children:
+            ready.get(timeout = 30)
+
+        GlobalAppConfig.objects.create(category = "security", name = "auth_retries", value = "7")
+        saved_at = time()
+
+        delays = []
+        for _ in children:
+            seen_at = results.get(timeout = self.INTERVAL + 30)
+            self.assertIsNotNone(seen_at, "a worker never saw the new value")
+            delays.append(max(0.0, seen_at - saved_at))
+        for child in children:
+            child.join()
+
+        # Every worker re-reads the version stamp at least once per check interval
+        self.assertLessEqual(max(delays), self.INTERVAL + 1)
+
+
+@override_settings(SECURITY_CONFIG_CHECK_INTERVAL = 3600)
+class PasswordValidatorTests(TestCase):
+    """AppPasswordValidator: cached config, precompiled rules, batch API"""
+
+    def setUp(self):
+        AppConfigService.reset()
+
+    def tearDown(self):
+        AppConfigService.reset()
+
+    def test_new_instances_run_no_queries(self):
+        AppPasswordValidator().validate("Valid#Pass123")
+        with CaptureQueriesContext(connection) as context:
+            for _ in range(10):
+                AppPasswordValidator().validate("Valid#Pass123")
+        self.assertEqual(len(context.captured_queries), 0)
+
+    def test_rules_rebuilt_only_when_config_changes(self):
+        rules = AppPasswordValidator().rules
+        self.assertIs(AppPasswordValidator().rules, rules)
+
+        GlobalAppConfig.objects.create(category = "security", name = "require_special", value = "false")
+        self.assertIsNot(AppPasswordValidator().rules, rules)
+        AppPasswordValidator().validate("NoSpecial123")
+
+    def test_validate_many_matches_validate(self):
+        validator = AppPasswordValidator()
+        passwords = ["Valid#Pass123", "short", "nouppercase#1", "NOLOWERCASE#1", "NoNumber#Here", "NoSpecial123"]
+        results = validator.validate_many(passwords)
+
+        self.assertIsNone(results[0])
+        for password, error in zip(passwords[1 : ], results[1 : ]):
+            self.assertIsInstance(error, ValidationError)
+            with self.assertRaises(ValidationError) as raised:
+                validator.validate(password)
+            self.assertEqual(raised.exception.code, error.code)
+
+        with self.assertRaises(ValueError):
+            validator.validate_many(passwords, users = [None])
+
+
+class BlindIndexTests(TestCase):
+    """Encrypted email / names found through their blind-index columns"""
+
+    def setUp(self):
+        self.user = AppUser.objects.create_user(employee_id = "EMP0007", password = "Valid#Pass123", email = "Jane.Roe@Example.com",
+                                                first_name = "Jane", last_name = "Roe", secret_hint = "hint",
+                                                secret_answer = "answer")
+
+    def test_save_keeps_digests_in_sync(self):
+        self.assertEqual(self.user.email_bidx, BlindIndexService.digest("email", "jane.roe@example.com"))
+        self.assertEqual(self.user.full_name_bidx, BlindIndexService.digest("full_name", "Jane Roe"))
+
+        self.user.last_name = "Doe"
+        self.user.save(update_fields = ["last_name"])
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.last_name_bidx, BlindIndexService.digest("last_name", "Doe"))
+        self.assertEqual(self.user.full_name_bidx, BlindIndexService.digest("full_name", "Jane Doe"))
+
+    def test_partial_save_leaves_other_encrypted_fields_alone(self):
+        user = AppUser.objects.only("id", "employee_id", "is_active", "is_staff", "is_superuser").get(pk = self.user.pk)
+        user.last_login = timezone.now()
+        with patch.object(BlindIndexService, "digest", wraps = BlindIndexService.digest) as digest:
+            user.save(update_fields = ["last_login"])
+
+        # No digests, and the encrypted fields were never loaded / decrypted
+        digest.assert_not_called()
+        self.assertEqual(user.get_deferred_fields() & {"email", "first_name", "last_name"}, {"email", "first_name", "last_name"})
+
+    def test_lookup_by_email_is_one_query(self):
+        with CaptureQueriesContext(connection) as context:
+            found = UserLookupService.find_by_email("  JANE.ROE@example.com ")
+        self.assertEqual(found, self.user)
+        self.assertEqual(len(context.captured_queries), 1)
+        self.assertIsNone(UserLookupService.find_by_email("someone.else@example.com"))
+
+    def test_search_matches_exact_names(self):
+        for term in ("Jane", "Roe", "Jane Roe", "jane.roe@example.com"):
+            with self.subTest(term = term):
+                self.assertTrue(AppUser.objects.filter(UserLookupService.search_q(term)).filter(pk = self.user.pk).exists())
+        self.assertFalse(AppUser.objects.filter(UserLookupService.search_q("Ja")).exists())
+
+    def test_duplicate_email_is_rejected(self):
+        duplicate = AppUser(employee_id = "EMP0008", email = "jane.roe@EXAMPLE.com", first_name = "Other", last_name = "User",
+                            secret_hint = "hint", secret_answer = "answer")
+        with self.assertRaises(ValidationError):
+            duplicate.validate_unique()
+        with self.assertRaises(ValueError):
+            AppUser.objects.create_user(employee_id = "EMP0008", password = "Valid#Pass123", email = "JANE.ROE@example.com",
+                                        first_name = "Other", last_name = "User", secret_hint = "hint", secret_answer = "answer")
+        self.user.validate_unique()
+
+    def test_dedicated_key_is_required(self):
+        for key in ("", settings.SECRET_KEY):
+            with self.subTest(key = key), override_settings(BLIND_INDEX_KEY = key):
+                with self.assertRaises(ImproperlyConfigured):
+                    BlindIndexService.digest("email", "jane.roe@example.com")
+                self.assertEqual([error.id for error in check_secret_keys(None)], ["app2.E002"])
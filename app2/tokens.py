@@ -0,0 +1,25 @@
+# Python base imports - Default ones
+
+# Dependent software imports
+from rest_framework_simplejwt.tokens import RefreshToken
+from rest_framework_simplejwt.exceptions import TokenError
+from rest_framework_simplejwt.settings import api_settings
+
+# Custom created imports
+from app2.services.token_revocation_service import TokenRevocationService
+
+
+class AppRefreshToken(RefreshToken):
+    """
+    RefreshToken whose blacklist check goes through TokenRevocationService
+    (Bloom filter first, DB lookup only for possible hits).
+    """
+
+    def check_blacklist(self) -> None:
+        if TokenRevocationService.is_revoked(self.payload[api_settings.JTI_CLAIM]):
+            raise TokenError("Token is blacklisted")
+
+    def blacklist(self):
+        result = super().blacklist()
+        TokenRevocationService.mark_revoked(self.payload[api_settings.JTI_CLAIM])
+        return result
@@ -2,10 +2,13 @@
 
 # Dependent software imports
 from django.urls import path
+from rest_framework_simplejwt.views import TokenRefreshView
 
 # Custom created imports
-from app2.views import LoginAPIView
+from app2.views import LoginAPIView, async_login_view
 
 urlpatterns = [
     path("api/v1/auth/login/", LoginAPIView.as_view(), name = "login"),
+    path("api/v1/auth/login/async/", async_login_view, name = "login-async"),
+    path("api/v1/auth/token/refresh/", TokenRefreshView.as_view(), name = "token-refresh"),
 ]
\ No newline at end of file
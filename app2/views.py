@@ -1,13 +1,20 @@
 # Python base imports - Default ones
+import json
 
 # Dependent software imports
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 from rest_framework import status
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework.permissions import AllowAny
+from rest_framework.exceptions import APIException, ValidationError
 
 # Custom created imports
 from app2.serializers import LoginSerializer
+from app2.services.auth_service import AuthService
 
 
 class LoginAPIView(APIView):
@@ -68,4 +75,47 @@ class LoginAPIView(APIView):
 
     def get_serializer_class(self):
         """Explicit serializer declaration for API docs"""
-        return LoginSerializer
\ No newline at end of file
+        return LoginSerializer
+
+
+@csrf_exempt
+@require_POST
+async def async_login_view(request):
+    """
+    ⚡ ASYNC LOGIN ENDPOINT (serve demo_app.asgi, e.g. `uvicorn demo_app.asgi:application`)
+    ----------------------
+    
+    POST /app2/api/v1/auth/login/async/ - same JSON request/response as LoginAPIView
+    
+    ✅ WHY:
+    - PBKDF2 runs in PasswordHashPool worker processes, awaited → the event loop keeps
+      serving every other endpoint during a login storm
+    - Bounded queue → 429 + Retry-After instead of an unbounded backlog
+    
+    <b>*RESPONSES*</b>
+    - 200 OK → Login successful + JWT tokens
+    - 400 Bad Request → Validation errors
+    - 401 Unauthorized → Invalid credentials/locked
+    - 429 Too Many Requests → hash pool saturated, retry after the given seconds
+    """
+    try:
+        data = json.loads(request.body or b"{}")
+    except ValueError:
+        return JsonResponse({"detail" : "Malformed JSON body"}, status = status.HTTP_400_BAD_REQUEST)
+
+    try:
+        # Field-level validation only (validate() would run the synchronous login)
+        attrs = LoginSerializer().to_internal_value(data)
+
+        user = await AuthService.alogin(attrs["employee_id"], attrs["password"])
+        payload = await sync_to_async(LoginSerializer.build_login_response)(user)
+    except ValidationError as e:
+        detail = e.detail if isinstance(e.detail, dict) else {"non_field_errors" : e.detail}
+        return JsonResponse(detail, status = status.HTTP_400_BAD_REQUEST)
+    except APIException as e:
+        response = JsonResponse({"detail" : e.detail}, status = e.status_code)
+        if getattr(e, "wait", None):
+            response["Retry-After"] = str(int(e.wait)) # type: ignore
+        return response
+
+    return JsonResponse(payload, status = status.HTTP_200_OK)
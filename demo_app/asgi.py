@@ -5,6 +5,9 @@ It exposes the ASGI callable as a module-level variable named ``application``.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/6.0/howto/deployment/asgi/
+
+Async views (e.g. app2's async login endpoint) only run without a thread hop when served
+from here, e.g. `uvicorn demo_app.asgi:application --workers 4`.
 """
 
 import os
@@ -8,7 +8,7 @@ from dotenv import load_dotenv
 
 # Custom created imports
 from _utils.logging_formatters import JSON_LINE_FORMATTER
-from _utils.logging_handlers import AppFileRoutingHandler
+from _utils.logging_handlers import AppFileRoutingHandler, BoundedQueueHandler, ProcessSafeRotatingFileHandler
 
 # Load environment variables from .env file
 load_dotenv()
@@ -47,7 +47,22 @@ import base64
 new_key = base64.urlsafe_b64encode(os.urandom(32))
 print(new_key)
 """
-FIELD_ENCRYPTION_KEY = environ.get("FIELD_ENCRYPTION_KEY", "")
+# Key rotation: comma-separated list, PRIMARY FIRST - new values are encrypted with the primary key, stored values are
+# decrypted with whichever key matches. After adding a new primary, rewrite old rows with
+# `python manage.py reencrypt_fields`, then drop the old key.
+FIELD_ENCRYPTION_KEY = [key.strip() for key in environ.get("FIELD_ENCRYPTION_KEY", "").split(",") if key.strip()]
+
+# HMAC key for the searchable blind indexes of encrypted AppUser fields (app2.services.blind_index_service).
+# Required: set the BLIND_INDEX_KEY environment variable to a long random value that differs from
+# APPDJANGO_KEY - startup stops with system check app2.E002 otherwise.
+# Changing it requires `python manage.py rebuild_blind_indexes`.
+BLIND_INDEX_KEY = environ.get("BLIND_INDEX_KEY", "")
+
+# HMAC key for the fingerprints of previous passwords (app2.services.password_history_service).
+# Required: set the PASSWORD_HISTORY_KEY environment variable to a long random value that differs from
+# APPDJANGO_KEY - startup stops with system check app2.E001 otherwise.
+# Changing it only makes old fingerprints fall back to PBKDF2.
+PASSWORD_HISTORY_KEY = environ.get("PASSWORD_HISTORY_KEY", "")
 
 SESSION_EXPIRE_AGE = environ.get("FIELD_ENCRYPTION_KEY", "")  # 20 min expiry since last activity
 MAX_USER_SESSIONS = 3  # Allow only 3 concurrent user sessions
@@ -165,8 +180,8 @@ ROOT_URLCONF = "demo_app.urls"
 
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES" : (
-        "rest_framework_simplejwt.authentication.JWTAuthentication", 
-        "rest_framework.authentication.BasicAuthentication", 
+        "app2.authentication.AppJWTAuthentication", 
+        "app2.authentication.CachedBasicAuthentication", 
         "rest_framework.authentication.SessionAuthentication", 
         "oauth2_provider.contrib.rest_framework.OAuth2Authentication" 
     ),
@@ -197,6 +212,13 @@ REST_FRAMEWORK = {
     "PAGE_SIZE": 10,
 }
 
+# Upper bound for the client-selectable ?page_size= of _utils.pagination.KeysetPagination
+API_MAX_PAGE_SIZE = 100
+
+# _utils.pagination.ApproximateCountPagination: results estimated above this many rows report the
+# PostgreSQL planner estimate as "count" (count_is_approximate = true), smaller ones are counted exactly
+APPROXIMATE_COUNT_THRESHOLD = 10000
+
 SPECTACULAR_SETTINGS = {
     "TITLE" : "Django Starter API",
     "DESCRIPTION" : "API for Django Starter as Example",
@@ -252,6 +274,11 @@ AUDITLOG_DISABLE_REMOTE_ADDR = True
 # This setting will be applied only when AUDITLOG_INCLUDE_ALL_MODELS is True.
 AUDITLOG_MASK_TRACKING_FIELDS = ("created_date", "api_key")
 
+# AUDITLOG_EXCLUDE_TRACKING_MODELS
+# Models skipped even though AUDITLOG_INCLUDE_ALL_MODELS is True. Highlight artifacts are derived
+# data (a pure function of the snippet content), auditing them would only duplicate the HTML.
+AUDITLOG_EXCLUDE_TRACKING_MODELS = ("app1.highlightartifact", )
+
 # ========================================================== DJANGO CORE SECTION ===============================================================
 
 # ========================================================== DATABASE SECTION ==================================================================
@@ -290,9 +317,26 @@ SIMPLE_JWT = {
     "ACCESS_TOKEN_LIFETIME" : timedelta(minutes = 10), 
     "REFRESH_TOKEN_LIFETIME" : timedelta(days = 7), 
     "ROTATE_REFRESH_TOKENS" : True, 
-    "BLACKLIST_AFTER_ROTATION" : True
+    "BLACKLIST_AFTER_ROTATION" : True, 
+    "TOKEN_REFRESH_SERIALIZER" : "app2.serializers.AppTokenRefreshSerializer"
 }
 
+# Refresh-token revocation check (app2.services.token_revocation_service): in-process Bloom filter of blacklisted jtis in
+# front of the blacklist table. Rebuilt every REBUILD_INTERVAL seconds, synced with other processes every SYNC_INTERVAL
+# seconds (a token blacklisted elsewhere is accepted here for at most that long). Purge expired rows with
+# `manage.py purge_token_blacklist` (cron).
+JWT_REVOCATION_BLOOM = True
+JWT_REVOCATION_SYNC_INTERVAL = 5
+JWT_REVOCATION_REBUILD_INTERVAL = 3600
+JWT_REVOCATION_BLOOM_CAPACITY = 100000
+
+# Opt-in: build request.user from the JWT claims (app2.authentication.AppJWTAuthentication) instead of loading and
+# decrypting the AppUser row on every request. Other fields load lazily on first access. Revocation goes through the
+# per-user token_version, cached for JWT_TOKEN_VERSION_CACHE_TTL seconds in the JWT_TOKEN_VERSION_CACHE alias.
+JWT_TOKEN_USER_MODE = False
+JWT_TOKEN_VERSION_CACHE = "default"
+JWT_TOKEN_VERSION_CACHE_TTL = 30
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         "NAME": "django.contrib.auth.password_validation.UserAttributeSimilarityValidator",
@@ -313,8 +357,66 @@ AUTH_PASSWORD_VALIDATORS = [
 
 AUTH_USER_MODEL = "app2.AppUser"
 
+# Successful logins skip rewriting last_login when it was stored less than this many seconds ago
+# (0 = write it on every login). Failed-attempt counters are always reset immediately.
+AUTH_LAST_LOGIN_RESOLUTION = 60
+
+# Failed-login lockout (app2.services.lockout_service.LockoutService), periods in seconds, 0 = disabled.
+# WINDOW: failures are counted within this long of the first failure, the next one after that starts a new count.
+# DURATION: locked accounts unlock automatically this long after the last failure.
+# STORE: where counters live - DatabaseCounterStore (app_users row) or CacheCounterStore (AUTH_LOCKOUT_CACHE alias,
+#        use a shared cache such as Redis when running several workers).
+AUTH_LOCKOUT_WINDOW = 15 * 60
+AUTH_LOCKOUT_DURATION = 15 * 60
+AUTH_LOCKOUT_STORE = "app2.services.lockout_service.DatabaseCounterStore"
+
+# Async login endpoint (app2 async_login_view): PBKDF2 verification runs in a process pool of AUTH_HASH_WORKERS
+# processes; more than AUTH_HASH_QUEUE_LIMIT verifications in flight per server process → 429 (Retry-After seconds below).
+AUTH_HASH_WORKERS = 2
+AUTH_HASH_QUEUE_LIMIT = 16
+AUTH_HASH_RETRY_AFTER = 1
+
+# CachedBasicAuthentication: verified employee_id/password pairs are trusted for this many seconds without
+# re-hashing (0 = no caching), at most BASIC_AUTH_CACHE_SIZE pairs per process. Keys are HMACs, never plaintext.
+BASIC_AUTH_CACHE_TTL = 60
+BASIC_AUTH_CACHE_SIZE = 1024
+
+# app2.config.SecurityConfigManager: each process re-reads the shared GlobalAppConfig version stamp at most this often
+# (seconds) and reloads its cached security configs when the stamp changed - i.e. an admin edit is live everywhere
+# within this delay. 0 = check on every access.
+SECURITY_CONFIG_CHECK_INTERVAL = 5
+
 # ========================================================== AUTHENTICATION SECTION ============================================================
 
+# ========================================================== SNIPPET HIGHLIGHT SECTION =========================================================
+
+# Render pygments output for app1.Snippet in a background thread pool instead of inside save().
+# Set SNIPPET_HIGHLIGHT_ASYNC = False to render inline (management commands, debugging).
+SNIPPET_HIGHLIGHT_ASYNC = True
+SNIPPET_HIGHLIGHT_WORKERS = 2
+
+# "fragment" → rows store only the highlighted body, CSS served once per style at app1/snippets/styles/<style>.css
+# "full"     → rows store a complete HTML document with the style's CSS inlined (legacy behaviour)
+# Existing rows can be converted with: python manage.py rewrite_snippet_highlights --measure
+SNIPPET_HIGHLIGHT_MODE = "fragment"
+
+# Max (language, style, linenos, title-present, mode) combinations whose lexer + formatter stay cached (LRU)
+SNIPPET_HIGHLIGHT_CACHE_SIZE = 128
+
+# POST app1 snippets/bulk-import/ - rows per bulk_create (clients may lower/raise it up to the max via ?chunk_size=)
+SNIPPET_BULK_IMPORT_CHUNK_SIZE = 500
+SNIPPET_BULK_IMPORT_MAX_CHUNK_SIZE = 5000
+
+# Bulk imports render highlights in a process pool once a chunk has this many unique snippets to render
+SNIPPET_BULK_RENDER_PROCESSES = 2
+SNIPPET_BULK_RENDER_MIN_PARALLEL = 32
+
+# Start method of worker process pools (bulk render, password hashing) - "forkserver" or "spawn", never "fork":
+# forking would copy the live server process (event loop, threads, DB connections) into every worker
+PROCESS_POOL_START_METHOD = "forkserver"
+
+# ========================================================== SNIPPET HIGHLIGHT SECTION =========================================================
+
 # ========================================================== LOGGING SECTION ===================================================================
 
 # ------------------------------------------------------------
@@ -334,6 +436,25 @@ AUTH_USER_MODEL = "app2.AppUser"
 LOG_DIR = BASE_DIR / "logs"
 LOG_DIR.mkdir(exist_ok = True)
 
+# ------------------------------------------------------------
+# Queue-based Logging
+# ------------------------------------------------------------
+# Opt-in: LOG_QUEUE_ENABLED=true (environment) → request threads only
+# enqueue records; a listener thread per process writes them through
+# central_file, app_router and console (see BoundedQueueHandler).
+#
+# LOG_QUEUE_SIZE          → max records waiting in memory
+# LOG_QUEUE_POLICY        → "drop" (never wait) / "block" (wait up to
+#                            LOG_QUEUE_BLOCK_TIMEOUT seconds, then drop)
+# Both policies can lose records when the queue is full - they are
+# counted and reported as one WARNING line. "block" with
+# LOG_QUEUE_BLOCK_TIMEOUT = None never drops (callers wait instead).
+# ------------------------------------------------------------
+LOG_QUEUE_ENABLED = environ.get("LOG_QUEUE_ENABLED", "false").lower() == "true"
+LOG_QUEUE_SIZE = 10000
+LOG_QUEUE_POLICY = "drop"
+LOG_QUEUE_BLOCK_TIMEOUT = 0.05
+
 # ------------------------------------------------------------
 # Django Logging Configuration (dictConfig style)
 # ------------------------------------------------------------
@@ -409,8 +530,10 @@ LOGGING = {
         # - Keeps last 5 backups
         #
         # This acts as the master log file for the entire system.
+        # Process-safe: all server workers share the file and its
+        # rotation through a lock file (central_log.jsonl.lock).
         "central_file": {
-            "class": "logging.handlers.RotatingFileHandler",
+            "()": ProcessSafeRotatingFileHandler,
             "filename": path.join(LOG_DIR, "central_log.jsonl"),
             "maxBytes": 5 * 1024 * 1024,
             "backupCount": 5,
@@ -435,6 +558,19 @@ LOGGING = {
             "base_log_dir": LOG_DIR,
             "formatter": "jsonl",
         },
+
+        # Queue handler (used when LOG_QUEUE_ENABLED)
+        #
+        # Enqueues records only - a background listener thread hands
+        # them to the three handlers above. Handlers are built in name
+        # order: "queue" must sort after its targets.
+        "queue": {
+            "()": BoundedQueueHandler,
+            "targets": ["central_file", "app_router", "console"],
+            "queue_size": LOG_QUEUE_SIZE,
+            "policy": LOG_QUEUE_POLICY,
+            "block_timeout": LOG_QUEUE_BLOCK_TIMEOUT,
+        },
     },
 
     # --------------------------------------------------------
@@ -449,10 +585,11 @@ LOGGING = {
     # - Every log goes to central_file
     # - Every log goes through app_router
     # - Every log appears in console
+    # (directly, or through the queue listener when LOG_QUEUE_ENABLED)
     # --------------------------------------------------------
     "loggers": {
         "": {
-            "handlers": ["central_file", "app_router", "console"],
+            "handlers": ["queue"] if LOG_QUEUE_ENABLED else ["central_file", "app_router", "console"],
             "level": "DEBUG",
         },
     },
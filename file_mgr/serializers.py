@@ -5,9 +5,10 @@ from rest_framework import serializers
 
 # Custom created imports
 from file_mgr.models import UploadFile
+from _utils.sparse_fieldsets import SparseFieldsetSerializerMixin
 
 
-class UploadFileDetailSerializer(serializers.ModelSerializer):
+class UploadFileDetailSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     """
     DRF ModelSerializer for UploadFile model - used for API responses (list, retrieve, create).
     Converts model instances to JSON and handles validation for API endpoints.
@@ -16,6 +17,7 @@ class UploadFileDetailSerializer(serializers.ModelSerializer):
     - Serializes all essential UploadFile fields for API responses
     - Adds computed `download_url` field for direct file access
     - Handles both single file and multiple file responses uniformly
+    - Honours ?fields= / ?exclude= sparse fieldsets (see UploadFileViewSet)
     """
     
     # Custom computed field - generates full download URL for uploaded files
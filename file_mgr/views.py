@@ -11,8 +11,11 @@ from rest_framework.parsers import MultiPartParser, FormParser
 # Custom created imports
 from file_mgr.models import UploadFile
 from file_mgr.serializers import UploadFileDetailSerializer
+from _utils.pagination import ApproximateCountPagination
+from _utils.streaming_export import StreamingExportMixin
+from _utils.sparse_fieldsets import SparseFieldsetViewMixin
 
-class UploadFileViewSet(viewsets.ModelViewSet):
+class UploadFileViewSet(SparseFieldsetViewMixin, StreamingExportMixin, viewsets.ModelViewSet):
     """
     Complete CRUD API for UploadFile model with file upload support.
     
@@ -22,12 +25,15 @@ class UploadFileViewSet(viewsets.ModelViewSet):
     - GET  /api/uploads/{id}/     → Single file details
     - GET  /api/uploads/{id}/download/ → Download URL
     - DELETE /api/uploads/{id}/   → Delete file + storage cleanup
+    - GET  /api/uploads/export/   → Streamed NDJSON / CSV export of file records
     
     Features:
     - Single parser handles both single & multiple file uploads
     - Unified response format (always "files" array)
     - Automatic file storage via upload_to
     - Proper cleanup on delete
+    - Sparse fieldsets on list/retrieve: ?fields=id,file_name or ?exclude=extracted_files_info,file_metadata
+      (dropped JSON columns are deferred, not fetched)
     """
 
     # Global settings for ALL actions
@@ -38,6 +44,9 @@ class UploadFileViewSet(viewsets.ModelViewSet):
     # Parse multipart/form-data uploads
     parser_classes = [MultiPartParser, FormParser]
 
+    # Page-number pages, "count" estimated by PostgreSQL for large results (count_is_approximate flag)
+    pagination_class = ApproximateCountPagination
+
     # Default serializer for all actions
     serializer_class = UploadFileDetailSerializer
 
@@ -47,6 +56,13 @@ class UploadFileViewSet(viewsets.ModelViewSet):
     # Django-filter fields (if using django-filter)
     filterset_fields = ["created_by"]
 
+    # download_url is computed from file_object - keep that column whenever it is requested
+    sparse_field_dependencies = {"download_url" : ("file_object",)}
+
+    # Columns streamed by GET /api/uploads/export/ (see StreamingExportMixin)
+    export_fields = ("id", "file_name", "mime_type", "file_path", "extracted_files_info", "file_metadata", 
+                     "created_by", "created_date")
+
     def get_serializer_context(self):
         """
         Ensure request context is passed to ALL serializers.